@@ -0,0 +1,97 @@
+"""
+Benchmark API cold start: import time and time to first request
+
+Starts uvicorn in a fresh process and measures how long it takes until
+/health answers, and separately how long a bare import of the API module
+takes. Startup runs init_db, so DATABASE_URL must point at a reachable
+PostgreSQL database. Pass --max-ms to fail when the median time to first
+request regresses past a budget.
+
+Run with: python benchmarks/bench_cold_start.py --runs 5 --max-ms 3000
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_import() -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "import connector_platform.api.main"],
+        check=True
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def time_first_request(timeout: float) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "connector_platform.api.main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"
+        ],
+        stdout=subprocess.DEVNULL
+    )
+
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+
+        raise RuntimeError(f"No response from {url} within {timeout}s")
+
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run(runs: int, timeout: float, max_ms: float = None) -> bool:
+    if "DATABASE_URL" not in os.environ:
+        print("DATABASE_URL is required")
+        return False
+
+    imports = [time_import() for _ in range(runs)]
+    first_requests = [time_first_request(timeout) for _ in range(runs)]
+
+    import_ms = statistics.median(imports)
+    first_request_ms = statistics.median(first_requests)
+
+    print(f"Import (median of {runs}):            {import_ms:8.1f} ms")
+    print(f"Time to first request (median of {runs}): {first_request_ms:8.1f} ms")
+
+    if max_ms is not None and first_request_ms > max_ms:
+        print(f"Regression: time to first request exceeds budget of {max_ms:.0f} ms")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    sys.exit(0 if run(args.runs, args.timeout, args.max_ms) else 1)
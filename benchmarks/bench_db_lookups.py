@@ -0,0 +1,102 @@
+"""
+Benchmark hot-path lookups on oauth_tokens and connections at scale
+
+Requires a PostgreSQL database in DATABASE_URL. All data is written to a
+scratch schema that is dropped afterwards.
+
+Run with: python benchmarks/bench_db_lookups.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine, text
+
+from connector_platform.database import Base
+
+INDEXES = [
+    "ux_oauth_tokens_connection_id",
+    "ix_connections_user_id_connector_type_created_at_id",
+]
+
+
+def timed(connection, statement, params_list):
+    samples = []
+    for params in params_list:
+        started = time.perf_counter()
+        connection.execute(statement, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "max_ms": samples[-1]
+    }
+
+
+def run(rows: int, samples: int, users: int):
+    schema = f"bench_{os.getpid()}"
+    engine = create_engine(os.environ["DATABASE_URL"])
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+
+        try:
+            translated = connection.execution_options(schema_translate_map={None: schema})
+            Base.metadata.create_all(translated)
+            connection.execute(text(f"SET search_path TO {schema}"))
+
+            print(f"Loading {rows:,} connections and tokens...")
+            started = time.perf_counter()
+            connection.execute(text(
+                "INSERT INTO connections (id, connector_type, name, user_id, status, config, created_at, updated_at) "
+                "SELECT 'conn-' || g, (ARRAY['gmail','onedrive','dropbox'])[1 + g % 3], 'bench', "
+                "'user-' || (g % :users), 'active', '{}', now(), now() "
+                "FROM generate_series(1, :rows) g"
+            ), {"rows": rows, "users": users})
+            connection.execute(text(
+                "INSERT INTO oauth_tokens (id, connection_id, access_token, refresh_token, token_type, expires_at, created_at, updated_at) "
+                "SELECT 'tok-' || g, 'conn-' || g, md5(g::text), md5((g + 1)::text), 'Bearer', "
+                "now() + (g % 3600) * interval '1 second', now(), now() "
+                "FROM generate_series(1, :rows) g"
+            ), {"rows": rows})
+            connection.execute(text("ANALYZE"))
+            print(f"Loaded in {time.perf_counter() - started:.1f}s\n")
+
+            token_lookup = text("SELECT * FROM oauth_tokens WHERE connection_id = :id")
+            list_lookup = text(
+                "SELECT id, connector_type, name, status, created_at FROM connections "
+                "WHERE user_id = :user AND connector_type = 'gmail' "
+                "ORDER BY created_at, id LIMIT 100"
+            )
+            token_params = [{"id": f"conn-{random.randint(1, rows)}"} for _ in range(samples)]
+            list_params = [{"user": f"user-{random.randint(0, users - 1)}"} for _ in range(samples)]
+
+            print("With indexes:")
+            print(f"  token by connection_id: {timed(connection, token_lookup, token_params)}")
+            print(f"  connections by user:    {timed(connection, list_lookup, list_params)}")
+
+            for index in INDEXES:
+                connection.execute(text(f"DROP INDEX {index}"))
+
+            few = max(5, samples // 50)
+            print("\nWithout indexes:")
+            print(f"  token by connection_id: {timed(connection, token_lookup, token_params[:few])}")
+            print(f"  connections by user:    {timed(connection, list_lookup, list_params[:few])}")
+
+        finally:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=10_000)
+    args = parser.parse_args()
+
+    run(args.rows, args.samples, args.users)
@@ -0,0 +1,85 @@
+"""
+Benchmark connector registry startup with a large YAML catalog
+
+Generates a synthetic catalog by cloning the bundled connector YAMLs under
+new names, then times a registry load with the pure-Python YAML loader, with
+the C loader, and from a warm config snapshot cache.
+
+Run with: python benchmarks/bench_registry_startup.py --connectors 500
+"""
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, '.')
+
+import yaml
+
+from connector_platform.core import config_cache
+from connector_platform.core.config_cache import ConfigSnapshotCache
+from connector_platform.core.connector_registry import ConnectorRegistry, DEFAULT_CONFIG_DIR
+
+
+def build_catalog(target: Path, count: int):
+    sources = sorted(DEFAULT_CONFIG_DIR.glob("*.yaml"))
+    for index in range(count):
+        source = sources[index % len(sources)]
+        config = yaml.safe_load(source.read_text())
+        config["name"] = f"{config['name']}_{index}"
+        (target / f"{config['name']}.yaml").write_text(yaml.safe_dump(config, sort_keys=False))
+
+
+def time_load(config_dir: Path, repeats: int, cache_path=None, loader=None) -> float:
+    original_loader = config_cache.yaml_loader()
+    if loader is not None:
+        config_cache._yaml_loader = loader
+
+    samples = []
+    try:
+        for _ in range(repeats):
+            cache = ConfigSnapshotCache(cache_path) if cache_path else None
+            registry = ConnectorRegistry(config_dir, config_cache=cache)
+            started = time.perf_counter()
+            registry.load_connector_configs()
+            samples.append((time.perf_counter() - started) * 1000)
+    finally:
+        config_cache._yaml_loader = original_loader
+
+    return statistics.median(samples)
+
+
+def run(count: int, repeats: int):
+    workdir = Path(tempfile.mkdtemp())
+    config_dir = workdir / "connectors"
+    config_dir.mkdir()
+
+    try:
+        build_catalog(config_dir, count)
+        print(f"Catalog: {count} connectors")
+
+        print(f"  SafeLoader, no cache:   {time_load(config_dir, repeats, loader=yaml.SafeLoader):8.1f} ms")
+
+        if hasattr(yaml, "CSafeLoader"):
+            print(f"  CSafeLoader, no cache:  {time_load(config_dir, repeats, loader=yaml.CSafeLoader):8.1f} ms")
+        else:
+            print("  CSafeLoader unavailable (PyYAML built without libyaml)")
+
+        cache_path = workdir / "config.cache"
+        time_load(config_dir, 1, cache_path=cache_path)
+        print(f"  Warm snapshot cache:    {time_load(config_dir, repeats, cache_path=cache_path):8.1f} ms")
+        print(f"  Cache file size:        {cache_path.stat().st_size / 1024:8.1f} KiB")
+
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.connectors, args.repeats)
@@ -0,0 +1,81 @@
+"""
+Benchmark peak memory of whole-page versus streamed transformation
+
+Serializes a synthetic OneDrive list_files page, then measures the peak
+Python heap (tracemalloc) and time of parsing and transforming it the way
+execute_request does (json.loads, then the compiled transform) against
+streaming it through JsonItemStream and the endpoint's StreamingTransform,
+discarding each record as a response stream or publisher would.
+
+Run with: python benchmarks/bench_streaming.py --items 100000
+"""
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, '.')
+
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.streaming import JsonItemStream
+
+
+def build_body(count: int) -> bytes:
+    return json.dumps({
+        "value": [
+            {
+                "id": f"item-{index}",
+                "name": f"file-{index}.pdf",
+                "size": 1024 * index,
+                "createdDateTime": "2025-01-01T12:00:00Z",
+                "lastModifiedDateTime": "2025-01-15T10:30:00Z",
+                "file": {"mimeType": "application/pdf"},
+                "parentReference": {"id": "parent-id", "path": "/drive/root:/Documents"},
+                "createdBy": {"user": {"displayName": "Ada"}},
+                "webUrl": f"https://onedrive.live.com/{index}"
+            }
+            for index in range(count)
+        ],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/next"
+    }).encode("utf-8")
+
+
+def measure(function):
+    tracemalloc.start()
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(items: int):
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    endpoint = registry.get_endpoint_spec("onedrive", "list_files")
+
+    body = build_body(items)
+    print(f"OneDrive list_files page: {items} items, {len(body) / 2**20:.1f} MiB body")
+
+    def whole_page():
+        endpoint.transform(json.loads(body))
+
+    def streamed():
+        stream = JsonItemStream(io.BytesIO(body), endpoint.stream.items_path)
+        for _ in endpoint.stream.records(stream):
+            pass
+        endpoint.stream.summary(stream.remainder, stream.count)
+
+    for label, function in (("Whole page", whole_page), ("Streamed", streamed)):
+        elapsed, peak = measure(function)
+        print(f"  {label:11s} {elapsed * 1000:9.1f} ms  peak heap {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+
+    run(args.items)
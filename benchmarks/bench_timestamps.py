@@ -0,0 +1,101 @@
+"""
+Benchmark timestamp parsing over realistic provider timestamps
+
+Generates ISO-8601 timestamps as OneDrive and Dropbox send them and RFC 2822
+Date headers as Gmail sends them, drawn from a pool of distinct values so
+they repeat the way bulk-synced folders and message batches do. Compares the
+transformers' previous per-call parsing with the shared timestamps module,
+with and without its memo cache, and with timestamps kept raw.
+
+Run with: python benchmarks/bench_timestamps.py --count 1000000 --distinct 20000
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+sys.path.insert(0, '.')
+
+from connector_platform.core import timestamps
+
+
+def build_values(count: int, distinct: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    moments = [start + timedelta(seconds=rng.randrange(365 * 86400)) for _ in range(distinct)]
+
+    iso_pool = [moment.strftime("%Y-%m-%dT%H:%M:%SZ") for moment in moments]
+    rfc_pool = [
+        format_datetime(moment.astimezone(timezone(timedelta(hours=rng.choice((-8, -5, 0, 1, 5.5))))))
+        for moment in moments
+    ]
+
+    iso_values = [rng.choice(iso_pool) for _ in range(count)]
+    rfc_values = [rng.choice(rfc_pool) for _ in range(count)]
+    return iso_values, rfc_values
+
+
+def previous_iso(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
+def previous_rfc2822(value):
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def time_parser(parser, values) -> float:
+    started = time.perf_counter()
+    for value in values:
+        parser(value)
+    return (time.perf_counter() - started) * 1000
+
+
+def run(count: int, distinct: int):
+    iso_values, rfc_values = build_values(count, distinct)
+    print(f"{count} timestamps per format, {distinct} distinct values")
+
+    rows = [
+        ("ISO-8601", [
+            ("previous (replace + fromisoformat)", previous_iso),
+            ("shared -> datetime", timestamps.parse_iso),
+            ("previous, then isoformat()", lambda value: previous_iso(value).isoformat()),
+            ("shared, memoized -> ISO string", timestamps.iso_timestamp),
+            ("kept raw", timestamps.keep_raw),
+        ], iso_values),
+        ("RFC 2822", [
+            ("previous (parsedate_to_datetime)", previous_rfc2822),
+            ("shared, uncached (fast path)", timestamps._parse_rfc2822),
+            ("shared, memoized -> datetime", timestamps.parse_rfc2822),
+            ("shared, memoized -> ISO string", timestamps.rfc2822_timestamp),
+            ("kept raw", timestamps.keep_raw),
+        ], rfc_values),
+    ]
+
+    for title, parsers, values in rows:
+        print(f"  {title}")
+        baseline = None
+        for label, parser in parsers:
+            timestamps.clear_caches()
+            elapsed = time_parser(parser, values)
+            baseline = baseline or elapsed
+            print(f"    {label:36s} {elapsed:9.1f} ms  ({baseline / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--distinct", type=int, default=20000)
+    args = parser.parse_args()
+
+    run(args.count, args.distinct)
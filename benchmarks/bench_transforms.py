@@ -0,0 +1,100 @@
+"""
+Benchmark YAML-compiled transforms against the hand-written transformers
+
+Builds synthetic OneDrive list and Gmail message responses and times each
+endpoint through TransformerFactory and through the transform compiled from
+the connector's YAML mapping.
+
+Run with: python benchmarks/bench_transforms.py --items 1000
+"""
+import argparse
+import statistics
+import sys
+import time
+sys.path.insert(0, '.')
+
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.transformers import TransformerFactory
+
+
+def onedrive_list(count: int):
+    return {
+        "value": [
+            {
+                "id": f"item-{index}",
+                "name": f"file-{index}.pdf",
+                "size": 1024 * index,
+                "createdDateTime": "2025-01-01T12:00:00Z",
+                "lastModifiedDateTime": "2025-01-15T10:30:00Z",
+                "file": {"mimeType": "application/pdf"},
+                "parentReference": {"id": "parent-id", "path": "/drive/root:/Documents"},
+                "createdBy": {"user": {"displayName": "Ada"}},
+                "lastModifiedBy": {"user": {"displayName": "Grace"}},
+                "webUrl": f"https://onedrive.live.com/{index}"
+            }
+            for index in range(count)
+        ],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/next"
+    }
+
+
+def gmail_message(index: int):
+    return {
+        "id": f"msg-{index}",
+        "threadId": f"thread-{index}",
+        "labelIds": ["INBOX", "UNREAD"],
+        "snippet": "Quarterly numbers attached",
+        "historyId": "12345",
+        "internalDate": "1736762400000",
+        "payload": {"headers": [
+            {"name": "Subject", "value": "Q4 report"},
+            {"name": "From", "value": "a@example.com"},
+            {"name": "To", "value": "b@example.com"},
+            {"name": "Date", "value": "Mon, 13 Jan 2025 10:00:00 +0000"}
+        ]}
+    }
+
+
+def time_calls(function, payloads, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for payload in payloads:
+            function(payload)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(items: int, repeats: int):
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+
+    cases = [
+        ("onedrive", "list_files", [onedrive_list(items)]),
+        ("gmail", "get_message", [gmail_message(index) for index in range(items)]),
+    ]
+
+    for connector_name, endpoint_name, payloads in cases:
+        spec = registry.get_connector_spec(connector_name)
+        transformer = TransformerFactory.get_transformer(spec.type)
+        compiled = registry.get_endpoint_spec(connector_name, endpoint_name).transform
+
+        hand_written = time_calls(
+            lambda data: transformer.transform(data, endpoint_name, connector_name),
+            payloads,
+            repeats
+        )
+        generated = time_calls(compiled, payloads, repeats)
+
+        print(f"{connector_name}.{endpoint_name} ({items} items)")
+        print(f"  Hand-written transformer: {hand_written:8.2f} ms")
+        print(f"  Compiled YAML transform:  {generated:8.2f} ms  ({hand_written / generated:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.items, args.repeats)
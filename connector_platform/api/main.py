@@ -1,26 +1,73 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from pydantic import BaseModel
+from datetime import datetime, timedelta
+import json
 import os
-
-from connector_platform.database import init_db, get_db
-from connector_platform.core.oauth_manager import OAuthManager
-from connector_platform.core.connection_manager import ConnectionManager
-from connector_platform.core.api_proxy import APIProxy
+import threading
+import logging
+
+from connector_platform.database import (
+    ConnectionUsage,
+    init_db,
+    get_db,
+    get_async_db,
+    dispose_async_engine,
+    get_engine,
+    SessionLocal,
+    ReadSessionLocal
+)
+from connector_platform.core.oauth_manager import OAuthManager, default_token_clients
+from connector_platform.core.connection_manager import (
+    ConnectionManager,
+    default_token_cache,
+    default_connection_cache
+)
+from connector_platform.core.async_connection_manager import AsyncConnectionManager
+from connector_platform.core.api_proxy import APIProxy, proxy_metrics
+from connector_platform.core.token_refresh import default_refresh_flight
+from connector_platform.core.token_scheduler import ProactiveTokenRefresher
+from connector_platform.core.invalidation import invalidation_bus
+from connector_platform.core.read_routing import ReadRouter
+from connector_platform.core.usage_stats import UsageAggregator
+from connector_platform.core.audit_log import AuditLogSink
 from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.param_validation import ParameterError
+from connector_platform.core.config_cache import ConfigSnapshotCache, DEFAULT_CACHE_PATH
+from connector_platform.core.config_watcher import ConfigWatcher
+from connector_platform.core.registry_store import ConnectorMetadataSync, publish_connectors
 from connector_platform.core.kafka_publisher import KafkaPublisher, MockKafkaPublisher
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Connector Platform API", version="1.0.0")
 
 kafka_enabled = os.getenv("KAFKA_ENABLED", "false").lower() == "true"
 kafka_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
 
-if kafka_enabled:
-    kafka_publisher = KafkaPublisher(bootstrap_servers=kafka_servers, enabled=True)
-else:
-    kafka_publisher = MockKafkaPublisher()
+_kafka_publisher = None
+_kafka_publisher_lock = threading.Lock()
+
+
+def get_kafka_publisher():
+    """Build the publisher on first use; connecting a KafkaProducer blocks on the brokers"""
+    global _kafka_publisher
+    
+    if _kafka_publisher is None:
+        with _kafka_publisher_lock:
+            if _kafka_publisher is None:
+                if kafka_enabled:
+                    _kafka_publisher = KafkaPublisher(bootstrap_servers=kafka_servers, enabled=True)
+                else:
+                    _kafka_publisher = MockKafkaPublisher()
+    
+    return _kafka_publisher
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,15 +75,154 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
+)
+
+CONNECTIONS_PAGE_SIZE = int(os.getenv("CONNECTIONS_PAGE_SIZE", "100"))
+CONNECTIONS_MAX_PAGE_SIZE = int(os.getenv("CONNECTIONS_MAX_PAGE_SIZE", "1000"))
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "10000"))
+
+connector_config_cache_enabled = os.getenv("CONNECTOR_CONFIG_CACHE_ENABLED", "true").lower() == "true"
+registry = ConnectorRegistry(
+    config_cache=ConfigSnapshotCache(
+        os.getenv("CONNECTOR_CONFIG_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+    ) if connector_config_cache_enabled else None
+)
+
+# "files": load connector YAMLs from disk; "database": follow configs published to connector_metadata
+registry_source = os.getenv("REGISTRY_SOURCE", "files").lower()
+registry_publish_enabled = os.getenv("REGISTRY_PUBLISH_ENABLED", "false").lower() == "true"
+
+
+def publish_registry():
+    db = SessionLocal()
+    try:
+        publish_connectors(db, registry.snapshot.specs.values())
+    finally:
+        db.close()
+
+
+connector_config_watch_enabled = os.getenv("CONNECTOR_CONFIG_WATCH_ENABLED", "true").lower() == "true"
+config_watcher = ConfigWatcher(
+    registry,
+    poll_interval_seconds=float(os.getenv("CONNECTOR_CONFIG_POLL_INTERVAL_SECONDS", "5")),
+    rescan_interval_seconds=float(os.getenv("CONNECTOR_CONFIG_RESCAN_INTERVAL_SECONDS", "60")),
+    on_reload=publish_registry if registry_publish_enabled else None
+)
+
+metadata_sync = ConnectorMetadataSync(
+    registry,
+    session_factory=SessionLocal,
+    poll_interval_seconds=float(os.getenv("REGISTRY_POLL_INTERVAL_SECONDS", "30"))
+)
+
+invalidation_bus_enabled = os.getenv("INVALIDATION_BUS_ENABLED", "true").lower() == "true"
+
+invalidation_bus.subscribe("token", default_token_cache.invalidate, on_reset=default_token_cache.clear)
+invalidation_bus.subscribe("connector", metadata_sync.notify, on_reset=metadata_sync.notify)
+invalidation_bus.subscribe(
+    "connection",
+    default_connection_cache.invalidate,
+    on_reset=default_connection_cache.clear
+)
+
+read_router = ReadRouter(
+    primary_session_factory=SessionLocal,
+    replica_session_factory=ReadSessionLocal,
+    read_your_writes_seconds=float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
 )
 
-registry = ConnectorRegistry()
-registry.load_connector_configs()
+invalidation_bus.watch("connection", lambda key: read_router.mark_written(f"connection:{key}"))
+invalidation_bus.watch("user", lambda key: read_router.mark_written(f"user:{key}"))
+
+
+def get_read_db_for_connection(connection_id: str):
+    db = read_router.session_for(f"connection:{connection_id}")
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db_for_user(user_id: str):
+    db = read_router.session_for(f"user:{user_id}")
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+usage_aggregator = UsageAggregator(
+    session_factory=SessionLocal,
+    flush_interval_seconds=float(os.getenv("USAGE_FLUSH_INTERVAL_SECONDS", "10"))
+)
+
+audit_log_enabled = os.getenv("AUDIT_LOG_ENABLED", "true").lower() == "true"
+
+audit_sink = AuditLogSink(
+    flush_interval_seconds=float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL_SECONDS", "5")),
+    batch_size=int(os.getenv("AUDIT_LOG_BATCH_SIZE", "5000")),
+    max_buffered=int(os.getenv("AUDIT_LOG_MAX_BUFFERED", "100000")),
+    retention_days=int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "30"))
+)
+
+token_refresher_enabled = os.getenv("TOKEN_REFRESHER_ENABLED", "true").lower() == "true"
+
+token_refresher = ProactiveTokenRefresher(
+    session_factory=SessionLocal,
+    registry=registry,
+    skew_seconds=float(os.getenv("TOKEN_REFRESH_SKEW_SECONDS", "300")),
+    interval_seconds=float(os.getenv("TOKEN_REFRESH_INTERVAL_SECONDS", "60")),
+    jitter_seconds=float(os.getenv("TOKEN_REFRESH_JITTER_SECONDS", "30")),
+    max_concurrency_per_provider=int(os.getenv("TOKEN_REFRESH_CONCURRENCY_PER_PROVIDER", "4")),
+    failure_backoff_seconds=float(os.getenv("TOKEN_REFRESH_FAILURE_BACKOFF_SECONDS", "300")),
+    expired_grace_seconds=float(os.getenv("TOKEN_REFRESH_EXPIRED_GRACE_SECONDS", "3600"))
+)
 
 
 @app.on_event("startup")
 def startup_event():
     init_db()
+    
+    if registry_source == "database":
+        metadata_sync.start()
+    else:
+        registry.load_connector_configs()
+        if registry_publish_enabled:
+            publish_registry()
+    
+    if invalidation_bus_enabled:
+        invalidation_bus.start(get_engine())
+    
+    if token_refresher_enabled:
+        token_refresher.start()
+    
+    usage_aggregator.start()
+    
+    if audit_log_enabled:
+        audit_sink.start(get_engine())
+    
+    if connector_config_watch_enabled and registry_source != "database":
+        config_watcher.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    config_watcher.stop()
+    metadata_sync.stop()
+    usage_aggregator.stop()
+    
+    if audit_log_enabled:
+        audit_sink.stop()
+    
+    token_refresher.stop()
+    invalidation_bus.stop()
+    default_token_clients.close()
+
+
+@app.on_event("shutdown")
+async def dispose_database():
+    await dispose_async_engine()
 
 
 class CreateConnectionRequest(BaseModel):
@@ -46,6 +232,19 @@ class CreateConnectionRequest(BaseModel):
     config: Optional[dict] = {}
 
 
+class BulkCreateConnectionsRequest(BaseModel):
+    connections: List[CreateConnectionRequest]
+
+
+class BulkDeleteConnectionsRequest(BaseModel):
+    connection_ids: List[str]
+
+
+class BulkUpdateStatusRequest(BaseModel):
+    connection_ids: List[str]
+    status: str
+
+
 class OAuthAuthorizeRequest(BaseModel):
     connector_type: str
     redirect_uri: str
@@ -75,30 +274,31 @@ def root():
             "connectors": "/api/v1/connectors",
             "connections": "/api/v1/connections",
             "oauth": "/api/v1/oauth",
-            "proxy": "/api/v1/proxy"
+            "proxy": "/api/v1/proxy",
+            "metrics": "/api/v1/metrics"
         }
     }
 
 
 @app.get("/api/v1/connectors")
 def list_connectors():
-    return registry.list_connectors()
+    return Response(content=registry.list_connectors_json(), media_type="application/json")
 
 
 @app.get("/api/v1/connectors/{connector_name}")
 def get_connector(connector_name: str):
-    connector = registry.get_connector(connector_name)
-    if not connector:
+    spec = registry.get_connector_spec(connector_name)
+    if not spec:
         raise HTTPException(status_code=404, detail="Connector not found")
-    return connector
+    return Response(content=spec.config_json, media_type="application/json")
 
 
 @app.get("/api/v1/connectors/{connector_name}/endpoints")
 def list_connector_endpoints(connector_name: str):
-    endpoints = registry.get_connector_endpoints(connector_name)
-    if not endpoints:
+    spec = registry.get_connector_spec(connector_name)
+    if not spec or not spec.endpoints:
         raise HTTPException(status_code=404, detail="Connector not found")
-    return endpoints
+    return Response(content=spec.endpoints_json, media_type="application/json")
 
 
 @app.post("/api/v1/connections")
@@ -129,8 +329,106 @@ def create_connection(
     }
 
 
+def _check_bulk_size(count: int):
+    if count > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many items: {count} (maximum {BULK_MAX_ITEMS})"
+        )
+
+
+@app.post("/api/v1/connections/bulk")
+def bulk_create_connections(
+    request: BulkCreateConnectionsRequest,
+    db: Session = Depends(get_db)
+):
+    _check_bulk_size(len(request.connections))
+    
+    valid = []
+    errors = []
+    
+    for index, item in enumerate(request.connections):
+        if not registry.get_connector(item.connector_type):
+            errors.append({"index": index, "error": "Connector not found"})
+        else:
+            valid.append((index, item))
+    
+    manager = ConnectionManager(db)
+    created = manager.bulk_create_connections([
+        {
+            "connector_type": item.connector_type,
+            "name": item.name,
+            "user_id": item.user_id,
+            "config": item.config
+        }
+        for _, item in valid
+    ])
+    
+    return {
+        "created": [
+            {
+                "index": index,
+                "id": row["id"],
+                "connector_type": row["connector_type"],
+                "name": row["name"],
+                "user_id": row["user_id"],
+                "status": row["status"],
+                "created_at": row["created_at"].isoformat()
+            }
+            for (index, _), row in zip(valid, created)
+        ],
+        "errors": errors
+    }
+
+
+@app.post("/api/v1/connections/bulk-delete")
+def bulk_delete_connections(
+    request: BulkDeleteConnectionsRequest,
+    db: Session = Depends(get_db)
+):
+    _check_bulk_size(len(request.connection_ids))
+    
+    connection_ids = list(dict.fromkeys(request.connection_ids))
+    
+    manager = ConnectionManager(db)
+    deleted = set(manager.bulk_delete_connections(connection_ids))
+    usage_aggregator.discard(deleted)
+    
+    return {
+        "deleted": [cid for cid in connection_ids if cid in deleted],
+        "errors": [
+            {"id": cid, "error": "Connection not found"}
+            for cid in connection_ids if cid not in deleted
+        ]
+    }
+
+
+@app.post("/api/v1/connections/bulk-status")
+def bulk_update_connection_status(
+    request: BulkUpdateStatusRequest,
+    db: Session = Depends(get_db)
+):
+    _check_bulk_size(len(request.connection_ids))
+    
+    connection_ids = list(dict.fromkeys(request.connection_ids))
+    
+    manager = ConnectionManager(db)
+    try:
+        updated = set(manager.bulk_update_status(connection_ids, request.status))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "updated": [cid for cid in connection_ids if cid in updated],
+        "errors": [
+            {"id": cid, "error": "Connection not found"}
+            for cid in connection_ids if cid not in updated
+        ]
+    }
+
+
 @app.get("/api/v1/connections/{connection_id}")
-def get_connection(connection_id: str, db: Session = Depends(get_db)):
+def get_connection(connection_id: str, db: Session = Depends(get_read_db_for_connection)):
     manager = ConnectionManager(db)
     connection = manager.get_connection(connection_id)
     
@@ -149,24 +447,92 @@ def get_connection(connection_id: str, db: Session = Depends(get_db)):
     }
 
 
+def _stream_connection_rows(rows):
+    yield b"["
+    for index, row in enumerate(rows):
+        if index:
+            yield b","
+        yield json.dumps({
+            "id": row.id,
+            "connector_type": row.connector_type,
+            "name": row.name,
+            "status": row.status,
+            "created_at": row.created_at.isoformat()
+        }).encode("utf-8")
+    yield b"]"
+
+
 @app.get("/api/v1/connections")
 def list_connections(
     user_id: str,
     connector_type: Optional[str] = None,
-    db: Session = Depends(get_db)
+    limit: int = Query(CONNECTIONS_PAGE_SIZE, ge=1, le=CONNECTIONS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db_for_user)
 ):
     manager = ConnectionManager(db)
-    connections = manager.list_connections(user_id, connector_type)
+    
+    try:
+        rows, next_cursor = manager.list_connections_page(user_id, connector_type, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    
+    return StreamingResponse(
+        _stream_connection_rows(rows),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+@app.get("/api/v1/connections/{connection_id}/usage")
+def get_connection_usage(connection_id: str, db: Session = Depends(get_read_db_for_connection)):
+    usage = db.get(ConnectionUsage, connection_id)
+    pending = usage_aggregator.pending_for(connection_id)
+    
+    if not usage and not pending:
+        raise HTTPException(status_code=404, detail="No usage recorded for this connection")
+    
+    totals = {
+        "call_count": usage.call_count if usage else 0,
+        "error_count": usage.error_count if usage else 0,
+        "bytes_sent": usage.bytes_sent if usage else 0,
+        "bytes_received": usage.bytes_received if usage else 0
+    }
+    last_used_at = usage.last_used_at if usage else None
+    
+    if pending:
+        for key in totals:
+            totals[key] += pending[key]
+        last_used_at = max(filter(None, [last_used_at, pending["last_used_at"]]))
+    
+    return {
+        "connection_id": connection_id,
+        **totals,
+        "last_used_at": last_used_at.isoformat() if last_used_at else None
+    }
+
+
+@app.get("/api/v1/connections/{connection_id}/audit")
+def get_connection_audit_log(
+    connection_id: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db_for_connection)
+):
+    if not audit_log_enabled or not audit_sink.enabled:
+        raise HTTPException(status_code=404, detail="Audit log is not enabled")
+    
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=1)
+    
+    records = audit_sink.query(db, connection_id, start, end, limit)
     
     return [
-        {
-            "id": conn.id,
-            "connector_type": conn.connector_type,
-            "name": conn.name,
-            "status": conn.status,
-            "created_at": conn.created_at.isoformat()
-        }
-        for conn in connections
+        {**record, "occurred_at": record["occurred_at"].isoformat()}
+        for record in records
     ]
 
 
@@ -178,6 +544,8 @@ def delete_connection(connection_id: str, db: Session = Depends(get_db)):
     if not success:
         raise HTTPException(status_code=404, detail="Connection not found")
     
+    usage_aggregator.discard([connection_id])
+    
     return {"message": "Connection deleted successfully"}
 
 
@@ -270,50 +638,163 @@ def oauth_callback(
         raise HTTPException(status_code=400, detail=f"OAuth callback failed: {str(e)}")
 
 
-@app.post("/api/v1/proxy/execute")
-def proxy_execute(
-    request: ProxyExecuteRequest,
-    db: Session = Depends(get_db)
-):
-    manager = ConnectionManager(db)
-    connection = manager.get_connection(request.connection_id)
+async def _prepare_proxy(request: ProxyExecuteRequest, db: Session, async_db: Optional[AsyncSession]):
+    """Resolve the connector and endpoint, validate parameters and build the proxy"""
+    if async_db is not None:
+        connection, _ = await AsyncConnectionManager(async_db).get_connection_with_token(request.connection_id)
+    else:
+        connection, _ = await run_in_threadpool(
+            ConnectionManager(db).get_connection_with_token,
+            request.connection_id
+        )
     
     if not connection:
         raise HTTPException(status_code=404, detail="Connection not found")
     
-    connector = registry.get_connector(connection.connector_type)
-    if not connector:
+    spec = registry.get_connector_spec(connection.connector_type)
+    if not spec:
         raise HTTPException(status_code=404, detail="Connector not found")
     
-    auth_config = connector.get("auth", {})
+    auth_config = spec.config["auth"]
     
     client_id = os.getenv(auth_config.get("client_id_env", ""))
     client_secret = os.getenv(auth_config.get("client_secret_env", ""))
     
     connector_config = {
-        "name": connector.get("name"),
-        "type": connector.get("type"),
+        "name": spec.name,
+        "type": spec.type,
         "client_id": client_id,
         "client_secret": client_secret,
-        "token_url": auth_config.get("token_url"),
-        "base_url": connector.get("base_url")
+        "token_url": auth_config["token_url"],
+        "base_url": spec.base_url
     }
     
+    params, path_params, body = request.params, request.path_params, request.body
+    
+    # Registered endpoints are checked against their YAML parameters before any
+    # token refresh or upstream call
+    endpoint = registry.get_endpoint_spec(spec.name, request.endpoint_config.get("name"))
+    if endpoint is not None:
+        try:
+            params, path_params, body = endpoint.validator.validate(params, path_params, body)
+        except ParameterError as e:
+            raise HTTPException(status_code=422, detail=e.errors)
+    
+    kafka_publisher = _kafka_publisher
+    if kafka_publisher is None:
+        kafka_publisher = await run_in_threadpool(get_kafka_publisher)
+    
+    # The token was loaded into the shared cache above, so the upstream call below
+    # only uses the sync session if it has to refresh.
+    manager = ConnectionManager(db)
     oauth_manager = OAuthManager(db)
-    proxy = APIProxy(db, oauth_manager, manager, kafka_publisher=kafka_publisher)
+    proxy = APIProxy(
+        db,
+        oauth_manager,
+        manager,
+        kafka_publisher=kafka_publisher,
+        usage_recorder=usage_aggregator,
+        audit_sink=audit_sink if audit_log_enabled else None
+    )
+    
+    return proxy, connector_config, endpoint, params, path_params, body
+
+
+@app.post("/api/v1/proxy/execute")
+async def proxy_execute(
+    request: ProxyExecuteRequest,
+    db: Session = Depends(get_db),
+    async_db: Optional[AsyncSession] = Depends(get_async_db)
+):
+    proxy, connector_config, endpoint, params, path_params, body = await _prepare_proxy(request, db, async_db)
     
-    result = proxy.execute_request(
+    result = await run_in_threadpool(
+        proxy.execute_request,
         connection_id=request.connection_id,
         connector_config=connector_config,
         endpoint_config=request.endpoint_config,
-        params=request.params,
-        body=request.body,
-        path_params=request.path_params
+        params=params,
+        body=body,
+        path_params=path_params,
+        transform=endpoint.transform if endpoint is not None else None
     )
     
     return result
 
 
+def _stream_records_ndjson(records):
+    """One JSON line per record, then a {"summary": ...} line; {"error": ...} if the stream breaks"""
+    try:
+        for kind, value in records:
+            line = value if kind == "record" else {"summary": value}
+            yield json.dumps(line, default=str).encode("utf-8") + b"\n"
+    except Exception as e:
+        logger.error(f"Streamed proxy response failed: {e}")
+        yield json.dumps({"error": str(e)}).encode("utf-8") + b"\n"
+    finally:
+        records.close()
+
+
+@app.post("/api/v1/proxy/stream")
+async def proxy_stream(
+    request: ProxyExecuteRequest,
+    db: Session = Depends(get_db),
+    async_db: Optional[AsyncSession] = Depends(get_async_db)
+):
+    """
+    Execute a list endpoint and stream its transformed records as NDJSON
+
+    Items are parsed, transformed and published to Kafka one at a time as the
+    upstream body arrives, so memory stays flat however large the page is.
+    Only endpoints with a list `transform:` mapping can be streamed.
+    """
+    proxy, connector_config, endpoint, params, path_params, body = await _prepare_proxy(request, db, async_db)
+    
+    if endpoint is None or endpoint.stream is None:
+        raise HTTPException(status_code=400, detail="Endpoint has no list transform to stream")
+    
+    result = await run_in_threadpool(
+        proxy.stream_request,
+        connection_id=request.connection_id,
+        connector_config=connector_config,
+        endpoint_config=request.endpoint_config,
+        stream_transform=endpoint.stream,
+        params=params,
+        body=body,
+        path_params=path_params
+    )
+    
+    if not result["success"]:
+        return result
+    
+    # The background task also runs when the client disconnects before the first
+    # chunk, so the upstream connection is released and the call recorded either way
+    records = result["records"]
+    return StreamingResponse(
+        _stream_records_ndjson(records),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(records.close)
+    )
+
+
+@app.get("/api/v1/metrics")
+def metrics():
+    return {
+        "token_cache": default_token_cache.stats(),
+        "connection_cache": default_connection_cache.stats(),
+        "token_refresh": default_refresh_flight.stats(),
+        "token_refresher": token_refresher.stats(),
+        "proxy": proxy_metrics.snapshot(),
+        "token_endpoints": default_token_clients.stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+        "read_routing": read_router.stats(),
+        "usage": usage_aggregator.stats(),
+        "audit_log": audit_sink.stats(),
+        "connector_registry": config_watcher.stats(),
+        "registry_sync": metadata_sync.stats()
+    }
+
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
@@ -1,17 +1,149 @@
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Iterator, Optional, Any, Tuple
 import requests
 from datetime import datetime
+import threading
+import time
 import logging
 
+from .audit_log import AuditRecord
+from .streaming import JsonItemStream
+from .token_refresh import TokenRefresher
+from .transform_compiler import StreamingTransform
+
 logger = logging.getLogger(__name__)
 
+REPLAYABLE_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+AUTH_ERROR_MARKERS = ("invalid_grant", "invalid_token", "expired_token", "unauthenticated")
+
+
+class ProxyMetrics:
+    """Thread-safe counters for the proxy request path"""
+    
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+
+proxy_metrics = ProxyMetrics()
+
+
+class RecordStream:
+    """
+    Records of one streamed list response
+
+    Iterating yields ("record", record) per item, then ("summary", fields).
+    The upstream response is closed, the publisher flushed and the call
+    recorded exactly once: when iteration ends, or on close(), which is safe
+    to call before iteration starts or from another thread.
+    """
+    
+    def __init__(
+        self,
+        proxy: "APIProxy",
+        response: requests.Response,
+        stream_transform: StreamingTransform,
+        connection_id: str,
+        connector_config: Dict,
+        endpoint_config: Dict,
+        method: str,
+        started: float
+    ):
+        self.proxy = proxy
+        self.response = response
+        self.stream_transform = stream_transform
+        self.connection_id = connection_id
+        self.connector_config = connector_config
+        self.endpoint_config = endpoint_config
+        self.method = method
+        self.started = started
+        
+        connector_type = connector_config.get('type')
+        self.publisher = proxy.kafka_publisher if connector_type else None
+        self.published = 0
+        
+        self._events = self._generate()
+        self._released = False
+        self._lock = threading.Lock()
+    
+    def __iter__(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return self
+    
+    def __next__(self) -> Tuple[str, Dict[str, Any]]:
+        return next(self._events)
+    
+    def _generate(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        connector_type = self.connector_config.get('type')
+        connector_name = self.connector_config.get('name')
+        endpoint_name = self.endpoint_config.get('name')
+        
+        try:
+            self.response.raw.decode_content = True
+            items = JsonItemStream(self.response.raw, self.stream_transform.items_path)
+            
+            for record in self.stream_transform.records(items):
+                if self.publisher and self.publisher.publish_record(
+                    connector_type, record, self.connection_id, connector_name, endpoint_name
+                ):
+                    self.published += 1
+                yield "record", record
+            
+            summary = self.stream_transform.summary(items.remainder, items.count)
+            summary["published_to_kafka"] = self.published
+            yield "summary", summary
+        finally:
+            self._release()
+    
+    def close(self):
+        """Stop the stream and release the upstream connection"""
+        try:
+            self._events.close()
+        except ValueError:
+            # Being iterated in another thread; closing the response below ends that read
+            pass
+        self._release()
+    
+    def _release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        
+        self.response.close()
+        if self.publisher and self.published:
+            self.publisher.flush()
+        self.proxy._record_call(
+            self.connection_id, self.connector_config, self.endpoint_config, self.method, self.started,
+            self.response, bytes_received=self.response.raw.tell()
+        )
+
 
 class APIProxy:
-    def __init__(self, db_session, oauth_manager, connection_manager, kafka_publisher=None):
+    def __init__(
+        self,
+        db_session,
+        oauth_manager,
+        connection_manager,
+        kafka_publisher=None,
+        token_refresher=None,
+        usage_recorder=None,
+        audit_sink=None
+    ):
         self.db = db_session
         self.oauth_manager = oauth_manager
         self.connection_manager = connection_manager
         self.kafka_publisher = kafka_publisher
+        self.token_refresher = token_refresher or TokenRefresher(oauth_manager, connection_manager)
+        self.usage_recorder = usage_recorder
+        self.audit_sink = audit_sink
     
     def execute_request(
         self,
@@ -20,94 +152,317 @@ class APIProxy:
         endpoint_config: Dict,
         params: Optional[Dict] = None,
         body: Optional[Dict] = None,
-        path_params: Optional[Dict] = None
+        path_params: Optional[Dict] = None,
+        transform: Optional[Callable[[Any], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        token = self.connection_manager.get_oauth_token(connection_id)
-        
-        if not token:
-            return {
-                "success": False,
-                "error": "No authentication token found for this connection"
-            }
-        
-        if self.oauth_manager.is_token_expired(token.expires_at):
-            if token.refresh_token:
-                try:
-                    new_token = self.oauth_manager.refresh_access_token(
-                        connector_config,
-                        token.refresh_token
-                    )
-                    self.connection_manager.store_oauth_token(
-                        connection_id,
-                        new_token
-                    )
-                    token = self.connection_manager.get_oauth_token(connection_id)
-                except Exception as e:
-                    return {
-                        "success": False,
-                        "error": f"Failed to refresh token: {str(e)}"
-                    }
-            else:
-                return {
-                    "success": False,
-                    "error": "Token expired and no refresh token available"
-                }
+        token, error = self._valid_token(connection_id, connector_config)
+        if error:
+            return error
         
         url = self._build_url(connector_config, endpoint_config, path_params)
-        headers = self._build_headers(token, endpoint_config)
         method = endpoint_config.get("method", "GET").upper()
         
+        started = time.perf_counter()
+        
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                json=body if method in ["POST", "PUT", "PATCH"] else None,
-                timeout=30
+            response = self._send_with_replay(
+                connection_id, connector_config, token, method, url, endpoint_config, params, body
             )
             
-            response_type = endpoint_config.get("response_type", "json")
-            data = None
-            
-            if response.content:
-                if response_type == "json":
-                    try:
-                        data = response.json()
-                    except ValueError:
-                        data = response.text
-                elif response_type == "binary":
-                    import base64
-                    data = {
-                        "content": base64.b64encode(response.content).decode('utf-8'),
-                        "content_type": response.headers.get("Content-Type", "application/octet-stream")
-                    }
-                else:
-                    data = response.text
+            self._record_call(connection_id, connector_config, endpoint_config, method, started, response)
             
             result = {
                 "success": response.status_code < 400,
                 "status_code": response.status_code,
-                "data": data,
+                "data": self._response_data(response, endpoint_config),
                 "headers": dict(response.headers)
             }
             
-            if result["success"] and data:
+            if result["success"] and result["data"]:
                 result = self._transform_and_publish(
                     result,
                     connector_config,
                     endpoint_config,
-                    connection_id
+                    connection_id,
+                    transform
                 )
             
             return result
         
         except requests.exceptions.RequestException as e:
+            self._record_call(connection_id, connector_config, endpoint_config, method, started, None)
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    def stream_request(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        endpoint_config: Dict,
+        stream_transform: StreamingTransform,
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None,
+        path_params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a list request and transform its items as they arrive
+        
+        The upstream body is read incrementally. On success the result's
+        "records" is a RecordStream yielding ("record", record) for each item,
+        publishing each to Kafka as it goes, then ("summary", list fields). The
+        caller must exhaust or close it to release the upstream connection;
+        close() works whether or not iteration has started.
+        Failures return the same shape as execute_request, without "records".
+        """
+        token, error = self._valid_token(connection_id, connector_config)
+        if error:
+            return error
+        
+        url = self._build_url(connector_config, endpoint_config, path_params)
+        method = endpoint_config.get("method", "GET").upper()
+        
+        started = time.perf_counter()
+        
+        try:
+            response = self._send_with_replay(
+                connection_id, connector_config, token, method, url, endpoint_config, params, body,
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            self._record_call(connection_id, connector_config, endpoint_config, method, started, None)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        
+        if response.status_code >= 400:
+            self._record_call(connection_id, connector_config, endpoint_config, method, started, response)
+            return {
+                "success": False,
+                "status_code": response.status_code,
+                "data": self._response_data(response, endpoint_config),
+                "headers": dict(response.headers)
+            }
+        
+        return {
+            "success": True,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "records": RecordStream(
+                self, response, stream_transform, connection_id, connector_config, endpoint_config, method, started
+            )
+        }
+    
+    def _valid_token(self, connection_id: str, connector_config: Dict) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Load the connection's token, refreshing it if expired; returns (token, error result)"""
+        token = self.connection_manager.get_oauth_token(connection_id)
+        
+        if not token:
+            return None, {
+                "success": False,
+                "error": "No authentication token found for this connection"
+            }
+        
+        if self.oauth_manager.is_token_expired(token.expires_at):
+            if not token.refresh_token:
+                return None, {
+                    "success": False,
+                    "error": "Token expired and no refresh token available"
+                }
+            
+            try:
+                token = self.token_refresher.refresh(
+                    connection_id,
+                    connector_config,
+                    stale_token=token
+                )
+            except Exception as e:
+                return None, {
+                    "success": False,
+                    "error": f"Failed to refresh token: {str(e)}"
+                }
+        
+        return token, None
+    
+    def _send_with_replay(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        token,
+        method: str,
+        url: str,
+        endpoint_config: Dict,
+        params: Optional[Dict],
+        body: Optional[Dict],
+        stream: bool = False
+    ) -> requests.Response:
+        response = self._send(method, url, token, endpoint_config, params, body, stream)
+        
+        if self._is_auth_failure(response):
+            proxy_metrics.increment("auth_failures")
+            
+            if token.refresh_token and self._is_replayable(method, endpoint_config):
+                response = self._refresh_and_replay(
+                    connection_id,
+                    connector_config,
+                    token,
+                    method,
+                    url,
+                    endpoint_config,
+                    params,
+                    body,
+                    response,
+                    stream
+                )
+            else:
+                proxy_metrics.increment("auth_retries_skipped")
+        
+        return response
+    
+    def _response_data(self, response: requests.Response, endpoint_config: Dict) -> Any:
+        response_type = endpoint_config.get("response_type", "json")
+        data = None
+        
+        if response.content:
+            if response_type == "json":
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = response.text
+            elif response_type == "binary":
+                import base64
+                data = {
+                    "content": base64.b64encode(response.content).decode('utf-8'),
+                    "content_type": response.headers.get("Content-Type", "application/octet-stream")
+                }
+            else:
+                data = response.text
+        
+        return data
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        token,
+        endpoint_config: Dict,
+        params: Optional[Dict],
+        body: Optional[Dict],
+        stream: bool = False
+    ) -> requests.Response:
+        return requests.request(
+            method=method,
+            url=url,
+            headers=self._build_headers(token, endpoint_config),
+            params=params,
+            json=body if method in ["POST", "PUT", "PATCH"] else None,
+            timeout=30,
+            stream=stream
+        )
+    
+    def _refresh_and_replay(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        token,
+        method: str,
+        url: str,
+        endpoint_config: Dict,
+        params: Optional[Dict],
+        body: Optional[Dict],
+        failed_response: requests.Response,
+        stream: bool = False
+    ) -> requests.Response:
+        """Force one token refresh after an upstream auth failure and replay the request"""
+        try:
+            new_token = self.token_refresher.refresh(
+                connection_id,
+                connector_config,
+                stale_token=token
+            )
+        except Exception as e:
+            logger.warning(f"Token refresh after auth failure failed for {connection_id}: {e}")
+            proxy_metrics.increment("auth_retry_refresh_failures")
+            return failed_response
+        
+        proxy_metrics.increment("auth_retries")
+        failed_response.close()
+        response = self._send(method, url, new_token, endpoint_config, params, body, stream)
+        
+        if self._is_auth_failure(response):
+            proxy_metrics.increment("auth_retry_failures")
+        else:
+            proxy_metrics.increment("auth_retry_successes")
+        
+        return response
+    
+    def _record_call(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        endpoint_config: Dict,
+        method: str,
+        started: float,
+        response: Optional[requests.Response],
+        bytes_received: Optional[int] = None
+    ):
+        """bytes_received defaults to the body length; streamed responses pass the count read"""
+        if not self.usage_recorder and not self.audit_sink:
+            return
+        
+        success = response is not None and response.status_code < 400
+        bytes_sent = 0
+        
+        if response is not None:
+            request_body = response.request.body if response.request is not None else None
+            bytes_sent = len(request_body) if request_body else 0
+            if bytes_received is None:
+                bytes_received = len(response.content) if response.content else 0
+        
+        bytes_received = bytes_received or 0
+        
+        if self.usage_recorder:
+            self.usage_recorder.record(
+                connection_id,
+                success=success,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received
+            )
+        
+        if self.audit_sink:
+            self.audit_sink.record(AuditRecord(
+                occurred_at=datetime.utcnow(),
+                connection_id=connection_id,
+                connector_name=connector_config.get("name"),
+                endpoint_name=endpoint_config.get("name"),
+                method=method,
+                path=endpoint_config.get("path"),
+                status_code=response.status_code if response is not None else None,
+                success=success,
+                latency_ms=int((time.perf_counter() - started) * 1000),
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received
+            ))
+    
+    def _is_auth_failure(self, response: requests.Response) -> bool:
+        if response.status_code == 401:
+            return True
+        
+        if response.status_code not in (400, 403):
+            return False
+        
+        if 'invalid_token' in response.headers.get("WWW-Authenticate", ""):
+            return True
+        
+        body = response.text[:2048].lower() if response.content else ""
+        return any(marker in body for marker in AUTH_ERROR_MARKERS)
+    
+    def _is_replayable(self, method: str, endpoint_config: Dict) -> bool:
+        """Idempotent methods, or endpoints declared `idempotent: true` (e.g. POST-based reads)"""
+        return method in REPLAYABLE_METHODS or endpoint_config.get("idempotent") is True
+    
     def _build_url(
         self,
         connector_config: Dict,
@@ -143,9 +498,15 @@ class APIProxy:
         result: Dict[str, Any],
         connector_config: Dict,
         endpoint_config: Dict,
-        connection_id: str
+        connection_id: str,
+        transform: Optional[Callable[[Any], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        """Transform response data and publish to Kafka"""
+        """
+        Transform response data and publish to Kafka
+
+        A transform compiled from the connector's YAML mapping takes precedence
+        over the hand-written transformer for its connector type.
+        """
         from .transformers import TransformerFactory
         
         connector_type = connector_config.get('type')
@@ -160,11 +521,14 @@ class APIProxy:
         
         if transformer:
             try:
-                transformed_data = transformer.transform(
-                    result['data'],
-                    endpoint_name,
-                    connector_name
-                )
+                if transform is not None:
+                    transformed_data = transform(result['data'])
+                else:
+                    transformed_data = transformer.transform(
+                        result['data'],
+                        endpoint_name,
+                        connector_name
+                    )
                 
                 result['transformed_data'] = transformed_data
                 result['connector_type'] = connector_type
@@ -0,0 +1,261 @@
+from typing import Collection, Dict, List, Optional, Tuple
+from datetime import datetime
+import uuid
+
+from sqlalchemy import select, update, delete, text
+
+from connector_platform.database import Connection, ConnectionUsage, OAuthToken
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.invalidation import InvalidationBus, invalidation_bus
+from connector_platform.core.connection_manager import (
+    CachedToken,
+    ConnectionInfo,
+    connection_page_statement,
+    connection_update_values,
+    expiring_tokens_statement,
+    split_page,
+    connection_with_token_statement,
+    split_connection_token_row,
+    token_upsert_statement,
+    token_values,
+    apply_token_values,
+    UPSERT_INSERTS,
+    default_token_cache,
+    default_connection_cache
+)
+
+
+class AsyncConnectionManager:
+    """AsyncSession counterpart of ConnectionManager sharing the same caches and invalidation bus"""
+
+    def __init__(
+        self,
+        db_session,
+        token_cache: Optional[TTLCache] = None,
+        connection_cache: Optional[TTLCache] = None,
+        bus: Optional[InvalidationBus] = None
+    ):
+        self.db = db_session
+        self.bus = bus if bus is not None else invalidation_bus
+        self.token_cache = token_cache if token_cache is not None else default_token_cache
+        self.connection_cache = (
+            connection_cache if connection_cache is not None else default_connection_cache
+        )
+
+    async def create_connection(
+        self,
+        connector_type: str,
+        name: str,
+        user_id: str,
+        config: Optional[Dict] = None
+    ) -> Connection:
+        connection = Connection(
+            id=str(uuid.uuid4()),
+            connector_type=connector_type,
+            name=name,
+            user_id=user_id,
+            config=config or {},
+            status="pending"
+        )
+
+        self.db.add(connection)
+        await self.bus.publish_async(self.db, "user", user_id)
+        await self.db.commit()
+        await self.db.refresh(connection)
+
+        return connection
+
+    async def get_connection(self, connection_id: str) -> Optional[Connection]:
+        result = await self.db.execute(
+            select(Connection).where(Connection.id == connection_id)
+        )
+        return result.scalars().first()
+
+    async def get_connection_info(self, connection_id: str) -> Optional[ConnectionInfo]:
+        info = self.connection_cache.get(connection_id)
+        if info is not None:
+            return info
+
+        connection = await self.get_connection(connection_id)
+        if not connection:
+            return None
+
+        info = ConnectionInfo.from_model(connection)
+        self.connection_cache.set(connection_id, info)
+
+        return info
+
+    async def list_connections(
+        self,
+        user_id: str,
+        connector_type: Optional[str] = None
+    ) -> List[Connection]:
+        query = select(Connection).where(Connection.user_id == user_id)
+
+        if connector_type:
+            query = query.where(Connection.connector_type == connector_type)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def list_connections_page(
+        self,
+        user_id: str,
+        connector_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List, Optional[str]]:
+        result = await self.db.execute(
+            connection_page_statement(user_id, connector_type, limit, cursor)
+        )
+        return split_page(result.all(), limit)
+
+    async def update_connection(
+        self,
+        connection_id: str,
+        **kwargs
+    ) -> Optional[Connection]:
+        result = await self.db.scalars(
+            update(Connection).where(
+                Connection.id == connection_id
+            ).values(
+                **connection_update_values(kwargs)
+            ).returning(Connection),
+            execution_options={"synchronize_session": "fetch"}
+        )
+        connection = result.first()
+
+        if not connection:
+            await self.db.rollback()
+            return None
+
+        await self.bus.publish_async(self.db, "connection", connection_id)
+        await self.bus.publish_async(self.db, "user", connection.user_id)
+        await self.db.commit()
+
+        self.connection_cache.invalidate(connection_id)
+
+        return connection
+
+    async def delete_connection(self, connection_id: str) -> bool:
+        await self.db.execute(
+            delete(OAuthToken).where(OAuthToken.connection_id == connection_id),
+            execution_options={"synchronize_session": False}
+        )
+        await self.db.execute(
+            delete(ConnectionUsage).where(ConnectionUsage.connection_id == connection_id),
+            execution_options={"synchronize_session": False}
+        )
+
+        result = await self.db.execute(
+            delete(Connection).where(
+                Connection.id == connection_id
+            ).returning(Connection.id, Connection.user_id),
+            execution_options={"synchronize_session": False}
+        )
+        deleted = result.first()
+
+        if not deleted:
+            await self.db.rollback()
+            return False
+
+        await self.bus.publish_async(self.db, "connection", connection_id)
+        await self.bus.publish_async(self.db, "token", connection_id)
+        await self.bus.publish_async(self.db, "user", deleted.user_id)
+        await self.db.commit()
+
+        self.token_cache.invalidate(connection_id)
+        self.connection_cache.invalidate(connection_id)
+
+        return True
+
+    async def store_oauth_token(
+        self,
+        connection_id: str,
+        token_data: Dict
+    ) -> CachedToken:
+        dialect_insert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+
+        if dialect_insert is not None:
+            result = await self.db.execute(token_upsert_statement(connection_id, token_data, dialect_insert))
+            token = CachedToken.from_row(result.one())
+        else:
+            result = await self.db.scalars(
+                select(OAuthToken).where(OAuthToken.connection_id == connection_id).with_for_update()
+            )
+            stored = apply_token_values(result.first(), token_values(connection_id, token_data))
+            self.db.add(stored)
+            await self.db.flush()
+            token = CachedToken.from_model(stored)
+
+        await self.bus.publish_async(self.db, "token", connection_id)
+        await self.db.commit()
+
+        self.token_cache.set(connection_id, token, expires_at=token.expires_at)
+
+        return token
+
+    async def get_connection_with_token(
+        self,
+        connection_id: str
+    ) -> Tuple[Optional[ConnectionInfo], Optional[CachedToken]]:
+        info = self.connection_cache.get(connection_id)
+        token = self.token_cache.get(connection_id)
+
+        if info is not None and token is not None:
+            return info, token
+
+        result = await self.db.execute(connection_with_token_statement(connection_id))
+        row = result.first()
+
+        if row is None:
+            return None, None
+
+        info, token = split_connection_token_row(row)
+
+        self.connection_cache.set(connection_id, info)
+        if token is not None:
+            self.token_cache.set(connection_id, token, expires_at=token.expires_at)
+
+        return info, token
+
+    async def get_oauth_token(self, connection_id: str, use_cache: bool = True) -> Optional[CachedToken]:
+        if use_cache:
+            cached = self.token_cache.get(connection_id)
+            if cached is not None:
+                return cached
+
+        result = await self.db.execute(
+            select(OAuthToken).where(OAuthToken.connection_id == connection_id)
+        )
+        token = result.scalars().first()
+
+        if not token:
+            return None
+
+        cached = CachedToken.from_model(token)
+        self.token_cache.set(connection_id, cached, expires_at=token.expires_at)
+
+        return cached
+
+    async def list_expiring_tokens(
+        self,
+        expires_before: datetime,
+        limit: int = 1000,
+        expires_after: Optional[datetime] = None,
+        exclude: Optional[Collection[str]] = None
+    ) -> List[Tuple[str, str, datetime]]:
+        result = await self.db.execute(
+            expiring_tokens_statement(expires_before, limit, expires_after, exclude)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def lock_connection(self, connection_id: str):
+        """Take a transaction-scoped lock on the connection, released on commit or rollback"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+
+        await self.db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"connection:{connection_id}"}
+        )
@@ -0,0 +1,279 @@
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional
+from collections import deque
+from datetime import date, datetime, timedelta
+import csv
+import io
+import re
+import threading
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+TABLE = "proxy_audit_log"
+PARTITION_PATTERN = re.compile(rf"^{TABLE}_p(\d{{8}})$")
+
+COLUMNS = (
+    "occurred_at",
+    "connection_id",
+    "connector_name",
+    "endpoint_name",
+    "method",
+    "path",
+    "status_code",
+    "success",
+    "latency_ms",
+    "bytes_sent",
+    "bytes_received"
+)
+
+
+class AuditRecord(NamedTuple):
+    occurred_at: datetime
+    connection_id: str
+    connector_name: Optional[str]
+    endpoint_name: Optional[str]
+    method: str
+    path: Optional[str]
+    status_code: Optional[int]
+    success: bool
+    latency_ms: int
+    bytes_sent: int
+    bytes_received: int
+
+
+def partition_name(day: date) -> str:
+    return f"{TABLE}_p{day:%Y%m%d}"
+
+
+def expired_partitions(names: List[str], today: date, retention_days: int) -> List[str]:
+    """Daily partitions among names that fall entirely before the retention window"""
+    cutoff = today - timedelta(days=retention_days)
+    expired = []
+
+    for name in names:
+        match = PARTITION_PATTERN.match(name)
+        if match and datetime.strptime(match.group(1), "%Y%m%d").date() < cutoff:
+            expired.append(name)
+
+    return expired
+
+
+class AuditLogSink:
+    """
+    Buffers proxy audit records in memory and COPYs them into daily partitions in large batches
+
+    Requires PostgreSQL (COPY and declarative partitioning). start() on any other
+    database disables the sink with a single warning, after which record() is a no-op.
+    """
+
+    def __init__(
+        self,
+        engine=None,
+        flush_interval_seconds: float = 5.0,
+        batch_size: int = 5000,
+        max_buffered: int = 100000,
+        retention_days: int = 30,
+        clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        """
+        Initialize audit sink
+
+        Args:
+            engine: SQLAlchemy engine for the primary database; may instead be passed to start
+            flush_interval_seconds: Maximum seconds a record waits in memory
+            batch_size: Flush early once this many records are buffered
+            max_buffered: Oldest records are dropped beyond this to bound memory if the database is down
+            retention_days: Partitions older than this many days are dropped
+            clock: Source of the current UTC time
+        """
+        self.engine = engine
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+        self.retention_days = retention_days
+        self.clock = clock
+        self.enabled = True
+
+        self._buffer: Deque[AuditRecord] = deque(maxlen=max_buffered)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._partitions: set = set()
+        self._last_retention_run: Optional[date] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.flush_failures = 0
+
+    def record(self, record: AuditRecord):
+        """Buffer one record; never blocks on the database"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(record)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        COPY all buffered records into their daily partitions
+
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+
+            if not batch:
+                return 0
+
+            try:
+                self._ensure_partitions({r.occurred_at.date() for r in batch})
+                self._copy(batch)
+            except Exception as e:
+                with self._lock:
+                    self.flush_failures += 1
+                    room = self._buffer.maxlen - len(self._buffer)
+                    self._buffer.extendleft(reversed(batch[-room:] if room else []))
+                    self.dropped += len(batch) - min(room, len(batch))
+                logger.error(f"Audit log flush failed, will retry: {e}")
+                return 0
+
+            with self._lock:
+                self.written += len(batch)
+
+            return len(batch)
+
+    def _copy(self, batch: List[AuditRecord]):
+        data = io.StringIO()
+        writer = csv.writer(data)
+        for record in batch:
+            writer.writerow(["" if value is None else value for value in record])
+        data.seek(0)
+
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.copy_expert(
+                f"COPY {TABLE} ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                data
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _ensure_partitions(self, days):
+        missing = [day for day in days if day not in self._partitions]
+        if not missing:
+            return
+
+        with self.engine.begin() as connection:
+            for day in missing:
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {partition_name(day)} PARTITION OF {TABLE} "
+                    f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+                ))
+
+        self._partitions.update(missing)
+
+    def drop_expired_partitions(self) -> List[str]:
+        """Drop whole daily partitions older than the retention window"""
+        with self.engine.begin() as connection:
+            names = connection.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ), {"table": TABLE}).scalars().all()
+
+            dropped = expired_partitions(names, self.clock().date(), self.retention_days)
+            for name in dropped:
+                connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                day = datetime.strptime(PARTITION_PATTERN.match(name).group(1), "%Y%m%d").date()
+                self._partitions.discard(day)
+
+        if dropped:
+            logger.info(f"Dropped expired audit partitions: {', '.join(dropped)}")
+
+        return dropped
+
+    def query(
+        self,
+        db_session,
+        connection_id: str,
+        start: datetime,
+        end: datetime,
+        limit: int = 1000
+    ) -> List[Dict]:
+        """Records for one connection in [start, end), newest first; prunes to the matching partitions"""
+        rows = db_session.execute(text(
+            f"SELECT {', '.join(COLUMNS)} FROM {TABLE} "
+            "WHERE connection_id = :connection_id AND occurred_at >= :start AND occurred_at < :end "
+            "ORDER BY occurred_at DESC LIMIT :limit"
+        ), {"connection_id": connection_id, "start": start, "end": end, "limit": limit}).mappings().all()
+
+        return [dict(row) for row in rows]
+
+    def start(self, engine=None):
+        """Start the background flush loop"""
+        if engine is not None:
+            self.engine = engine
+
+        if self.engine.dialect.name != "postgresql":
+            logger.warning(
+                f"Audit log requires PostgreSQL; disabled on {self.engine.dialect.name}"
+            )
+            self.enabled = False
+            with self._lock:
+                self._buffer.clear()
+            return
+
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10):
+        """Stop the loop and flush whatever is buffered"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+
+            self.flush()
+
+            today = self.clock().date()
+            if self._last_retention_run != today:
+                try:
+                    self.drop_expired_partitions()
+                    self._last_retention_run = today
+                except Exception as e:
+                    logger.error(f"Audit log retention failed: {e}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "buffered": len(self._buffer),
+                "written": self.written,
+                "dropped": self.dropped,
+                "flush_failures": self.flush_failures
+            }
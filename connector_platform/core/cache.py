@@ -0,0 +1,112 @@
+from typing import Any, Dict, Hashable, Optional
+from collections import OrderedDict
+from datetime import datetime
+import threading
+import time
+
+
+class TTLCache:
+    """Bounded, thread-safe LRU cache with a per-entry time-to-live"""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300.0):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of entries before least recently used ones are evicted
+            ttl_seconds: Default lifetime of an entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, deadline = entry
+            if now >= deadline:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        expires_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Store value under key
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Lifetime override for this entry
+            expires_at: Absolute UTC expiry of the value itself; the entry never outlives it
+
+        Returns:
+            True if the value was cached, False if it was already expired
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        if expires_at is not None:
+            ttl = min(ttl, (expires_at - datetime.utcnow()).total_seconds())
+
+        if ttl <= 0 or self.max_size <= 0:
+            self.invalidate(key)
+            return False
+
+        deadline = time.monotonic() + ttl
+
+        with self._lock:
+            self._entries[key] = (value, deadline)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove key from the cache. Returns True if it was present"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit ratio counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
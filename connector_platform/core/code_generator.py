@@ -1,4 +1,3 @@
-from jinja2 import Template
 from pathlib import Path
 import yaml
 from typing import Dict
@@ -80,6 +79,8 @@ class {{ class_name }}Connector(BaseConnector):
 {% endfor %}
 '''
         
+        from jinja2 import Template
+        
         template = Template(template_str)
         
         class_name = "".join(word.capitalize() for word in config["name"].replace("-", "_").split("_"))
@@ -146,6 +147,8 @@ func (c *{{ class_name }}Connector) {{ endpoint.display_name|replace(" ", "") }}
 {% endfor %}
 '''
         
+        from jinja2 import Template
+        
         template = Template(template_str)
         template.filters['go_type'] = lambda x: {"str": "string", "int": "int", "bool": "bool", "dict": "map[string]interface{}", "list": "[]interface{}"}.get(x, "interface{}")
         
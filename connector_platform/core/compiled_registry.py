@@ -0,0 +1,163 @@
+"""
+Compiled, immutable connector registry structures
+
+Connector YAMLs are validated and compiled once, when they are loaded, into
+frozen specs with every lookup index and response body the API needs. A
+RegistrySnapshot is never modified after construction; reloads build a new
+one and swap it in by reference.
+"""
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+import json
+
+from connector_platform.core.config_validator import ConfigValidator
+from connector_platform.core.param_validation import ParameterValidator
+from connector_platform.core.transform_compiler import StreamingTransform, compile_transforms
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def dump_json(value: Any) -> bytes:
+    """Serialize the way FastAPI's JSONResponse does"""
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=str
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class EndpointSpec:
+    connector_name: str
+    name: str
+    method: str
+    path: str
+    response_type: str
+    headers: Mapping[str, str]
+    parameters: Tuple[Mapping, ...]
+    validator: ParameterValidator
+    config: Mapping
+    transform: Optional[Callable[[Any], Dict[str, Any]]] = None
+    stream: Optional[StreamingTransform] = None
+
+
+@dataclass(frozen=True)
+class ConnectorSpec:
+    name: str
+    display_name: str
+    description: str
+    version: str
+    type: Optional[str]
+    auth_type: Optional[str]
+    base_url: str
+    config: Mapping
+    endpoints: Mapping[str, EndpointSpec]
+    summary: Mapping
+    config_json: bytes
+    endpoints_json: bytes
+
+
+def compile_connector(config: Dict) -> ConnectorSpec:
+    """
+    Validate a raw connector config and compile it into a ConnectorSpec
+
+    Raises:
+        ValueError: If the config does not pass ConfigValidator or its
+            transform section does not compile
+    """
+    valid, errors = ConfigValidator.validate_connector_config(config)
+    if not valid:
+        raise ValueError("; ".join(errors))
+
+    name = config["name"]
+    auth = config.get("auth", {})
+    frozen = freeze(config)
+
+    transforms = compile_transforms(
+        frozen.get("transform", MappingProxyType({})),
+        [endpoint["name"] for endpoint in frozen.get("endpoints", ())]
+    )
+
+    endpoints = {}
+    for endpoint in frozen.get("endpoints", ()):
+        transform, stream = transforms.get(endpoint["name"], (None, None))
+        endpoints[endpoint["name"]] = EndpointSpec(
+            connector_name=name,
+            name=endpoint["name"],
+            method=endpoint["method"].upper(),
+            path=endpoint["path"],
+            response_type=endpoint.get("response_type", "json"),
+            headers=endpoint.get("headers", MappingProxyType({})),
+            parameters=endpoint.get("parameters", ()),
+            validator=ParameterValidator(endpoint.get("parameters", ())),
+            config=endpoint,
+            transform=transform,
+            stream=stream
+        )
+
+    summary = {
+        "name": name,
+        "display_name": config.get("display_name", name),
+        "description": config.get("description", ""),
+        "auth_type": auth.get("type"),
+        "version": config.get("version", "1.0.0")
+    }
+
+    return ConnectorSpec(
+        name=name,
+        display_name=summary["display_name"],
+        description=summary["description"],
+        version=summary["version"],
+        type=config.get("type"),
+        auth_type=summary["auth_type"],
+        base_url=config["base_url"],
+        config=frozen,
+        endpoints=MappingProxyType(endpoints),
+        summary=MappingProxyType(summary),
+        config_json=dump_json(config),
+        endpoints_json=dump_json(config.get("endpoints", []))
+    )
+
+
+class FileStamp(NamedTuple):
+    mtime_ns: int
+    size: int
+    connector_name: Optional[str]
+
+
+class RegistrySnapshot:
+    """Immutable, indexed view of the loaded connectors, replaced as a whole on reload"""
+
+    def __init__(self, specs: Iterable[ConnectorSpec], files: Dict[str, FileStamp], version: int = 0):
+        ordered = sorted(specs, key=lambda spec: spec.name)
+
+        self.specs: Mapping[str, ConnectorSpec] = MappingProxyType({spec.name: spec for spec in ordered})
+        self.connectors: Mapping[str, Mapping] = MappingProxyType({spec.name: spec.config for spec in ordered})
+        self.endpoints: Mapping[Tuple[str, str], EndpointSpec] = MappingProxyType({
+            (spec.name, endpoint_name): endpoint
+            for spec in ordered
+            for endpoint_name, endpoint in spec.endpoints.items()
+        })
+
+        by_type: Dict[str, list] = {}
+        for spec in ordered:
+            by_type.setdefault(spec.type, []).append(spec)
+        self.by_type: Mapping[Optional[str], Tuple[ConnectorSpec, ...]] = MappingProxyType(
+            {connector_type: tuple(group) for connector_type, group in by_type.items()}
+        )
+
+        self.summaries: Tuple[Mapping, ...] = tuple(spec.summary for spec in ordered)
+        self.summaries_json: bytes = dump_json([dict(summary) for summary in self.summaries])
+
+        self.files: Mapping[str, FileStamp] = MappingProxyType(dict(files))
+        self.version = version
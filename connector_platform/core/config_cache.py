@@ -0,0 +1,219 @@
+"""
+On-disk cache of parsed connector YAMLs
+
+Parsed configs are stored in one marshal-encoded file keyed by path, mtime,
+size and content hash. Each worker reads the file into its own memory on
+start, so a cold start only stats each YAML and re-parses the ones that
+actually changed. Nothing is shared between workers beyond the file itself,
+which is replaced atomically so a reader never sees a partial write.
+
+Cached configs are trusted without re-reading the YAMLs, so trust comes from
+the file system: the file lives in a directory private to the service user,
+and a cache file or directory owned by another user, or writable by group or
+other, is ignored. The SHA-256 stored with the payload only detects a
+truncated or corrupted file; anyone who can write the file can recompute it.
+"""
+from typing import Dict, Optional, Tuple
+from pathlib import Path
+import hashlib
+import marshal
+import os
+import stat as stat_module
+import tempfile
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CPCC\x02"
+DIGEST_SIZE = hashlib.sha256().digest_size
+
+DEFAULT_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "connector_platform" / "config.cache"
+)
+
+# Resolved on first parse, so a start served entirely from the cache never imports yaml
+_yaml_loader = None
+
+
+def yaml_loader():
+    """libyaml's loader when available; it is several times faster than the pure-Python one"""
+    global _yaml_loader
+
+    if _yaml_loader is None:
+        import yaml
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    return _yaml_loader
+
+
+def load_yaml(data) -> Dict:
+    """Parse YAML with the fastest available safe loader"""
+    import yaml
+    return yaml.load(data, Loader=yaml_loader())
+
+
+def _untrusted(st: os.stat_result) -> Optional[str]:
+    """Why a cache file or directory must not be trusted, or None if it can be"""
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return f"owned by uid {st.st_uid}"
+    if st.st_mode & (stat_module.S_IWGRP | stat_module.S_IWOTH):
+        return "writable by group or other"
+    return None
+
+
+def _marshallable(value) -> bool:
+    try:
+        marshal.dumps(value)
+        return True
+    except ValueError:
+        return False
+
+
+class ConfigSnapshotCache:
+    """Parsed connector configs persisted on disk across process starts"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        """
+        Initialize cache
+
+        Args:
+            path: Cache file location; every worker on the host may read and
+                replace it. Its directory is created with mode 0700 if missing.
+        """
+        self.path = Path(path)
+
+        # path -> (mtime_ns, size, sha256, config)
+        self._entries: Dict[str, Tuple[int, int, str, Dict]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.hash_hits = 0
+        self.misses = 0
+
+    def _open(self):
+        self._loaded = True
+
+        try:
+            with open(self.path, "rb") as f:
+                reason = _untrusted(os.stat(self.path.parent)) or _untrusted(os.fstat(f.fileno()))
+                if reason:
+                    logger.warning(f"Ignoring config cache {self.path}: {reason}")
+                    return
+
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable config cache {self.path}: {e}")
+            return
+
+        header = len(MAGIC) + DIGEST_SIZE
+        if data[:len(MAGIC)] != MAGIC:
+            logger.warning(f"Ignoring config cache {self.path}: unknown format")
+            return
+        if hashlib.sha256(data[header:]).digest() != data[len(MAGIC):header]:
+            logger.warning(f"Ignoring corrupted config cache {self.path}: checksum mismatch")
+            return
+
+        try:
+            entries = marshal.loads(data[header:])
+        except (EOFError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable config cache {self.path}: {e}")
+            return
+
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def load(self, config_file: Path, stat: Optional[os.stat_result] = None) -> Dict:
+        """
+        Return the parsed config for a YAML file, parsing it only if it changed
+
+        A file whose mtime changed but whose content hash did not (a fresh
+        checkout, a deploy that rewrites every file) is served from the cache.
+        """
+        key = str(Path(config_file).resolve())
+        stat = stat or os.stat(config_file)
+
+        with self._lock:
+            if not self._loaded:
+                self._open()
+            entry = self._entries.get(key)
+
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self.hits += 1
+                return entry[3]
+
+        with open(config_file, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            if entry and entry[2] == digest:
+                self.hash_hits += 1
+                config = entry[3]
+            else:
+                self.misses += 1
+                config = load_yaml(data)
+
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, config)
+            self._dirty = True
+
+        return config
+
+    def save(self):
+        """Write the cache if anything changed, replacing the file atomically"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._entries = {
+                key: entry for key, entry in self._entries.items() if os.path.exists(key)
+            }
+
+            try:
+                payload = marshal.dumps(self._entries)
+            except ValueError:
+                # Configs holding values marshal cannot encode (e.g. YAML timestamps) are left out
+                payload = marshal.dumps({
+                    key: entry for key, entry in self._entries.items() if _marshallable(entry)
+                })
+
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            reason = _untrusted(os.stat(self.path.parent))
+            if reason:
+                logger.warning(f"Not writing config cache {self.path}: directory {reason}")
+                return
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        except OSError as e:
+            logger.warning(f"Could not write config cache {self.path}: {e}")
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(hashlib.sha256(payload).digest())
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write config cache {self.path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "hash_hits": self.hash_hits,
+                "misses": self.misses,
+                "loader": _yaml_loader.__name__ if _yaml_loader else None
+            }
@@ -42,6 +42,7 @@ class EndpointSchema(BaseModel):
     parameters: List[ParameterSchema] = []
     headers: Dict[str, str] = {}
     response_type: str = "json"
+    idempotent: bool = False
 
 
 class OAuthConfigSchema(BaseModel):
@@ -0,0 +1,179 @@
+from typing import Callable, Dict, Optional
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """Minimal inotify binding over libc; raises OSError where inotify is unavailable"""
+
+    def __init__(self, path: str):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not supported on this platform")
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until events arrive or the timeout passes
+
+        Returns True if a .yaml file or a Kubernetes ConfigMap's ..data symlink
+        changed, or if the kernel queue overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+
+        changed = False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            _, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if mask & IN_Q_OVERFLOW or name.endswith(b".yaml") or name == b"..data":
+                changed = True
+
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """Reloads the connector registry when its YAML directory changes"""
+
+    def __init__(
+        self,
+        registry,
+        poll_interval_seconds: float = 5.0,
+        debounce_seconds: float = 0.5,
+        use_inotify: bool = True,
+        rescan_interval_seconds: float = 60.0,
+        on_reload: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize watcher
+
+        Args:
+            registry: ConnectorRegistry to reload
+            poll_interval_seconds: Seconds between directory scans when inotify is unavailable
+            debounce_seconds: Quiet period after an event before reloading, so editors and
+                deploy tools that write a file in several steps trigger a single reload
+            use_inotify: Set False to force the polling fallback
+            rescan_interval_seconds: Seconds between full rescans in inotify mode, which
+                catch changes inotify does not report for the watched names
+            on_reload: Called after a new snapshot has been swapped in
+        """
+        self.registry = registry
+        self.poll_interval_seconds = poll_interval_seconds
+        self.debounce_seconds = debounce_seconds
+        self.use_inotify = use_inotify
+        self.rescan_interval_seconds = rescan_interval_seconds
+        self.on_reload = on_reload
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.mode: Optional[str] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="connector-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = Inotify(str(self.registry.config_dir))
+            except OSError as e:
+                logger.info(f"inotify unavailable ({e}); polling connector configs instead")
+
+        self.mode = "inotify" if inotify else "polling"
+
+        try:
+            if inotify:
+                self._watch_inotify(inotify)
+            else:
+                self._watch_polling()
+        finally:
+            if inotify:
+                inotify.close()
+
+    def _watch_inotify(self, inotify: Inotify):
+        last_scan = time.monotonic()
+        while not self._stop.is_set():
+            if not inotify.wait(1.0):
+                if time.monotonic() - last_scan >= self.rescan_interval_seconds:
+                    last_scan = time.monotonic()
+                    self._reload()
+                continue
+
+            while inotify.wait(self.debounce_seconds):
+                pass
+
+            last_scan = time.monotonic()
+            self._reload()
+
+    def _watch_polling(self):
+        while not self._stop.wait(self.poll_interval_seconds):
+            self._reload()
+
+    def _reload(self):
+        try:
+            if self.registry.reload() and self.on_reload is not None:
+                self.on_reload()
+        except Exception as e:
+            logger.error(f"Connector config reload failed: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "mode": self.mode,
+            **self.registry.stats()
+        }
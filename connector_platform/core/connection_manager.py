@@ -1,12 +1,291 @@
-from typing import Dict, List, Optional
+from typing import Collection, Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
+import base64
+import os
 import uuid
-from connector_platform.database import Connection, OAuthToken
+from sqlalchemy import text, select, insert, update, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from connector_platform.database import Connection, ConnectionUsage, OAuthToken
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.oauth_manager import OAuthManager
+from connector_platform.core.invalidation import InvalidationBus, invalidation_bus
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """Detached snapshot of an OAuthToken row that is safe to share across sessions"""
+    connection_id: str
+    access_token: str
+    refresh_token: Optional[str]
+    token_type: str
+    expires_at: Optional[datetime]
+    scope: Optional[str]
+
+    @classmethod
+    def from_model(cls, token: OAuthToken) -> "CachedToken":
+        return cls(
+            connection_id=token.connection_id,
+            access_token=token.access_token,
+            refresh_token=token.refresh_token,
+            token_type=token.token_type or "Bearer",
+            expires_at=token.expires_at,
+            scope=token.scope
+        )
+    
+    @classmethod
+    def from_row(cls, row) -> "CachedToken":
+        connection_id, access_token, refresh_token, token_type, expires_at, scope = row
+        return cls(
+            connection_id=connection_id,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type=token_type or "Bearer",
+            expires_at=expires_at,
+            scope=scope
+        )
+
+
+@dataclass(frozen=True)
+class ConnectionInfo:
+    """Detached snapshot of the Connection columns needed on the proxy path"""
+    id: str
+    connector_type: str
+    name: str
+    user_id: str
+    status: str
+
+    @classmethod
+    def from_model(cls, connection: Connection) -> "ConnectionInfo":
+        return cls(
+            id=connection.id,
+            connector_type=connection.connector_type,
+            name=connection.name,
+            user_id=connection.user_id,
+            status=connection.status
+        )
+    
+    @classmethod
+    def from_row(cls, row) -> "ConnectionInfo":
+        return cls(*row)
+
+
+TOKEN_COLUMNS = (
+    OAuthToken.connection_id,
+    OAuthToken.access_token,
+    OAuthToken.refresh_token,
+    OAuthToken.token_type,
+    OAuthToken.expires_at,
+    OAuthToken.scope
+)
+
+CONNECTION_INFO_COLUMNS = (
+    Connection.id,
+    Connection.connector_type,
+    Connection.name,
+    Connection.user_id,
+    Connection.status
+)
+
+
+def connection_with_token_statement(connection_id: str):
+    """Connection columns and its token (if any) in a single round trip"""
+    return select(
+        *CONNECTION_INFO_COLUMNS,
+        *TOKEN_COLUMNS
+    ).outerjoin(
+        OAuthToken,
+        OAuthToken.connection_id == Connection.id
+    ).where(
+        Connection.id == connection_id
+    )
+
+
+def split_connection_token_row(row) -> Tuple[ConnectionInfo, Optional[CachedToken]]:
+    split = len(CONNECTION_INFO_COLUMNS)
+    info = ConnectionInfo.from_row(row[:split])
+    token = CachedToken.from_row(row[split:]) if row[split] is not None else None
+    return info, token
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE ... RETURNING; others fall back
+# to a locked SELECT followed by an UPDATE or INSERT
+UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert
+}
+
+
+def token_values(connection_id: str, token_data: Dict) -> Dict:
+    """Column values for storing a token endpoint response"""
+    expires_at = None
+    if token_data.get("expires_in") is not None:
+        expires_at = OAuthManager.calculate_expiry(token_data["expires_in"])
+    
+    return {
+        "connection_id": connection_id,
+        "access_token": token_data.get("access_token"),
+        "refresh_token": token_data.get("refresh_token"),
+        "token_type": token_data.get("token_type", "Bearer"),
+        "expires_at": expires_at,
+        "scope": token_data.get("scope"),
+        "updated_at": datetime.utcnow()
+    }
+
+
+def token_upsert_statement(connection_id: str, token_data: Dict, dialect_insert=pg_insert):
+    """INSERT ... ON CONFLICT (connection_id) DO UPDATE ... RETURNING for a token response"""
+    values = token_values(connection_id, token_data)
+    
+    statement = dialect_insert(OAuthToken).values(
+        id=str(uuid.uuid4()),
+        created_at=values["updated_at"],
+        **values
+    )
+    
+    return statement.on_conflict_do_update(
+        index_elements=[OAuthToken.connection_id],
+        set_={
+            "access_token": statement.excluded.access_token,
+            "refresh_token": func.coalesce(statement.excluded.refresh_token, OAuthToken.refresh_token),
+            "token_type": statement.excluded.token_type,
+            "expires_at": statement.excluded.expires_at,
+            "scope": statement.excluded.scope,
+            "updated_at": values["updated_at"]
+        }
+    ).returning(*TOKEN_COLUMNS)
+
+
+def apply_token_values(token: Optional[OAuthToken], values: Dict) -> OAuthToken:
+    """Update a locked token row in place, or build a new one; keeps the stored refresh token if none was issued"""
+    if token is None:
+        return OAuthToken(id=str(uuid.uuid4()), created_at=values["updated_at"], **values)
+    
+    for key, value in values.items():
+        if key != "refresh_token" or value is not None:
+            setattr(token, key, value)
+    return token
+
+
+CONNECTION_LIST_COLUMNS = (
+    Connection.id,
+    Connection.connector_type,
+    Connection.name,
+    Connection.status,
+    Connection.created_at
+)
+
+
+def encode_cursor(created_at: datetime, connection_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{connection_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, connection_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), connection_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def connection_page_statement(
+    user_id: str,
+    connector_type: Optional[str],
+    limit: int,
+    cursor: Optional[str]
+):
+    """Keyset page over (created_at, id) selecting only the listed columns; fetches one extra row"""
+    query = select(*CONNECTION_LIST_COLUMNS).where(Connection.user_id == user_id)
+    
+    if connector_type:
+        query = query.where(Connection.connector_type == connector_type)
+    
+    if cursor:
+        created_at, connection_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Connection.created_at, Connection.id) > tuple_(created_at, connection_id)
+        )
+    
+    return query.order_by(Connection.created_at, Connection.id).limit(limit + 1)
+
+
+def split_page(rows: List, limit: int) -> Tuple[List, Optional[str]]:
+    if len(rows) <= limit:
+        return rows, None
+    
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+def expiring_tokens_statement(
+    expires_before: datetime,
+    limit: int,
+    expires_after: Optional[datetime] = None,
+    exclude: Optional[Collection[str]] = None
+):
+    query = select(
+        OAuthToken.connection_id,
+        Connection.connector_type,
+        OAuthToken.expires_at
+    ).join(
+        Connection,
+        Connection.id == OAuthToken.connection_id
+    ).where(
+        OAuthToken.expires_at.isnot(None),
+        OAuthToken.expires_at <= expires_before,
+        OAuthToken.refresh_token.isnot(None)
+    )
+    
+    if expires_after is not None:
+        query = query.where(OAuthToken.expires_at >= expires_after)
+    
+    if exclude:
+        query = query.where(OAuthToken.connection_id.notin_(list(exclude)))
+    
+    return query.order_by(OAuthToken.expires_at).limit(limit)
+
+
+CONNECTION_STATUSES = ("pending", "active", "inactive", "disabled")
+
+
+def connection_update_values(changes: Dict) -> Dict:
+    values = {
+        key: value for key, value in changes.items()
+        if key in Connection.__table__.columns and key != "id"
+    }
+    values["updated_at"] = datetime.utcnow()
+    return values
+
+
+default_token_cache = TTLCache(
+    max_size=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+)
+
+default_connection_cache = TTLCache(
+    max_size=int(os.getenv("CONNECTION_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("CONNECTION_CACHE_TTL_SECONDS", "60"))
+)
 
 
 class ConnectionManager:
-    def __init__(self, db_session):
+    def __init__(
+        self,
+        db_session,
+        token_cache: Optional[TTLCache] = None,
+        connection_cache: Optional[TTLCache] = None,
+        bus: Optional[InvalidationBus] = None
+    ):
         self.db = db_session
+        self.bus = bus if bus is not None else invalidation_bus
+        self.token_cache = token_cache if token_cache is not None else default_token_cache
+        self.connection_cache = (
+            connection_cache if connection_cache is not None else default_connection_cache
+        )
     
     def create_connection(
         self,
@@ -27,16 +306,137 @@ class ConnectionManager:
         )
         
         self.db.add(connection)
+        self.bus.publish(self.db, "user", user_id)
         self.db.commit()
         self.db.refresh(connection)
         
         return connection
     
+    def bulk_create_connections(self, items: List[Dict], batch_size: int = 1000) -> List[Dict]:
+        """
+        Insert many connections in one transaction using multi-row INSERTs
+
+        Args:
+            items: Dicts with connector_type, name, user_id and optional config
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            The created connections as dicts, in input order
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "connector_type": item["connector_type"],
+                "name": item["name"],
+                "user_id": item["user_id"],
+                "config": item.get("config") or {},
+                "status": "pending",
+                "created_at": now,
+                "updated_at": now
+            }
+            for item in items
+        ]
+        
+        try:
+            for start in range(0, len(rows), batch_size):
+                self.db.execute(insert(Connection).values(rows[start:start + batch_size]))
+            self.bus.publish_many(self.db, "user", list({row["user_id"] for row in rows}))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return rows
+    
+    def bulk_delete_connections(self, connection_ids: List[str]) -> List[str]:
+        """Delete many connections with their tokens and usage counters using set-based DELETEs. Returns the ids deleted"""
+        if not connection_ids:
+            return []
+        
+        try:
+            self.db.execute(
+                delete(OAuthToken).where(OAuthToken.connection_id.in_(connection_ids)),
+                execution_options={"synchronize_session": False}
+            )
+            self.db.execute(
+                delete(ConnectionUsage).where(ConnectionUsage.connection_id.in_(connection_ids)),
+                execution_options={"synchronize_session": False}
+            )
+            
+            rows = self.db.execute(
+                delete(Connection).where(
+                    Connection.id.in_(connection_ids)
+                ).returning(Connection.id, Connection.user_id),
+                execution_options={"synchronize_session": False}
+            ).all()
+            deleted = [row.id for row in rows]
+            
+            self.bus.publish_many(self.db, "connection", deleted)
+            self.bus.publish_many(self.db, "token", deleted)
+            self.bus.publish_many(self.db, "user", list({row.user_id for row in rows}))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        for connection_id in deleted:
+            self.token_cache.invalidate(connection_id)
+            self.connection_cache.invalidate(connection_id)
+        
+        return list(deleted)
+    
+    def bulk_update_status(self, connection_ids: List[str], status: str) -> List[str]:
+        """Set status on many connections with one UPDATE. Returns the ids updated"""
+        if status not in CONNECTION_STATUSES:
+            raise ValueError(f"Invalid status {status!r}; expected one of {', '.join(CONNECTION_STATUSES)}")
+        
+        if not connection_ids:
+            return []
+        
+        try:
+            rows = self.db.execute(
+                update(Connection).where(
+                    Connection.id.in_(connection_ids)
+                ).values(
+                    status=status,
+                    updated_at=datetime.utcnow()
+                ).returning(Connection.id, Connection.user_id),
+                execution_options={"synchronize_session": False}
+            ).all()
+            updated = [row.id for row in rows]
+            
+            self.bus.publish_many(self.db, "connection", updated)
+            self.bus.publish_many(self.db, "user", list({row.user_id for row in rows}))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        for connection_id in updated:
+            self.connection_cache.invalidate(connection_id)
+        
+        return list(updated)
+    
     def get_connection(self, connection_id: str) -> Optional[Connection]:
         return self.db.query(Connection).filter(
             Connection.id == connection_id
         ).first()
     
+    def get_connection_info(self, connection_id: str) -> Optional[ConnectionInfo]:
+        info = self.connection_cache.get(connection_id)
+        if info is not None:
+            return info
+        
+        connection = self.get_connection(connection_id)
+        if not connection:
+            return None
+        
+        info = ConnectionInfo.from_model(connection)
+        self.connection_cache.set(connection_id, info)
+        
+        return info
+    
     def list_connections(
         self,
         user_id: str,
@@ -51,77 +451,174 @@ class ConnectionManager:
         
         return query.all()
     
+    def list_connections_page(
+        self,
+        user_id: str,
+        connector_type: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List, Optional[str]]:
+        """
+        Return one page of (id, connector_type, name, status, created_at) rows
+        ordered by creation time, and the cursor for the next page if there is one
+        """
+        rows = self.db.execute(
+            connection_page_statement(user_id, connector_type, limit, cursor)
+        ).all()
+        
+        return split_page(rows, limit)
+    
     def update_connection(
         self,
         connection_id: str,
         **kwargs
     ) -> Optional[Connection]:
-        connection = self.get_connection(connection_id)
+        connection = self.db.scalars(
+            update(Connection).where(
+                Connection.id == connection_id
+            ).values(
+                **connection_update_values(kwargs)
+            ).returning(Connection),
+            execution_options={"synchronize_session": "fetch"}
+        ).first()
         
         if not connection:
+            self.db.rollback()
             return None
         
-        for key, value in kwargs.items():
-            if hasattr(connection, key):
-                setattr(connection, key, value)
-        
-        connection.updated_at = datetime.utcnow()
+        self.db.expunge(connection)
+        self.bus.publish(self.db, "connection", connection_id)
+        self.bus.publish(self.db, "user", connection.user_id)
         self.db.commit()
-        self.db.refresh(connection)
+        
+        self.connection_cache.invalidate(connection_id)
         
         return connection
     
     def delete_connection(self, connection_id: str) -> bool:
-        connection = self.get_connection(connection_id)
+        self.db.execute(
+            delete(OAuthToken).where(OAuthToken.connection_id == connection_id),
+            execution_options={"synchronize_session": False}
+        )
+        self.db.execute(
+            delete(ConnectionUsage).where(ConnectionUsage.connection_id == connection_id),
+            execution_options={"synchronize_session": False}
+        )
         
-        if not connection:
-            return False
+        deleted = self.db.execute(
+            delete(Connection).where(
+                Connection.id == connection_id
+            ).returning(Connection.id, Connection.user_id),
+            execution_options={"synchronize_session": False}
+        ).first()
         
-        self.db.query(OAuthToken).filter(
-            OAuthToken.connection_id == connection_id
-        ).delete()
+        if not deleted:
+            self.db.rollback()
+            return False
         
-        self.db.delete(connection)
+        self.bus.publish(self.db, "connection", connection_id)
+        self.bus.publish(self.db, "token", connection_id)
+        self.bus.publish(self.db, "user", deleted.user_id)
         self.db.commit()
         
+        self.token_cache.invalidate(connection_id)
+        self.connection_cache.invalidate(connection_id)
+        
         return True
     
     def store_oauth_token(
         self,
         connection_id: str,
         token_data: Dict
-    ) -> OAuthToken:
-        existing_token = self.db.query(OAuthToken).filter(
-            OAuthToken.connection_id == connection_id
-        ).first()
+    ) -> CachedToken:
+        dialect_insert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
         
-        if existing_token:
-            self.db.delete(existing_token)
+        if dialect_insert is not None:
+            row = self.db.execute(token_upsert_statement(connection_id, token_data, dialect_insert)).one()
+            token = CachedToken.from_row(row)
+        else:
+            existing = self.db.scalars(
+                select(OAuthToken).where(OAuthToken.connection_id == connection_id).with_for_update()
+            ).first()
+            stored = apply_token_values(existing, token_values(connection_id, token_data))
+            self.db.add(stored)
+            self.db.flush()
+            token = CachedToken.from_model(stored)
         
-        from connector_platform.core.oauth_manager import OAuthManager
-        oauth_manager = OAuthManager(self.db)
+        self.bus.publish(self.db, "token", connection_id)
+        self.db.commit()
         
-        expires_at = None
-        if "expires_in" in token_data:
-            expires_at = oauth_manager.calculate_expiry(token_data["expires_in"])
+        self.token_cache.set(connection_id, token, expires_at=token.expires_at)
         
-        token = OAuthToken(
-            id=str(uuid.uuid4()),
-            connection_id=connection_id,
-            access_token=token_data.get("access_token"),
-            refresh_token=token_data.get("refresh_token"),
-            token_type=token_data.get("token_type", "Bearer"),
-            expires_at=expires_at,
-            scope=token_data.get("scope")
-        )
+        return token
+    
+    def get_connection_with_token(
+        self,
+        connection_id: str
+    ) -> Tuple[Optional[ConnectionInfo], Optional[CachedToken]]:
+        info = self.connection_cache.get(connection_id)
+        token = self.token_cache.get(connection_id)
         
-        self.db.add(token)
-        self.db.commit()
-        self.db.refresh(token)
+        if info is not None and token is not None:
+            return info, token
         
-        return token
+        row = self.db.execute(connection_with_token_statement(connection_id)).first()
+        
+        if row is None:
+            return None, None
+        
+        info, token = split_connection_token_row(row)
+        
+        self.connection_cache.set(connection_id, info)
+        if token is not None:
+            self.token_cache.set(connection_id, token, expires_at=token.expires_at)
+        
+        return info, token
     
-    def get_oauth_token(self, connection_id: str) -> Optional[OAuthToken]:
-        return self.db.query(OAuthToken).filter(
+    def get_oauth_token(self, connection_id: str, use_cache: bool = True) -> Optional[CachedToken]:
+        if use_cache:
+            cached = self.token_cache.get(connection_id)
+            if cached is not None:
+                return cached
+        
+        token = self.db.query(OAuthToken).filter(
             OAuthToken.connection_id == connection_id
         ).first()
+        
+        if not token:
+            return None
+        
+        cached = CachedToken.from_model(token)
+        self.token_cache.set(connection_id, cached, expires_at=token.expires_at)
+        
+        return cached
+    
+    def list_expiring_tokens(
+        self,
+        expires_before: datetime,
+        limit: int = 1000,
+        expires_after: Optional[datetime] = None,
+        exclude: Optional[Collection[str]] = None
+    ) -> List[Tuple[str, str, datetime]]:
+        """
+        Return (connection_id, connector_type, expires_at) for refreshable tokens
+        expiring in [expires_after, expires_before], soonest first
+
+        The lower bound and the excluded ids keep tokens that expired long ago or
+        whose refresh keeps failing from filling every batch.
+        """
+        rows = self.db.execute(
+            expiring_tokens_statement(expires_before, limit, expires_after, exclude)
+        ).all()
+        
+        return [tuple(row) for row in rows]
+    
+    def lock_connection(self, connection_id: str):
+        """Take a transaction-scoped lock on the connection, released on commit or rollback"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        
+        self.db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"connection:{connection_id}"}
+        )
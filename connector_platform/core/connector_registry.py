@@ -1,58 +1,231 @@
-from typing import Dict, List, Optional
-import yaml
-import os
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from pathlib import Path
+import os
+import threading
+import logging
+
+from connector_platform.core.config_cache import ConfigSnapshotCache, load_yaml
+from connector_platform.core.compiled_registry import (
+    ConnectorSpec,
+    EndpointSpec,
+    FileStamp,
+    RegistrySnapshot,
+    compile_connector
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_DIR = Path("connector_platform/config/connectors")
 
 
 class ConnectorRegistry:
-    def __init__(self):
-        self.connectors: Dict[str, Dict] = {}
-        self.config_dir = Path("connector_platform/config/connectors")
-    
+    def __init__(self, config_dir: Optional[Path] = None, config_cache: Optional[ConfigSnapshotCache] = None):
+        self.config_dir = Path(config_dir) if config_dir is not None else DEFAULT_CONFIG_DIR
+        self.config_cache = config_cache
+        self._snapshot = RegistrySnapshot((), {})
+        self._reload_lock = threading.Lock()
+        self._rejected: Optional[Tuple[Dict[str, Tuple[int, int]], frozenset]] = None
+
+        self.reloads = 0
+        self.rejected_reloads = 0
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        return self._snapshot
+
+    @property
+    def connectors(self) -> Mapping[str, Mapping]:
+        return self._snapshot.connectors
+
     def load_connector_configs(self):
+        """Load and compile every connector YAML, skipping files that fail to parse or validate"""
         if not self.config_dir.exists():
             return
-        
-        for config_file in self.config_dir.glob("*.yaml"):
-            try:
-                with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
-                    connector_name = config.get("name")
-                    if connector_name:
-                        self.connectors[connector_name] = config
-            except Exception as e:
-                print(f"Error loading connector config {config_file}: {e}")
-    
+
+        with self._reload_lock:
+            specs: Dict[str, ConnectorSpec] = {}
+            files: Dict[str, FileStamp] = {}
+
+            for config_file in sorted(self.config_dir.glob("*.yaml")):
+                try:
+                    stat = config_file.stat()
+                    spec = compile_connector(self._parse(config_file, stat))
+                except Exception as e:
+                    logger.error(f"Error loading connector config {config_file}: {e}")
+                    continue
+
+                files[str(config_file)] = FileStamp(stat.st_mtime_ns, stat.st_size, spec.name)
+                specs[spec.name] = spec
+
+            self._swap(specs, files)
+            self._save_cache()
+
+    def reload(self) -> bool:
+        """
+        Re-parse connector YAMLs that changed since the current snapshot
+
+        Files are compared by mtime and size, so an unchanged directory costs one
+        stat per file, and unchanged connectors keep their compiled specs. If any
+        changed file fails to parse or validate, the current snapshot stays in
+        place, and the rejected files are not parsed or logged again until their
+        mtime or size changes.
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        if not self.config_dir.exists():
+            return False
+
+        with self._reload_lock:
+            current = self._snapshot
+            seen: Dict[str, FileStamp] = {}
+            changed: List[Tuple[str, Path]] = []
+            stats: Dict[str, os.stat_result] = {}
+
+            for config_file in self.config_dir.glob("*.yaml"):
+                path = str(config_file)
+                try:
+                    stat = config_file.stat()
+                except FileNotFoundError:
+                    continue
+
+                previous = current.files.get(path)
+                if previous and (previous.mtime_ns, previous.size) == (stat.st_mtime_ns, stat.st_size):
+                    seen[path] = previous
+                else:
+                    seen[path] = FileStamp(stat.st_mtime_ns, stat.st_size, None)
+                    stats[path] = stat
+                    changed.append((path, config_file))
+
+            removed = [path for path in current.files if path not in seen]
+
+            if not changed and not removed:
+                return False
+
+            # Skip a rejected change set until one of its files changes again
+            attempt = (
+                {path: (stat.st_mtime_ns, stat.st_size) for path, stat in stats.items()},
+                frozenset(removed)
+            )
+            if attempt == self._rejected:
+                return False
+
+            specs = dict(current.specs)
+            for path in removed:
+                name = current.files[path].connector_name
+                if name:
+                    specs.pop(name, None)
+
+            errors = []
+            for path, config_file in changed:
+                previous = current.files.get(path)
+                if previous and previous.connector_name:
+                    specs.pop(previous.connector_name, None)
+
+                try:
+                    spec = compile_connector(self._parse(config_file, stats[path]))
+                except Exception as e:
+                    errors.append(f"{config_file}: {e}")
+                    continue
+
+                seen[path] = seen[path]._replace(connector_name=spec.name)
+                specs[spec.name] = spec
+
+            if errors:
+                self._rejected = attempt
+                self.rejected_reloads += 1
+                logger.error(
+                    "Keeping current connector registry; reload rejected: " + "; ".join(errors)
+                )
+                return False
+
+            self._rejected = None
+            self._swap(specs, seen)
+            self._save_cache()
+            logger.info(
+                f"Reloaded connector registry: {len(changed)} changed, {len(removed)} removed"
+            )
+            return True
+
+    def _parse(self, config_file: Path, stat: os.stat_result) -> Dict:
+        if self.config_cache is not None:
+            config = self.config_cache.load(config_file, stat)
+        else:
+            with open(config_file, 'rb') as f:
+                config = load_yaml(f)
+
+        if not isinstance(config, dict):
+            raise ValueError("connector config must be a mapping")
+
+        return config
+
+    def _save_cache(self):
+        if self.config_cache is not None:
+            self.config_cache.save()
+
+    def _swap(self, specs: Dict[str, ConnectorSpec], files: Dict[str, FileStamp]):
+        self._snapshot = RegistrySnapshot(specs.values(), files, self._snapshot.version + 1)
+        self.reloads += 1
+
     def register_connector(self, name: str, config: Dict):
-        self.connectors[name] = config
-    
-    def get_connector(self, name: str) -> Optional[Dict]:
-        return self.connectors.get(name)
-    
-    def list_connectors(self) -> List[Dict]:
-        return [
-            {
-                "name": name,
-                "display_name": config.get("display_name", name),
-                "description": config.get("description", ""),
-                "auth_type": config.get("auth", {}).get("type"),
-                "version": config.get("version", "1.0.0")
-            }
-            for name, config in self.connectors.items()
-        ]
-    
-    def get_connector_endpoints(self, name: str) -> List[Dict]:
+        spec = compile_connector({**config, "name": name})
+
+        with self._reload_lock:
+            current = self._snapshot
+            specs = dict(current.specs)
+            specs[name] = spec
+            self._swap(specs, dict(current.files))
+
+    def apply_changes(self, upserts: Dict[str, ConnectorSpec], removed: Iterable[str] = ()):
+        """Swap in a snapshot with some connectors replaced or removed, keeping the rest"""
+        with self._reload_lock:
+            current = self._snapshot
+            specs = dict(current.specs)
+            for name in removed:
+                specs.pop(name, None)
+            specs.update(upserts)
+            self._swap(specs, dict(current.files))
+
+    def get_connector(self, name: str) -> Optional[Mapping]:
+        return self._snapshot.connectors.get(name)
+
+    def get_connector_spec(self, name: str) -> Optional[ConnectorSpec]:
+        return self._snapshot.specs.get(name)
+
+    def list_connectors(self) -> List[Mapping]:
+        return list(self._snapshot.summaries)
+
+    def list_connectors_json(self) -> bytes:
+        """Pre-serialized body for GET /api/v1/connectors"""
+        return self._snapshot.summaries_json
+
+    def list_connectors_by_type(self, connector_type: str) -> Tuple[ConnectorSpec, ...]:
+        return self._snapshot.by_type.get(connector_type, ())
+
+    def get_connector_endpoints(self, name: str) -> Tuple[Mapping, ...]:
         connector = self.get_connector(name)
         if not connector:
-            return []
-        
-        return connector.get("endpoints", [])
-    
-    def get_endpoint(self, connector_name: str, endpoint_name: str) -> Optional[Dict]:
-        endpoints = self.get_connector_endpoints(connector_name)
-        
-        for endpoint in endpoints:
-            if endpoint.get("name") == endpoint_name:
-                return endpoint
-        
-        return None
+            return ()
+
+        return connector.get("endpoints", ())
+
+    def get_endpoint(self, connector_name: str, endpoint_name: str) -> Optional[Mapping]:
+        endpoint = self._snapshot.endpoints.get((connector_name, endpoint_name))
+        return endpoint.config if endpoint else None
+
+    def get_endpoint_spec(self, connector_name: str, endpoint_name: str) -> Optional[EndpointSpec]:
+        return self._snapshot.endpoints.get((connector_name, endpoint_name))
+
+    def stats(self) -> Dict:
+        snapshot = self._snapshot
+        stats = {
+            "version": snapshot.version,
+            "connectors": len(snapshot.specs),
+            "endpoints": len(snapshot.endpoints),
+            "files": len(snapshot.files),
+            "reloads": self.reloads,
+            "rejected_reloads": self.rejected_reloads
+        }
+        if self.config_cache is not None:
+            stats["config_cache"] = self.config_cache.stats()
+        return stats
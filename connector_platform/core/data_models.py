@@ -1,9 +1,9 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudStorageFile:
     """Common data model for cloud storage files across providers"""
     id: str
@@ -21,15 +21,26 @@ class CloudStorageFile:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.modified_at:
-            data['modified_at'] = self.modified_at.isoformat()
-        return data
+        created_at = self.created_at
+        modified_at = self.modified_at
+        return {
+            'id': self.id,
+            'name': self.name,
+            'path': self.path,
+            'type': self.type,
+            'size': self.size,
+            'created_at': created_at.isoformat() if created_at else created_at,
+            'modified_at': modified_at.isoformat() if modified_at else modified_at,
+            'mime_type': self.mime_type,
+            'is_folder': self.is_folder,
+            'parent_id': self.parent_id,
+            'download_url': self.download_url,
+            'shared': self.shared,
+            'metadata': self.metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudStorageFileList:
     """Common data model for list of cloud storage files"""
     files: List[CloudStorageFile]
@@ -48,7 +59,7 @@ class CloudStorageFileList:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage:
     """Common data model for email messages"""
     id: str
@@ -71,15 +82,31 @@ class EmailMessage:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.received_at:
-            data['received_at'] = self.received_at.isoformat()
-        if self.sent_at:
-            data['sent_at'] = self.sent_at.isoformat()
-        return data
+        received_at = self.received_at
+        sent_at = self.sent_at
+        return {
+            'id': self.id,
+            'thread_id': self.thread_id,
+            'subject': self.subject,
+            'from_address': self.from_address,
+            'to_addresses': self.to_addresses,
+            'cc_addresses': self.cc_addresses,
+            'bcc_addresses': self.bcc_addresses,
+            'body': self.body,
+            'html_body': self.html_body,
+            'snippet': self.snippet,
+            'received_at': received_at.isoformat() if received_at else received_at,
+            'sent_at': sent_at.isoformat() if sent_at else sent_at,
+            'labels': self.labels,
+            'is_read': self.is_read,
+            'is_starred': self.is_starred,
+            'has_attachments': self.has_attachments,
+            'attachments': self.attachments,
+            'metadata': self.metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessageList:
     """Common data model for list of email messages"""
     messages: List[EmailMessage]
@@ -98,7 +125,7 @@ class EmailMessageList:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketingContact:
     """Common data model for marketing contacts"""
     id: str
@@ -116,15 +143,26 @@ class MarketingContact:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-        return data
+        created_at = self.created_at
+        updated_at = self.updated_at
+        return {
+            'id': self.id,
+            'email': self.email,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'phone': self.phone,
+            'company': self.company,
+            'tags': self.tags,
+            'lists': self.lists,
+            'subscribed': self.subscribed,
+            'created_at': created_at.isoformat() if created_at else created_at,
+            'updated_at': updated_at.isoformat() if updated_at else updated_at,
+            'custom_fields': self.custom_fields,
+            'metadata': self.metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketingCampaign:
     """Common data model for marketing campaigns"""
     id: str
@@ -143,9 +181,21 @@ class MarketingCampaign:
     metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.sent_at:
-            data['sent_at'] = self.sent_at.isoformat()
-        return data
+        created_at = self.created_at
+        sent_at = self.sent_at
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.type,
+            'status': self.status,
+            'subject': self.subject,
+            'from_name': self.from_name,
+            'from_email': self.from_email,
+            'recipients_count': self.recipients_count,
+            'sent_count': self.sent_count,
+            'opened_count': self.opened_count,
+            'clicked_count': self.clicked_count,
+            'created_at': created_at.isoformat() if created_at else created_at,
+            'sent_at': sent_at.isoformat() if sent_at else sent_at,
+            'metadata': self.metadata
+        }
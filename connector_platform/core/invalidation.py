@@ -0,0 +1,271 @@
+from typing import Callable, Dict, List, Optional
+import json
+import os
+import select
+import threading
+import uuid
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "connector_platform_invalidation"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more; leave room for the envelope
+MAX_PAYLOAD_BYTES = 7000
+
+
+class InvalidationBus:
+    """Cross-worker cache invalidation over Postgres LISTEN/NOTIFY"""
+
+    def __init__(self, channel: str = CHANNEL, reconnect_delay: float = 5.0):
+        """
+        Initialize invalidation bus
+
+        Args:
+            channel: Postgres notification channel name
+            reconnect_delay: Seconds to wait before re-subscribing after a lost listener connection
+        """
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.origin = str(uuid.uuid4())
+
+        self._handlers: Dict[str, List[Callable[[str], None]]] = {}
+        self._reset_handlers: List[Callable[[], None]] = []
+        self._watchers: Dict[str, List[Callable[[str], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, kind: str, handler: Callable[[str], None], on_reset: Optional[Callable[[], None]] = None):
+        """
+        Register a local eviction handler
+
+        Args:
+            kind: Invalidation kind, e.g. "token", "connection" or "connector"
+            handler: Called with the invalidated key
+            on_reset: Called when notifications may have been missed and the whole cache must be dropped
+        """
+        with self._lock:
+            self._handlers.setdefault(kind, []).append(handler)
+            if on_reset is not None:
+                self._reset_handlers.append(on_reset)
+
+    def watch(self, kind: str, handler: Callable[[str], None]):
+        """
+        Register a handler for every write of a kind, local or from another worker
+
+        Unlike subscribe handlers, watchers also run for writes published by this worker.
+        """
+        with self._lock:
+            self._watchers.setdefault(kind, []).append(handler)
+
+    def _notify_watchers(self, kind: str, keys: List[str]):
+        with self._lock:
+            watchers = list(self._watchers.get(kind, []))
+
+        for watcher in watchers:
+            for key in keys:
+                try:
+                    watcher(key)
+                except Exception as e:
+                    logger.error(f"Write watcher for {kind} failed: {e}")
+
+    def publish(self, db_session, kind: str, key: str):
+        """
+        Queue an invalidation on the writer's transaction
+
+        Postgres delivers the notification only when the transaction commits,
+        so readers never evict before the new value is visible.
+        """
+        self._notify_watchers(kind, [key])
+
+        if db_session.get_bind().dialect.name != "postgresql":
+            return
+
+        db_session.execute(*self._notify_statement(kind, key))
+
+        with self._lock:
+            self.published += 1
+
+    def publish_many(self, db_session, kind: str, keys: List[str]):
+        """Queue invalidations for many keys, packed into as few notifications as fit"""
+        self._notify_watchers(kind, keys)
+
+        if not keys or db_session.get_bind().dialect.name != "postgresql":
+            return
+
+        for batch in self._batches(keys):
+            payload = json.dumps({"kind": kind, "keys": batch, "origin": self.origin})
+            db_session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": payload}
+            )
+
+        with self._lock:
+            self.published += len(keys)
+
+    def _batches(self, keys: List[str]):
+        # Sized by the JSON encoding (ASCII, so characters are bytes) plus the ", " separator
+        batch, size = [], 0
+        for key in keys:
+            encoded = len(json.dumps(key)) + 2
+            if batch and size + encoded > MAX_PAYLOAD_BYTES:
+                yield batch
+                batch, size = [], 0
+            batch.append(key)
+            size += encoded
+        if batch:
+            yield batch
+
+    async def publish_async(self, db_session, kind: str, key: str):
+        """Async counterpart of publish for AsyncSession writers"""
+        self._notify_watchers(kind, [key])
+
+        if db_session.get_bind().dialect.name != "postgresql":
+            return
+
+        await db_session.execute(*self._notify_statement(kind, key))
+
+        with self._lock:
+            self.published += 1
+
+    def _notify_statement(self, kind: str, key: str):
+        payload = json.dumps({"kind": kind, "key": key, "origin": self.origin})
+        return (
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": payload}
+        )
+
+    def dispatch(self, kind: str, key: str):
+        """Run local handlers for an invalidation"""
+        with self._lock:
+            handlers = list(self._handlers.get(kind, []))
+
+        for handler in handlers:
+            try:
+                handler(key)
+            except Exception as e:
+                logger.error(f"Invalidation handler for {kind} failed: {e}")
+
+    def _reset_all(self):
+        with self._lock:
+            handlers = list(self._reset_handlers)
+
+        for handler in handlers:
+            try:
+                handler()
+            except Exception as e:
+                logger.error(f"Invalidation reset handler failed: {e}")
+
+    def start(self, engine):
+        """Start listening for invalidations from other workers"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        if engine.dialect.name != "postgresql":
+            logger.info("Invalidation bus requires PostgreSQL; cross-worker invalidation disabled")
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_forever,
+            args=(engine,),
+            name="invalidation-listener",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _listen_forever(self, engine):
+        first = True
+
+        while not self._stop.is_set():
+            try:
+                connection = engine.raw_connection()
+            except Exception as e:
+                logger.error(f"Invalidation listener could not connect: {e}")
+                self._stop.wait(self.reconnect_delay)
+                continue
+
+            try:
+                dbapi_connection = connection.dbapi_connection
+                dbapi_connection.autocommit = True
+                cursor = dbapi_connection.cursor()
+                cursor.execute(f'LISTEN "{self.channel}"')
+
+                if not first:
+                    self._reset_all()
+                first = False
+
+                logger.info(f"Listening for cache invalidations on '{self.channel}'")
+                self._poll(dbapi_connection)
+
+            except Exception as e:
+                logger.error(f"Invalidation listener lost connection: {e}")
+                self._stop.wait(self.reconnect_delay)
+
+            finally:
+                try:
+                    connection.invalidate()
+                except Exception:
+                    pass
+
+    def _poll(self, dbapi_connection):
+        while not self._stop.is_set():
+            ready, _, _ = select.select([dbapi_connection], [], [], 1.0)
+            if not ready:
+                continue
+
+            dbapi_connection.poll()
+
+            while dbapi_connection.notifies:
+                notify = dbapi_connection.notifies.pop(0)
+                self._handle_payload(notify.payload)
+
+    def _handle_payload(self, payload: str):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            message = None
+
+        if not isinstance(message, dict):
+            logger.warning(f"Ignoring malformed invalidation payload: {payload!r}")
+            return
+
+        if message.get("origin") == self.origin:
+            return
+
+        kind = message.get("kind")
+        keys = message["keys"] if "keys" in message else [message.get("key")]
+
+        if not isinstance(kind, str) or not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+            logger.warning(f"Ignoring malformed invalidation payload: {payload!r}")
+            return
+
+        with self._lock:
+            self.received += len(keys)
+
+        for key in keys:
+            self.dispatch(kind, key)
+
+        self._notify_watchers(kind, keys)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "listening": bool(self._thread and self._thread.is_alive()),
+                "published": self.published,
+                "received": self.received
+            }
+
+
+invalidation_bus = InvalidationBus(channel=os.getenv("INVALIDATION_CHANNEL", CHANNEL))
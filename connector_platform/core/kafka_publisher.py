@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional
+from collections import deque
 import json
 import logging
 from datetime import datetime
@@ -79,6 +80,7 @@ class KafkaPublisher:
             'connector_name': connector_name,
             'connection_id': connection_id,
             'endpoint_name': endpoint_name,
+            'kind': 'page',
             'timestamp': datetime.utcnow().isoformat(),
             'data': data
         }
@@ -103,10 +105,59 @@ class KafkaPublisher:
             logger.error(f"Failed to publish to Kafka topic '{topic}': {e}")
             return False
     
+    def publish_record(
+        self,
+        connector_type: str,
+        record: Dict[str, Any],
+        connection_id: str,
+        connector_name: str,
+        endpoint_name: str
+    ) -> bool:
+        """
+        Queue one record of a streamed response without waiting for the broker
+        
+        Streamed responses publish one message per record to their own topic,
+        connector-platform.<type>.records, so consumers of the page messages
+        sent by publish() never see them. The envelope matches publish() with
+        kind "record" instead of "page". Delivery failures are logged; call
+        flush() once the stream ends to wait for outstanding sends.
+        
+        Returns:
+            True if the record was queued, False otherwise
+        """
+        if not self.enabled or not self.producer:
+            return False
+        
+        topic = self._get_record_topic_name(connector_type)
+        
+        message = {
+            'connector_type': connector_type,
+            'connector_name': connector_name,
+            'connection_id': connection_id,
+            'endpoint_name': endpoint_name,
+            'kind': 'record',
+            'timestamp': datetime.utcnow().isoformat(),
+            'data': record
+        }
+        
+        try:
+            future = self.producer.send(topic, value=message, key=connection_id)
+            future.add_errback(
+                lambda e: logger.error(f"Failed to publish record to Kafka topic '{topic}': {e}")
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to publish record to Kafka topic '{topic}': {e}")
+            return False
+    
     def _get_topic_name(self, connector_type: str) -> str:
         """Get Kafka topic name for connector type"""
         return f"connector-platform.{connector_type}"
     
+    def _get_record_topic_name(self, connector_type: str) -> str:
+        """Get Kafka topic name for the single-record messages of streamed responses"""
+        return f"connector-platform.{connector_type}.records"
+    
     def flush(self):
         """Flush pending messages"""
         if self.producer:
@@ -122,11 +173,18 @@ class KafkaPublisher:
 class MockKafkaPublisher(KafkaPublisher):
     """Mock Kafka publisher for testing and development"""
     
-    def __init__(self):
-        """Initialize mock publisher"""
+    def __init__(self, max_messages: int = 1000):
+        """
+        Initialize mock publisher
+        
+        Args:
+            max_messages: Most recent messages kept in memory; this is the default
+                publisher when Kafka is disabled, so older messages are discarded
+        """
         self.enabled = True
         self.producer = None
-        self.published_messages = []
+        self.max_messages = max_messages
+        self.published_messages = deque(maxlen=max_messages)
     
     def publish(
         self,
@@ -145,6 +203,7 @@ class MockKafkaPublisher(KafkaPublisher):
             'connector_name': connector_name,
             'connection_id': connection_id,
             'endpoint_name': endpoint_name,
+            'kind': 'page',
             'timestamp': datetime.utcnow().isoformat(),
             'data': data
         }
@@ -157,12 +216,33 @@ class MockKafkaPublisher(KafkaPublisher):
         )
         return True
     
+    def publish_record(
+        self,
+        connector_type: str,
+        record: Dict[str, Any],
+        connection_id: str,
+        connector_name: str,
+        endpoint_name: str
+    ) -> bool:
+        """Mock publish of one streamed record - stores it in memory"""
+        self.published_messages.append({
+            'topic': self._get_record_topic_name(connector_type),
+            'connector_type': connector_type,
+            'connector_name': connector_name,
+            'connection_id': connection_id,
+            'endpoint_name': endpoint_name,
+            'kind': 'record',
+            'timestamp': datetime.utcnow().isoformat(),
+            'data': record
+        })
+        return True
+    
     def get_messages(self, topic: Optional[str] = None) -> list:
         """Get published messages (for testing)"""
         if topic:
             return [m for m in self.published_messages if m['topic'] == topic]
-        return self.published_messages
+        return list(self.published_messages)
     
     def clear(self):
         """Clear published messages"""
-        self.published_messages = []
+        self.published_messages.clear()
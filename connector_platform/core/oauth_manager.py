@@ -1,12 +1,23 @@
 from typing import Dict, Optional
 from datetime import datetime, timedelta
-from authlib.integrations.requests_client import OAuth2Session
+import os
 import uuid
 
+from connector_platform.core.token_client import TokenClientPool
+
+default_token_clients = TokenClientPool(
+    timeout=(
+        float(os.getenv("TOKEN_ENDPOINT_CONNECT_TIMEOUT_SECONDS", "5")),
+        float(os.getenv("TOKEN_ENDPOINT_READ_TIMEOUT_SECONDS", "15"))
+    ),
+    pool_maxsize=int(os.getenv("TOKEN_ENDPOINT_POOL_SIZE", "20"))
+)
+
 
 class OAuthManager:
-    def __init__(self, db_session):
+    def __init__(self, db_session, token_clients: Optional[TokenClientPool] = None):
         self.db = db_session
+        self.token_clients = token_clients if token_clients is not None else default_token_clients
     
     def generate_authorization_url(
         self,
@@ -21,7 +32,7 @@ class OAuthManager:
         auth_url = connector_config.get("auth_url")
         scope = connector_config.get("scope", [])
         
-        if isinstance(scope, list):
+        if isinstance(scope, (list, tuple)):
             scope = " ".join(scope)
         
         params = {
@@ -52,19 +63,13 @@ class OAuthManager:
         client_secret = connector_config.get("client_secret")
         token_url = connector_config.get("token_url")
         
-        client = OAuth2Session(
-            client_id=client_id,
-            client_secret=client_secret,
-            redirect_uri=redirect_uri
-        )
-        
-        token = client.fetch_token(
-            token_url,
+        return self.token_clients.get(token_url).request_token(
+            client_id,
+            client_secret,
             grant_type="authorization_code",
-            code=code
+            code=code,
+            redirect_uri=redirect_uri
         )
-        
-        return token
     
     def refresh_access_token(
         self,
@@ -75,23 +80,18 @@ class OAuthManager:
         client_secret = connector_config.get("client_secret")
         token_url = connector_config.get("token_url")
         
-        client = OAuth2Session(
-            client_id=client_id,
-            client_secret=client_secret
-        )
-        
-        token = client.fetch_token(
-            token_url,
+        return self.token_clients.get(token_url).request_token(
+            client_id,
+            client_secret,
             grant_type="refresh_token",
             refresh_token=refresh_token
         )
-        
-        return token
     
-    def is_token_expired(self, expires_at: datetime) -> bool:
+    def is_token_expired(self, expires_at: datetime, skew_seconds: float = 0) -> bool:
         if not expires_at:
             return False
-        return datetime.utcnow() >= expires_at
+        return datetime.utcnow() + timedelta(seconds=skew_seconds) >= expires_at
     
-    def calculate_expiry(self, expires_in: int) -> datetime:
-        return datetime.utcnow() + timedelta(seconds=expires_in)
+    @staticmethod
+    def calculate_expiry(expires_in: int) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=int(expires_in))
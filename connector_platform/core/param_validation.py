@@ -0,0 +1,208 @@
+"""
+Request parameter validators compiled from endpoint ParameterSchema definitions
+
+Each endpoint's YAML parameters are turned once, at registry load, into a
+ParameterValidator holding per-location tuples of (name, coercer, required,
+default). Validating a call is then a few dict lookups per declared
+parameter, with no schema interpretation on the request path.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+class ParameterError(ValueError):
+    """Raised when a call's parameters do not match the endpoint definition"""
+
+    def __init__(self, errors: List[Dict]):
+        self.errors = errors
+        super().__init__("; ".join(f"{e['location']}.{e['name']}: {e['error']}" for e in errors))
+
+
+def _coerce_str(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError("expected a string")
+
+
+def _coerce_int(value):
+    if isinstance(value, bool):
+        raise TypeError("expected an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise TypeError("expected an integer")
+
+
+def _coerce_float(value):
+    if isinstance(value, bool):
+        raise TypeError("expected a number")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise TypeError("expected a number")
+
+
+_TRUE = {"true", "1", "yes"}
+_FALSE = {"false", "0", "no"}
+
+
+def _coerce_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise TypeError("expected a boolean")
+
+
+def _coerce_dict(value):
+    if isinstance(value, dict):
+        return value
+    raise TypeError("expected an object")
+
+
+def _coerce_list(value):
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError("expected a list")
+
+
+def _passthrough(value):
+    return value
+
+
+def _thaw(value):
+    """Copy read-only mappings and tuples from the frozen registry into plain dicts and lists"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "str": _coerce_str,
+    "string": _coerce_str,
+    "int": _coerce_int,
+    "integer": _coerce_int,
+    "float": _coerce_float,
+    "number": _coerce_float,
+    "bool": _coerce_bool,
+    "boolean": _coerce_bool,
+    "dict": _coerce_dict,
+    "object": _coerce_dict,
+    "list": _coerce_list,
+    "array": _coerce_list,
+}
+
+Rule = Tuple[str, Callable[[Any], Any], bool, Any]
+
+LOCATIONS = ("query", "path", "body")
+
+
+class ParameterValidator:
+    """Coerces, checks and defaults one endpoint's query, path and body parameters"""
+
+    __slots__ = ("query", "path", "body")
+
+    def __init__(self, parameters: Iterable[Mapping]):
+        """
+        Compile validation rules
+
+        Args:
+            parameters: Endpoint parameter definitions as in ParameterSchema. Header
+                parameters are not supplied by callers and are not checked.
+        """
+        rules: Dict[str, List[Rule]] = {location: [] for location in LOCATIONS}
+
+        for parameter in parameters:
+            location = parameter.get("location", "query")
+            if location not in rules:
+                continue
+
+            default = parameter.get("default")
+            if default is not None:
+                default = COERCERS.get(parameter.get("type"), _passthrough)(_thaw(default))
+
+            rules[location].append((
+                parameter["name"],
+                COERCERS.get(parameter.get("type"), _passthrough),
+                bool(parameter.get("required", False)),
+                default
+            ))
+
+        self.query: Tuple[Rule, ...] = tuple(rules["query"])
+        self.path: Tuple[Rule, ...] = tuple(rules["path"])
+        self.body: Tuple[Rule, ...] = tuple(rules["body"])
+
+    def validate(
+        self,
+        params: Optional[Dict] = None,
+        path_params: Optional[Dict] = None,
+        body: Optional[Dict] = None
+    ) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+        """
+        Validate a call and return new parameter dicts with coerced values and defaults
+
+        Parameters not declared for the endpoint are passed through unchanged.
+
+        Raises:
+            ParameterError: Listing every missing or mistyped parameter
+        """
+        errors: List[Dict] = []
+
+        params = _apply(self.query, "query", params, errors)
+        path_params = _apply(self.path, "path", path_params, errors)
+        if self.body:
+            if body is not None and not isinstance(body, dict):
+                errors.append({"location": "body", "name": "", "error": "expected an object"})
+            else:
+                body = _apply(self.body, "body", body, errors)
+
+        if errors:
+            raise ParameterError(errors)
+
+        return params, path_params, body
+
+
+def _apply(rules: Tuple[Rule, ...], location: str, values: Optional[Dict], errors: List[Dict]) -> Optional[Dict]:
+    if not rules:
+        return values
+
+    result = dict(values) if values else {}
+
+    for name, coerce, required, default in rules:
+        value = result.get(name)
+
+        if value is None:
+            if default is not None:
+                # A fresh copy, so a caller mutating an object or list default cannot change the next call's
+                result[name] = _thaw(default)
+            elif required:
+                errors.append({"location": location, "name": name, "error": "required"})
+            continue
+
+        try:
+            result[name] = coerce(value)
+        except TypeError as e:
+            errors.append({"location": location, "name": name, "error": str(e)})
+
+    return result if result or values is not None else None
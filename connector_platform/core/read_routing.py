@@ -0,0 +1,60 @@
+from typing import Dict
+import threading
+import logging
+
+from connector_platform.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ReadRouter:
+    """Routes read-only sessions to a replica unless the data was written recently"""
+
+    def __init__(
+        self,
+        primary_session_factory,
+        replica_session_factory=None,
+        read_your_writes_seconds: float = 5.0,
+        max_tracked_keys: int = 100000
+    ):
+        """
+        Initialize read router
+
+        Args:
+            primary_session_factory: Callable returning a primary database session
+            replica_session_factory: Callable returning a replica session, or None to always use the primary
+            read_your_writes_seconds: How long reads of a written key stay on the primary; should exceed replica lag
+            max_tracked_keys: Maximum number of recently written keys remembered
+        """
+        self.primary_session_factory = primary_session_factory
+        self.replica_session_factory = replica_session_factory
+        self._recent_writes = TTLCache(max_size=max_tracked_keys, ttl_seconds=read_your_writes_seconds)
+        self._lock = threading.Lock()
+        self._counters = {"replica": 0, "primary": 0, "primary_recent_write": 0}
+
+    def mark_written(self, key: str):
+        """Pin reads of key to the primary for the read-your-writes window"""
+        self._recent_writes.set(key, True)
+
+    def session_for(self, *keys: str):
+        """Return a new session on the replica, or on the primary if any key was written recently"""
+        if self.replica_session_factory is None:
+            route = "primary"
+        elif any(self._recent_writes.get(key) for key in keys):
+            route = "primary_recent_write"
+        else:
+            route = "replica"
+
+        with self._lock:
+            self._counters[route] += 1
+
+        if route == "replica":
+            return self.replica_session_factory()
+        return self.primary_session_factory()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counters = dict(self._counters)
+        counters["replica_configured"] = self.replica_session_factory is not None
+        counters["tracked_writes"] = len(self._recent_writes)
+        return counters
@@ -0,0 +1,324 @@
+"""
+Fleet-wide connector registry backed by the connector_metadata table
+
+One publisher (the deploy job, or a worker with REGISTRY_PUBLISH_ENABLED)
+writes validated configs to connector_metadata. Every changed row gets the
+next value of a global revision sequence. Workers remember the highest
+revision they have applied and fetch only newer rows, woken by a
+"connector" invalidation or by a periodic poll.
+"""
+from typing import Callable, Dict, Iterable, List, Optional
+import hashlib
+import json
+import threading
+import uuid
+import logging
+
+from sqlalchemy import func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from connector_platform.database import ConnectorMetadata
+from connector_platform.core.compiled_registry import ConnectorSpec, compile_connector
+from connector_platform.core.invalidation import InvalidationBus, invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+REVISION_SEQUENCE = "connector_metadata_revision_seq"
+PUBLISH_LOCK_ID = 7203312
+
+
+def _next_revision():
+    return func.nextval(REVISION_SEQUENCE)
+
+
+def _published_values(spec: ConnectorSpec) -> Dict:
+    return {
+        "name": spec.name,
+        "display_name": spec.display_name,
+        "description": spec.description,
+        "version": spec.version,
+        "auth_type": spec.auth_type or "oauth2",
+        "config_schema": json.loads(spec.config_json),
+        "enabled": True,
+        "content_hash": hashlib.sha256(spec.config_json).hexdigest()
+    }
+
+
+def publish_connectors(
+    db_session,
+    specs: Iterable[ConnectorSpec],
+    bus: Optional[InvalidationBus] = None,
+    prune: bool = True
+) -> List[str]:
+    """
+    Write connector configs to connector_metadata, bumping the revision of changed rows only
+
+    On Postgres, publishers serialize on an advisory lock, so revisions become
+    visible in the order they were assigned and a worker never skips one.
+    Other databases take revisions from MAX(revision) and rely on the database
+    serializing writers, which is enough for a single publisher.
+
+    Args:
+        db_session: Session on the primary database
+        specs: Compiled, validated connectors to publish
+        bus: Invalidation bus used to wake workers; defaults to the shared bus
+        prune: Disable published connectors missing from specs
+
+    Returns:
+        Names of connectors whose published config changed
+    """
+    bus = bus if bus is not None else invalidation_bus
+    specs = list(specs)
+
+    if db_session.get_bind().dialect.name == "postgresql":
+        changed = _publish_upsert(db_session, specs, prune)
+    else:
+        changed = _publish_rows(db_session, specs, prune)
+
+    if changed:
+        bus.publish_many(db_session, "connector", changed)
+
+    db_session.commit()
+
+    if changed:
+        logger.info(f"Published {len(changed)} connector configs: {', '.join(changed)}")
+
+    return changed
+
+
+def _publish_upsert(db_session, specs: List[ConnectorSpec], prune: bool) -> List[str]:
+    """Postgres: one INSERT .. ON CONFLICT with revisions from the sequence"""
+    db_session.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": PUBLISH_LOCK_ID})
+
+    changed: List[str] = []
+
+    if specs:
+        rows = [
+            {"id": str(uuid.uuid4()), **_published_values(spec), "revision": _next_revision()}
+            for spec in specs
+        ]
+
+        statement = pg_insert(ConnectorMetadata).values(rows)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[ConnectorMetadata.name],
+            set_={
+                "display_name": excluded.display_name,
+                "description": excluded.description,
+                "version": excluded.version,
+                "auth_type": excluded.auth_type,
+                "config_schema": excluded.config_schema,
+                "enabled": True,
+                "content_hash": excluded.content_hash,
+                "revision": excluded.revision,
+                "updated_at": func.now()
+            },
+            where=or_(
+                ConnectorMetadata.content_hash.is_distinct_from(excluded.content_hash),
+                ConnectorMetadata.enabled.is_not(True)
+            )
+        ).returning(ConnectorMetadata.name)
+
+        changed.extend(db_session.execute(statement).scalars())
+
+    if prune:
+        result = db_session.execute(
+            update(ConnectorMetadata).where(
+                ConnectorMetadata.name.notin_([spec.name for spec in specs]),
+                ConnectorMetadata.enabled.is_(True)
+            ).values(
+                enabled=False,
+                revision=_next_revision(),
+                updated_at=func.now()
+            ).returning(ConnectorMetadata.name),
+            execution_options={"synchronize_session": False}
+        )
+        changed.extend(result.scalars())
+
+    return changed
+
+
+def _publish_rows(db_session, specs: List[ConnectorSpec], prune: bool) -> List[str]:
+    """Other databases: compare content hashes row by row, revisions from MAX(revision)"""
+    published = {
+        row.name: row
+        for row in db_session.scalars(select(ConnectorMetadata).with_for_update())
+    }
+    revision = max((row.revision for row in published.values()), default=0)
+
+    changed: List[str] = []
+
+    for spec in specs:
+        values = _published_values(spec)
+        row = published.get(spec.name)
+        if row is not None and row.enabled and row.content_hash == values["content_hash"]:
+            continue
+
+        revision += 1
+        if row is None:
+            db_session.add(ConnectorMetadata(id=str(uuid.uuid4()), revision=revision, **values))
+        else:
+            for key, value in values.items():
+                setattr(row, key, value)
+            row.revision = revision
+        changed.append(spec.name)
+
+    if prune:
+        names = {spec.name for spec in specs}
+        for name, row in published.items():
+            if name not in names and row.enabled:
+                revision += 1
+                row.enabled = False
+                row.revision = revision
+                changed.append(name)
+
+    db_session.flush()
+    return changed
+
+
+class ConnectorMetadataSync:
+    """Keeps a ConnectorRegistry in step with connector_metadata"""
+
+    def __init__(
+        self,
+        registry,
+        session_factory: Callable,
+        poll_interval_seconds: float = 30.0
+    ):
+        """
+        Initialize sync
+
+        Args:
+            registry: ConnectorRegistry to update
+            session_factory: Callable returning a new database session
+            poll_interval_seconds: Seconds between checks for new revisions when no
+                notification arrives; bounds staleness if a notification is missed
+        """
+        self.registry = registry
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+
+        self.revision = 0
+        # Connectors whose published revision failed to compile, retried on every sync
+        self._failed: Dict[str, int] = {}
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.syncs = 0
+        self.connectors_loaded = 0
+        self.failures = 0
+
+    def sync(self) -> int:
+        """
+        Apply connector revisions newer than the last one seen
+
+        Rows that fail to compile are recorded and retried on later syncs
+        until they compile or a newer revision replaces them.
+
+        Returns:
+            Number of connectors added, changed or removed
+        """
+        with self._sync_lock:
+            db = self.session_factory()
+            try:
+                rows = db.execute(
+                    select(
+                        ConnectorMetadata.name,
+                        ConnectorMetadata.enabled,
+                        ConnectorMetadata.config_schema,
+                        ConnectorMetadata.revision
+                    ).where(
+                        or_(
+                            ConnectorMetadata.revision > self.revision,
+                            ConnectorMetadata.name.in_(list(self._failed))
+                        )
+                    ).order_by(ConnectorMetadata.revision)
+                ).all()
+            finally:
+                db.close()
+
+            self.syncs += 1
+
+            if not rows:
+                return 0
+
+            upserts: Dict[str, ConnectorSpec] = {}
+            removed: List[str] = []
+
+            for name, enabled, config, revision in rows:
+                upserts.pop(name, None)
+                retrying = self._failed.pop(name, None) == revision
+                if not enabled:
+                    removed.append(name)
+                    continue
+                try:
+                    upserts[name] = compile_connector(config)
+                except Exception as e:
+                    self._failed[name] = revision
+                    if not retrying:
+                        self.failures += 1
+                        logger.error(f"Skipping published connector {name} at revision {revision}: {e}")
+
+            self.revision = max(self.revision, rows[-1].revision)
+
+            if not upserts and not removed:
+                return 0
+
+            self.registry.apply_changes(upserts, removed)
+            self.connectors_loaded += len(upserts)
+
+            logger.info(
+                f"Connector registry at revision {self.revision}: "
+                f"{len(upserts)} updated, {len(removed)} removed"
+            )
+
+            return len(upserts) + len(removed)
+
+    def notify(self, key: str = ""):
+        """Invalidation watcher: a connector changed somewhere in the fleet"""
+        self._wake.set()
+
+    def start(self):
+        """Load the published registry, then keep it current in the background"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        try:
+            self.sync()
+        except Exception as e:
+            logger.error(f"Initial connector registry sync failed: {e}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="connector-metadata-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_interval_seconds)
+            self._wake.clear()
+
+            if self._stop.is_set():
+                break
+
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Connector registry sync failed: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "revision": self.revision,
+            "syncs": self.syncs,
+            "connectors_loaded": self.connectors_loaded,
+            "failures": self.failures,
+            "failed_connectors": sorted(self._failed)
+        }
@@ -0,0 +1,169 @@
+"""
+Incremental parsing of list responses, one item at a time
+
+Provider list responses are one JSON object holding an array of items
+({"value": [...]} for OneDrive, {"entries": [...]} for Dropbox). JsonItemStream
+reads such a body from a file-like object in chunks and yields the array's
+items as each one is complete, so a page never has to be held in memory as a
+whole. Each item is decoded with the C scanner behind json.loads; only the
+object and array punctuation along the path to the items is walked in Python.
+"""
+from typing import Any, Dict, Iterator, Sequence
+import codecs
+import json
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class JsonItemStream:
+    """
+    Iterates the items of one array inside a JSON document
+
+    After iteration, `remainder` holds every other value of the document, with
+    the items array replaced by range(count), and `count` the number of items.
+    """
+
+    def __init__(self, fp, items_path: Sequence[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize stream
+
+        Args:
+            fp: Binary file-like object with a read(size) method, such as a
+                streamed requests response's raw body
+            items_path: Keys leading from the top-level object to the array
+            chunk_size: Bytes read per call
+        """
+        self.fp = fp
+        self.items_path = tuple(items_path)
+        self.chunk_size = chunk_size
+
+        self.remainder: Dict[str, Any] = {}
+        self.count = 0
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._peek() != "{":
+            raise ValueError("expected a JSON object")
+        yield from self._walk(self.remainder, self.items_path)
+
+        if self._peek():
+            raise ValueError("unexpected data after JSON document")
+
+    def _walk(self, container: Dict[str, Any], keys: Sequence[str]) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("expected an object key")
+            self._expect(":")
+
+            if key == keys[0] and len(keys) > 1 and self._peek() == "{":
+                nested: Dict[str, Any] = {}
+                container[key] = nested
+                yield from self._walk(nested, keys[1:])
+            elif key == keys[0] and len(keys) == 1 and self._peek() == "[":
+                yield from self._items()
+                container[key] = range(self.count)
+            else:
+                container[key] = self._value()
+
+            separator = self._peek()
+            self._position += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or '}}' at offset {self._position}")
+
+    def _items(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield self._value()
+            self.count += 1
+
+            separator = self._peek()
+            self._position += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"expected ',' or ']' at offset {self._position}")
+
+    def _value(self) -> Any:
+        """Decode the complete JSON value at the current position"""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill(len(self._buffer) - self._position)
+                continue
+
+            # A number or literal ending at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill(len(self._buffer) - self._position)
+                continue
+
+            self._position = end
+            return value
+
+    def _expect(self, character: str):
+        if self._peek() != character:
+            raise ValueError(f"expected '{character}' at offset {self._position}")
+        self._position += 1
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the document"""
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self._position = position
+
+            if position < len(buffer):
+                return buffer[position]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def _fill(self, at_least: int = 0):
+        """
+        Read more input, dropping what has been consumed
+
+        Reads until `at_least` more characters are buffered, so a value that
+        spans many chunks is re-scanned a logarithmic number of times rather than
+        once per chunk.
+        """
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+
+        target = len(self._buffer) + max(at_least, 1)
+        parts = [self._buffer]
+        size = len(self._buffer)
+
+        while size < target and not self._eof:
+            data = self.fp.read(self.chunk_size)
+            text = self._decoder.decode(data or b"", final=not data)
+            if not data:
+                self._eof = True
+            parts.append(text)
+            size += len(text)
+
+        self._buffer = "".join(parts)
+
@@ -0,0 +1,161 @@
+"""
+Shared timestamp parsing for transformers
+
+ISO-8601 values go straight to the C datetime.fromisoformat, which is faster
+than any cache lookup. Everything slower - RFC 2822 dates and every
+conversion to an ISO string, where isoformat() dominates - is memoized in a
+bounded LRU cache keyed by the raw value, since provider listings repeat the
+same timestamps many times (a folder synced at once, a batch of messages).
+datetime objects are immutable, so cached results are safe to share.
+
+    parse_iso / parse_rfc2822 / parse_epoch_ms   -> datetime or None
+    iso_timestamp / rfc2822_timestamp / epoch_ms_timestamp
+                                                 -> ISO-8601 string or None
+
+Unparseable values return None, matching the transformers' previous behavior.
+That includes values of the wrong type (a number where a string is expected,
+a list or object), which are rejected before parsing or caching.
+"""
+from typing import Callable, Dict, Optional, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import sys
+
+CACHE_SIZE = 32768
+
+# Python 3.11+ fromisoformat accepts "Z" and the other ISO-8601 forms providers send
+_NATIVE_ISO = sys.version_info >= (3, 11)
+
+_MONTHS = {
+    name: f"{index:02d}"
+    for index, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1
+    )
+}
+_UTC = timezone.utc
+
+_TEXT = (str,)
+_EPOCH = (str, int, float)
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    try:
+        if _NATIVE_ISO:
+            return datetime.fromisoformat(value)
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _fast_rfc2822(value: str) -> Optional[datetime]:
+    """
+    Parse the common "Mon, 13 Jan 2025 10:00:00 +0000" form by rewriting it as
+    ISO-8601 for the C fromisoformat; None for anything else
+    """
+    parts = value.split()
+    if parts and parts[0][-1:] == ",":
+        del parts[0]
+    if len(parts) > 5 and parts[5][:1] == "(":
+        del parts[5:]
+    if len(parts) != 5:
+        return None
+
+    day, month, year, clock, zone = parts
+    month = _MONTHS.get(month.lower())
+    if (
+        month is None
+        or len(year) != 4
+        or len(day) > 2
+        or len(clock) != 8
+        or len(zone) != 5
+        or zone[0] not in "+-"
+        or zone == "-0000"
+    ):
+        return None
+
+    try:
+        return datetime.fromisoformat(f"{year}-{month}-{day:0>2}T{clock}{zone[:3]}:{zone[3:]}")
+    except ValueError:
+        return None
+
+
+def _parse_rfc2822(value: str) -> Optional[datetime]:
+    parsed = _fast_rfc2822(value)
+    if parsed is not None:
+        return parsed
+    try:
+        return parsedate_to_datetime(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_epoch_ms(value: Union[str, int]) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(int(value) / 1000, tz=_UTC)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+_cached_rfc2822 = lru_cache(maxsize=CACHE_SIZE)(_parse_rfc2822)
+
+
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp such as OneDrive's "2025-01-15T10:30:00Z" """
+    return _parse_iso(value) if value and isinstance(value, str) else None
+
+
+def parse_rfc2822(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 2822 date such as a Gmail Date header"""
+    return _cached_rfc2822(value) if value and isinstance(value, str) else None
+
+
+def parse_epoch_ms(value: Optional[Union[str, int]]) -> Optional[datetime]:
+    """Parse milliseconds since the epoch, such as Gmail's internalDate"""
+    return _parse_epoch_ms(value) if value and isinstance(value, _EPOCH) else None
+
+
+def _isoformat(parse: Callable[..., Optional[datetime]], accepts: tuple) -> Callable[..., Optional[str]]:
+    @lru_cache(maxsize=CACHE_SIZE)
+    def cached(value):
+        parsed = parse(value)
+        return parsed.isoformat() if parsed else None
+
+    def to_iso(value):
+        return cached(value) if value and isinstance(value, accepts) else None
+
+    to_iso.cache_info = cached.cache_info
+    to_iso.cache_clear = cached.cache_clear
+    return to_iso
+
+
+iso_timestamp = _isoformat(_parse_iso, _TEXT)
+rfc2822_timestamp = _isoformat(_parse_rfc2822, _TEXT)
+epoch_ms_timestamp = _isoformat(_parse_epoch_ms, _EPOCH)
+
+
+def keep_raw(value):
+    """Pass a timestamp through unparsed, normalizing empty values to None"""
+    return value if value else None
+
+
+_CACHES = {
+    "rfc2822": _cached_rfc2822,
+    "iso_string": iso_timestamp,
+    "rfc2822_string": rfc2822_timestamp,
+    "epoch_ms_string": epoch_ms_timestamp,
+}
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """Hit and miss counts per parser cache"""
+    stats = {}
+    for name, cached in _CACHES.items():
+        info = cached.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
+
+
+def clear_caches():
+    for cached in _CACHES.values():
+        cached.cache_clear()
@@ -0,0 +1,163 @@
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+import base64
+import threading
+import time
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+
+logger = logging.getLogger(__name__)
+
+
+class TokenEndpointError(Exception):
+    """Raised when an OAuth token endpoint rejects a request"""
+
+    def __init__(self, error: str, description: Optional[str] = None, status_code: Optional[int] = None):
+        self.error = error
+        self.description = description
+        self.status_code = status_code
+        message = f"{error}: {description}" if description else error
+        super().__init__(message)
+
+
+class ClientSecretBasic(AuthBase):
+    """HTTP Basic client authentication with form-urlencoded credentials (RFC 6749 section 2.3.1)"""
+
+    def __init__(self, client_id: Optional[str], client_secret: Optional[str]):
+        credentials = f"{quote(client_id or '', safe='')}:{quote(client_secret or '', safe='')}"
+        self.header = "Basic " + base64.b64encode(credentials.encode("ascii")).decode("ascii")
+
+    def __call__(self, request):
+        request.headers["Authorization"] = self.header
+        return request
+
+
+class TokenEndpointClient:
+    """Long-lived, connection-pooled HTTP client for a single OAuth token endpoint"""
+
+    def __init__(
+        self,
+        token_url: str,
+        timeout: Tuple[float, float] = (5.0, 15.0),
+        pool_maxsize: int = 20
+    ):
+        """
+        Initialize token endpoint client
+
+        Args:
+            token_url: Provider token endpoint URL
+            timeout: (connect, read) timeout in seconds
+            pool_maxsize: Maximum pooled keep-alive connections to the endpoint
+        """
+        self.token_url = token_url
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.total_latency_ms = 0.0
+
+    def request_token(self, client_id: str, client_secret: str, **form) -> Dict:
+        """
+        POST a token request authenticated with client_secret_basic
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            **form: Grant parameters (grant_type, code, redirect_uri, refresh_token, ...)
+
+        Returns:
+            Parsed token response
+        """
+        started = time.perf_counter()
+        failed = True
+
+        try:
+            response = self.session.post(
+                self.token_url,
+                data={k: v for k, v in form.items() if v is not None},
+                auth=ClientSecretBasic(client_id, client_secret),
+                timeout=self.timeout
+            )
+
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {}
+
+            if response.status_code >= 400 or "error" in payload:
+                raise TokenEndpointError(
+                    payload.get("error", f"http_{response.status_code}"),
+                    payload.get("error_description"),
+                    response.status_code
+                )
+
+            if "access_token" not in payload:
+                raise TokenEndpointError("invalid_response", "Missing access_token", response.status_code)
+
+            failed = False
+            return payload
+
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self.requests += 1
+                self.total_latency_ms += elapsed_ms
+                if failed:
+                    self.errors += 1
+
+    def stats(self) -> Dict:
+        """Return request counters for this endpoint"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "avg_latency_ms": self.total_latency_ms / self.requests if self.requests else 0.0
+            }
+
+    def close(self):
+        self.session.close()
+
+
+class TokenClientPool:
+    """Shares one TokenEndpointClient per token URL across requests"""
+
+    def __init__(self, timeout: Tuple[float, float] = (5.0, 15.0), pool_maxsize: int = 20):
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self._clients: Dict[str, TokenEndpointClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token_url: str) -> TokenEndpointClient:
+        client = self._clients.get(token_url)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(token_url)
+            if client is None:
+                client = TokenEndpointClient(token_url, self.timeout, self.pool_maxsize)
+                self._clients[token_url] = client
+                logger.debug(f"Created pooled token client for {token_url}")
+            return client
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return per-endpoint counters"""
+        with self._lock:
+            clients = dict(self._clients)
+        return {url: client.stats() for url, client in clients.items()}
+
+    def close(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
@@ -0,0 +1,168 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+import logging
+
+from connector_platform.core.connection_manager import CachedToken
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one execution whose result is shared"""
+
+    def __init__(self, wait_timeout: Optional[float] = 60.0):
+        """
+        Initialize single-flight group
+
+        Args:
+            wait_timeout: Seconds a waiter blocks on the in-flight call before giving up
+        """
+        self.wait_timeout = wait_timeout
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn for key unless a call for key is already in flight, in which case wait for it"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            if not call.event.wait(self.wait_timeout):
+                raise TimeoutError(f"Timed out waiting for in-flight call for {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return execution and deduplication counters"""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executions": self.executions,
+                "shared": self.shared
+            }
+
+
+default_refresh_flight = SingleFlight()
+
+
+class TokenRefresher:
+    """Refreshes OAuth tokens at most once per connection across threads and processes"""
+
+    def __init__(self, oauth_manager, connection_manager, single_flight: Optional[SingleFlight] = None):
+        self.oauth_manager = oauth_manager
+        self.connection_manager = connection_manager
+        self.single_flight = single_flight if single_flight is not None else default_refresh_flight
+
+    def refresh(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        stale_token: Optional[CachedToken] = None,
+        min_valid_seconds: float = 0
+    ) -> CachedToken:
+        """
+        Return a fresh token for connection_id, refreshing it if nobody else already has
+
+        Concurrent callers in this process share one refresh. Across processes the
+        refresh is serialized with a database lock on the connection, and callers that
+        acquire the lock after another worker refreshed reuse the stored token.
+
+        Args:
+            connection_id: Connection ID
+            connector_config: Connector OAuth configuration (client_id, client_secret, token_url)
+            stale_token: Token the caller found to be unusable, if any
+            min_valid_seconds: Refresh the stored token if it expires within this many seconds
+
+        Returns:
+            The current valid token
+        """
+        return self.single_flight.do(
+            connection_id,
+            lambda: self._refresh_locked(
+                connection_id,
+                connector_config,
+                stale_token,
+                min_valid_seconds
+            )
+        )
+
+    def _refresh_locked(
+        self,
+        connection_id: str,
+        connector_config: Dict,
+        stale_token: Optional[CachedToken],
+        min_valid_seconds: float
+    ) -> CachedToken:
+        db = self.connection_manager.db
+
+        try:
+            self.connection_manager.lock_connection(connection_id)
+
+            current = self.connection_manager.get_oauth_token(connection_id, use_cache=False)
+
+            if not current:
+                raise ValueError("No authentication token found for this connection")
+
+            if self._already_refreshed(current, stale_token, min_valid_seconds):
+                db.commit()
+                logger.debug(f"Reusing token refreshed by another worker for {connection_id}")
+                return current
+
+            if not current.refresh_token:
+                raise ValueError("Token expired and no refresh token available")
+
+            token_data = dict(self.oauth_manager.refresh_access_token(
+                connector_config,
+                current.refresh_token
+            ))
+
+            if not token_data.get("refresh_token"):
+                token_data["refresh_token"] = current.refresh_token
+
+            return self.connection_manager.store_oauth_token(connection_id, token_data)
+
+        except BaseException:
+            db.rollback()
+            raise
+
+    def _already_refreshed(
+        self,
+        current: CachedToken,
+        stale_token: Optional[CachedToken],
+        min_valid_seconds: float
+    ) -> bool:
+        if self.oauth_manager.is_token_expired(current.expires_at, skew_seconds=min_valid_seconds):
+            return False
+
+        if stale_token is None:
+            return True
+
+        return current.access_token != stale_token.access_token
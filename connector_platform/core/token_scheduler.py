@@ -0,0 +1,237 @@
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import heapq
+import random
+import threading
+import time
+import logging
+
+from connector_platform.core.connection_manager import ConnectionManager
+from connector_platform.core.oauth_manager import OAuthManager
+from connector_platform.core.token_refresh import TokenRefresher
+from connector_platform.core.utils import build_connector_auth_config
+
+logger = logging.getLogger(__name__)
+
+
+class ProactiveTokenRefresher:
+    """Background scheduler that refreshes OAuth tokens shortly before they expire"""
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        registry,
+        skew_seconds: float = 300,
+        interval_seconds: float = 60,
+        jitter_seconds: float = 30,
+        max_concurrency_per_provider: int = 4,
+        batch_size: int = 1000,
+        failure_backoff_seconds: float = 300,
+        expired_grace_seconds: float = 3600
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            session_factory: Callable returning a new database session
+            registry: ConnectorRegistry used to resolve provider OAuth settings
+            skew_seconds: Refresh tokens this many seconds before they expire
+            interval_seconds: Seconds between scans of oauth_tokens
+            jitter_seconds: Maximum random delay added before each refresh
+            max_concurrency_per_provider: Maximum refreshes in flight per connector type
+            batch_size: Maximum tokens picked up per scan
+            failure_backoff_seconds: Seconds to wait before retrying a token whose refresh failed
+            expired_grace_seconds: Tokens that expired longer ago than this are left to
+                on-demand refresh, so dead tokens cannot crowd live ones out of a batch
+        """
+        self.session_factory = session_factory
+        self.registry = registry
+        self.skew_seconds = skew_seconds
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self.max_concurrency_per_provider = max_concurrency_per_provider
+        self.batch_size = batch_size
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self.expired_grace_seconds = expired_grace_seconds
+
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._scheduled: Set[str] = set()
+        self._queue: List[Tuple[float, str, str]] = []
+        self._failed_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.refreshed = 0
+        self.failed = 0
+
+    def start(self):
+        """Start the background scan loop"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="proactive-token-refresher",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Proactive token refresher started "
+            f"(skew={self.skew_seconds}s, interval={self.interval_seconds}s)"
+        )
+
+    def stop(self, timeout: Optional[float] = 10):
+        """Stop the scan loop and wait for in-flight refreshes"""
+        self._stop.set()
+
+        if self._thread:
+            self._thread.join(timeout)
+
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._executors.clear()
+
+    def _run(self):
+        next_scan = 0.0
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+
+            if now >= next_scan:
+                try:
+                    self.run_once()
+                except Exception as e:
+                    logger.error(f"Proactive token refresh scan failed: {e}")
+                next_scan = now + self.interval_seconds
+
+            self._dispatch_due()
+
+            with self._lock:
+                next_due = self._queue[0][0] if self._queue else next_scan
+
+            self._stop.wait(max(0.0, min(next_due, next_scan) - time.monotonic()))
+
+    def run_once(self) -> int:
+        """
+        Scan for tokens expiring within the next skew + interval and queue their refresh
+
+        Each refresh is due skew seconds before its token expires, plus a random
+        jitter so that tokens issued together are not refreshed together. Tokens
+        already queued or backing off after a failed refresh are excluded from the
+        scan, so the batch is filled with tokens that can actually be refreshed.
+
+        Returns:
+            Number of refreshes queued
+        """
+        utc_now = datetime.utcnow()
+        horizon = utc_now + timedelta(seconds=self.skew_seconds + self.interval_seconds)
+        oldest = utc_now - timedelta(seconds=self.expired_grace_seconds)
+        now = time.monotonic()
+        queued = 0
+
+        with self._lock:
+            for connection_id in [c for c, until in self._failed_until.items() if until <= now]:
+                del self._failed_until[connection_id]
+            exclude = self._scheduled | self._failed_until.keys()
+
+        db = self.session_factory()
+        try:
+            expiring = ConnectionManager(db).list_expiring_tokens(
+                horizon,
+                limit=self.batch_size,
+                expires_after=oldest,
+                exclude=exclude
+            )
+        finally:
+            db.close()
+
+        for connection_id, connector_type, expires_at in expiring:
+            seconds_left = (expires_at - utc_now).total_seconds()
+            delay = max(0.0, seconds_left - self.skew_seconds) + random.uniform(0, self.jitter_seconds)
+            delay = min(delay, max(0.0, seconds_left - 1))
+
+            with self._lock:
+                if connection_id in self._scheduled:
+                    continue
+                if self._failed_until.get(connection_id, 0) > now:
+                    continue
+                self._scheduled.add(connection_id)
+                heapq.heappush(self._queue, (now + delay, connection_id, connector_type))
+
+            queued += 1
+
+        return queued
+
+    def _dispatch_due(self):
+        now = time.monotonic()
+
+        while True:
+            with self._lock:
+                if not self._queue or self._queue[0][0] > now:
+                    return
+                _, connection_id, connector_type = heapq.heappop(self._queue)
+
+            self._executor_for(connector_type).submit(
+                self._refresh_one,
+                connection_id,
+                connector_type
+            )
+
+    def _executor_for(self, connector_type: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(connector_type)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency_per_provider,
+                    thread_name_prefix=f"token-refresh-{connector_type}"
+                )
+                self._executors[connector_type] = executor
+            return executor
+
+    def _refresh_one(self, connection_id: str, connector_type: str):
+        try:
+            if self._stop.is_set():
+                return
+
+            connector = self.registry.get_connector(connector_type)
+            if not connector:
+                raise ValueError(f"Connector not found: {connector_type}")
+
+            db = self.session_factory()
+            try:
+                refresher = TokenRefresher(OAuthManager(db), ConnectionManager(db))
+                refresher.refresh(
+                    connection_id,
+                    build_connector_auth_config(connector),
+                    min_valid_seconds=self.skew_seconds
+                )
+            finally:
+                db.close()
+
+            with self._lock:
+                self.refreshed += 1
+                self._failed_until.pop(connection_id, None)
+
+        except Exception as e:
+            logger.warning(f"Proactive refresh failed for connection {connection_id}: {e}")
+            with self._lock:
+                self.failed += 1
+                self._failed_until[connection_id] = time.monotonic() + self.failure_backoff_seconds
+
+        finally:
+            with self._lock:
+                self._scheduled.discard(connection_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Return scheduler counters"""
+        with self._lock:
+            return {
+                "scheduled": len(self._scheduled),
+                "queued": len(self._queue),
+                "refreshed": self.refreshed,
+                "failed": self.failed,
+                "backing_off": len(self._failed_until)
+            }
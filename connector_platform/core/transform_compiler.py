@@ -0,0 +1,470 @@
+"""
+Compile declarative `transform:` mappings from connector YAML into extractor functions
+
+A connector YAML may map its endpoint responses onto the common data models:
+
+    transform:
+      list_files:
+        model: cloud_storage_file
+        items: value
+        fields:
+          id: {path: id, default: ""}
+          modified_at: {path: lastModifiedDateTime, as: datetime}
+          is_folder: {exists: folder}
+        list_fields:
+          next_cursor: ["@odata.nextLink"]
+
+With `items`, the response is a list shape and the result has the layout of
+the model's list wrapper (e.g. CloudStorageFileList.to_dict); without it the
+whole response is a single item. Each mapping is compiled once into Python
+source and exec'd, so transforming an item is one generated function call
+with inlined dict lookups rather than an interpretation of the mapping.
+
+Field specs:
+    "a.b" or [a, b]          value at a path (a list for keys containing dots)
+    {path, default}          value at a path, default when missing
+    {path, equals: x}        whether the value at a path equals x
+    {const: value}           constant
+    {exists: path, then, else}  whether the last key is present, or then/else
+    {not_null: path}         whether the value is present and not null
+    {first: [paths], default}  first truthy value
+    {format: "{a.b}/{c}"}    string built from paths, missing parts are ""
+    {lookup: path, match, key, value, default}  entry in a list of name/value pairs
+    {contains: x, path, negate}  whether a list at path contains x
+    {count: path}            length of a list at path
+    {list: [specs]}          list of values
+    {fields: {...}}          nested object
+    as: datetime | rfc2822 | epoch_ms | list | parent_path   post-processing for any spec;
+                             timestamps become ISO-8601 strings (see timestamps.py),
+                             list wraps a non-empty value, parent_path drops the last segment
+    keep_raw: true           with a timestamp conversion, pass the provider's value through
+                             unparsed (columnar output still parses to typed timestamps)
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import MISSING, fields as dataclass_fields
+import ast
+from connector_platform.core import timestamps
+from connector_platform.core.data_models import (
+    CloudStorageFile, CloudStorageFileList,
+    EmailMessage, EmailMessageList,
+    MarketingContact, MarketingCampaign
+)
+
+# model name -> (item model, items key, list-level fields) for list shapes
+MODELS: Dict[str, Tuple[type, Optional[str], Tuple[str, ...]]] = {
+    "cloud_storage_file": (
+        CloudStorageFile, "files", tuple(f.name for f in dataclass_fields(CloudStorageFileList))[1:]
+    ),
+    "email_message": (
+        EmailMessage, "messages", tuple(f.name for f in dataclass_fields(EmailMessageList))[1:]
+    ),
+    "marketing_contact": (MarketingContact, None, ()),
+    "marketing_campaign": (MarketingCampaign, None, ()),
+}
+
+EMPTY: Mapping = {}
+EMPTY_LIST: Tuple = ()
+
+
+def _as_list(value) -> Optional[List]:
+    return [value] if value else None
+
+
+def _parent_path(value) -> Optional[str]:
+    if value and '/' in value:
+        return value.rsplit('/', 1)[0]
+    return None
+
+
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "datetime": timestamps.iso_timestamp,
+    "rfc2822": timestamps.rfc2822_timestamp,
+    "epoch_ms": timestamps.epoch_ms_timestamp,
+    "list": _as_list,
+    "parent_path": _parent_path,
+}
+
+# Column output keeps timestamps as datetime objects for typed timestamp columns
+COLUMN_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    **CONVERTERS,
+    "datetime": timestamps.parse_iso,
+    "rfc2822": timestamps.parse_rfc2822,
+    "epoch_ms": timestamps.parse_epoch_ms,
+}
+
+TIMESTAMP_CONVERSIONS = ("datetime", "rfc2822", "epoch_ms")
+
+
+class _Codegen:
+    """Accumulates generated expressions and the constants they reference"""
+
+    def __init__(self, converters: Mapping[str, Callable[[Any], Any]] = CONVERTERS):
+        self.converters = converters
+        self.namespace: Dict[str, Any] = {
+            "EMPTY": EMPTY,
+            "EMPTY_LIST": EMPTY_LIST,
+            "_thaw": _thaw,
+        }
+        self.prelude: List[str] = []
+        self._lookups: Dict[Tuple, str] = {}
+
+    def bind(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def literal(self, value: Any) -> str:
+        """Constant from the mapping; lists and objects are rebuilt per call so results never share them"""
+        if not isinstance(value, (Mapping, list, tuple)):
+            return self.bind(value)
+
+        value = _thaw(value)
+        source = repr(value)
+        try:
+            if ast.literal_eval(source) == value:
+                return source
+        except (ValueError, SyntaxError):
+            pass
+
+        # Dates, timestamps, nan and inf have no literal form; copy a bound constant instead
+        return f"_thaw({self.bind(value)})"
+
+    def path(self, var: str, path, default: Any = None) -> str:
+        keys = _split_path(path)
+        expression = var
+        for key in keys[:-1]:
+            expression = f"({expression}.get({key!r}) or EMPTY)"
+        if default is None:
+            return f"{expression}.get({keys[-1]!r})"
+        return f"{expression}.get({keys[-1]!r}, {self.literal(default)})"
+
+    def lookup(self, var: str, spec: Mapping) -> str:
+        source = (var, tuple(_split_path(spec["lookup"])), spec.get("key", "name"), spec.get("value", "value"))
+        name = self._lookups.get(source)
+        if name is None:
+            name = f"_l{len(self._lookups)}"
+            self._lookups[source] = name
+            self.prelude.append(
+                f"{name} = {{entry.get({source[2]!r}): entry.get({source[3]!r}) "
+                f"for entry in ({self.path(var, spec['lookup'])} or EMPTY_LIST)}}"
+            )
+        default = spec.get("default")
+        if default is None:
+            return f"{name}.get({spec['match']!r})"
+        return f"{name}.get({spec['match']!r}, {self.literal(default)})"
+
+    def field(self, var: str, spec: Any) -> str:
+        if isinstance(spec, (str, list, tuple)):
+            return self.path(var, spec)
+
+        if not isinstance(spec, Mapping):
+            raise ValueError(f"invalid field spec: {spec!r}")
+
+        expression = self._field_expression(var, spec)
+
+        converter = spec.get("as")
+        if spec.get("keep_raw") and converter in TIMESTAMP_CONVERSIONS and self.converters is CONVERTERS:
+            expression = f"{self.bind(timestamps.keep_raw)}({expression})"
+        elif converter is not None:
+            if converter not in self.converters:
+                raise ValueError(f"unknown conversion '{converter}'")
+            expression = f"{self.bind(self.converters[converter])}({expression})"
+
+        return expression
+
+    def _field_expression(self, var: str, spec: Mapping) -> str:
+        if "const" in spec:
+            return self.literal(spec["const"])
+
+        if "path" in spec and "contains" not in spec:
+            expression = self.path(var, spec["path"], spec.get("default"))
+            if "equals" in spec:
+                return f"({expression} == {self.literal(spec['equals'])})"
+            return expression
+
+        if "exists" in spec:
+            keys = _split_path(spec["exists"])
+            container = self.path(var, keys[:-1], EMPTY) if len(keys) > 1 else var
+            test = f"({keys[-1]!r} in {container})"
+            if "then" in spec or "else" in spec:
+                return f"({self.literal(spec.get('then', True))} if {test} else {self.literal(spec.get('else', False))})"
+            return test
+
+        if "not_null" in spec:
+            return f"({self.path(var, spec['not_null'])} is not None)"
+
+        if "first" in spec:
+            options = [self.path(var, path) for path in spec["first"]]
+            if spec.get("default") is not None:
+                options.append(self.literal(spec["default"]))
+            return "(" + " or ".join(options) + ")"
+
+        if "format" in spec:
+            return self._format(var, spec["format"])
+
+        if "lookup" in spec:
+            return self.lookup(var, spec)
+
+        if "contains" in spec:
+            operator = "not in" if spec.get("negate") else "in"
+            return f"({self.literal(spec['contains'])} {operator} ({self.path(var, spec['path'])} or EMPTY_LIST))"
+
+        if "count" in spec:
+            return f"len({self.path(var, spec['count'])} or EMPTY_LIST)"
+
+        if "list" in spec:
+            return "[" + ", ".join(self.field(var, item) for item in spec["list"]) + "]"
+
+        if "fields" in spec:
+            return self.object(var, spec["fields"])
+
+        raise ValueError(f"invalid field spec: {dict(spec)!r}")
+
+    def _format(self, var: str, template: str) -> str:
+        parts = []
+        rest = template
+        while rest:
+            start = rest.find("{")
+            if start < 0:
+                parts.append(repr(rest))
+                break
+            end = rest.index("}", start)
+            if start:
+                parts.append(repr(rest[:start]))
+            parts.append(self.path(var, rest[start + 1:end], ""))
+            rest = rest[end + 1:]
+        return "(" + " + ".join(parts or ["''"]) + ")"
+
+    def object(self, var: str, field_specs: Mapping) -> str:
+        entries = [f"{name!r}: {self.field(var, spec)}" for name, spec in field_specs.items()]
+        return "{" + ", ".join(entries) + "}"
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _split_path(path) -> List[str]:
+    keys = list(path) if isinstance(path, (list, tuple)) else str(path).split(".")
+    if not keys:
+        raise ValueError("empty path")
+    return keys
+
+
+def _model_expressions(codegen: _Codegen, var: str, model: type, field_specs: Mapping) -> List[Tuple[str, str]]:
+    """(field name, generated expression) for every model field, in to_dict order"""
+    known = {f.name: f for f in dataclass_fields(model)}
+    unknown = set(field_specs) - set(known)
+    if unknown:
+        raise ValueError(f"unknown {model.__name__} fields: {', '.join(sorted(unknown))}")
+
+    expressions = []
+    for name, field in known.items():
+        if name in field_specs:
+            expression = codegen.field(var, field_specs[name])
+        elif field.default is not MISSING:
+            expression = codegen.literal(field.default)
+        else:
+            raise ValueError(f"required {model.__name__} field '{name}' is not mapped")
+        expressions.append((name, expression))
+
+    return expressions
+
+
+def _model_entries(codegen: _Codegen, var: str, model: type, field_specs: Mapping) -> str:
+    """Generated dict literal with every model field, in to_dict order"""
+    expressions = _model_expressions(codegen, var, model, field_specs)
+    return "{" + ", ".join(f"{name!r}: {expression}" for name, expression in expressions) + "}"
+
+
+def _exec(codegen: _Codegen, source: str, filename: str, function_name: str) -> Callable:
+    exec(compile(source, filename, "exec"), codegen.namespace)
+    return codegen.namespace[function_name]
+
+
+def _model(spec: Mapping) -> Tuple[str, type, Optional[str], Tuple[str, ...]]:
+    model_name = spec.get("model")
+    if model_name not in MODELS:
+        raise ValueError(f"unknown transform model '{model_name}'")
+    return (model_name, *MODELS[model_name])
+
+
+class StreamingTransform:
+    """
+    Item-at-a-time form of a list mapping
+
+    records() yields one common-model record per source item as the items are
+    parsed, and summary() builds the list-level fields (has_more, cursors,
+    counts) from the rest of the response once the items have been consumed.
+    """
+
+    __slots__ = ("items_path", "items_key", "extract", "summarize")
+
+    def __init__(self, items_path: Tuple[str, ...], items_key: str, extract: Callable, summarize: Callable):
+        self.items_path = items_path
+        self.items_key = items_key
+        self.extract = extract
+        self.summarize = summarize
+
+    def records(self, items: Iterable[Mapping]) -> Iterator[Dict[str, Any]]:
+        extract = self.extract
+        for item in items:
+            yield extract(item)
+
+    def summary(self, remainder: Mapping, count: int) -> Dict[str, Any]:
+        """
+        List-level fields for a response whose items were streamed
+
+        Args:
+            remainder: The response without its items; the items array may be
+                replaced by any sized placeholder, such as range(count)
+            count: Number of records yielded
+        """
+        return self.summarize(remainder, count)
+
+
+def _compile(spec: Mapping) -> Tuple[Callable[[Any], Dict[str, Any]], Optional[StreamingTransform]]:
+    model_name, model, items_key, list_fields = _model(spec)
+    items_path = spec.get("items")
+    item_fields = spec.get("fields", EMPTY)
+
+    item_codegen = _Codegen()
+    # generating the body fills the prelude, so it comes first
+    body = _model_entries(item_codegen, 'item', model, item_fields)
+    item_source = "\n".join([
+        "def extract(item):",
+        *(f"    {line}" for line in item_codegen.prelude),
+        f"    return {body}",
+    ])
+    extract = _exec(item_codegen, item_source, f"<transform {model_name}>", "extract")
+
+    if items_path is None:
+        return extract, None
+
+    if items_key is None:
+        raise ValueError(f"model '{model_name}' has no list shape")
+
+    list_specs = spec.get("list_fields", EMPTY)
+    unknown = set(list_specs) - set(list_fields)
+    if unknown:
+        raise ValueError(f"unknown list fields: {', '.join(sorted(unknown))}")
+
+    codegen = _Codegen()
+
+    entries = []
+    for name in list_fields:
+        if name == "total_count":
+            if name in list_specs:
+                entries.append(f"'total_count': _count if (_count := {codegen.field('data', list_specs[name])}) is not None else count")
+            else:
+                entries.append("'total_count': count")
+        elif name in list_specs:
+            entries.append(f"{name!r}: {codegen.field('data', list_specs[name])}")
+        elif name == "has_more":
+            entries.append("'has_more': False")
+        else:
+            entries.append(f"{name!r}: None")
+
+    source = "\n".join([
+        "def summarize(data, count):",
+        *(f"    {line}" for line in codegen.prelude),
+        "    return {" + ", ".join(entries) + "}",
+        "",
+        "def transform(data):",
+        f"    records = [extract(item) for item in ({codegen.path('data', items_path)} or EMPTY_LIST)]",
+        f"    return {{{items_key!r}: records, **summarize(data, len(records))}}",
+    ])
+    codegen.namespace["extract"] = extract
+    transform = _exec(codegen, source, f"<transform {model_name} list>", "transform")
+
+    stream = StreamingTransform(tuple(_split_path(items_path)), items_key, extract, codegen.namespace["summarize"])
+    return transform, stream
+
+
+def compile_transform(spec: Mapping) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compile one endpoint's transform mapping
+
+    Raises:
+        ValueError: If the mapping names an unknown model or field, or leaves a
+            required model field unmapped
+    """
+    return _compile(spec)[0]
+
+
+class ColumnExtractor:
+    """
+    Appends the mapped fields of each item straight into one list per model field
+
+    Compiled from the same mapping as compile_transform, but builds no dict per
+    item, so large listings can be handed to a columnar writer batch by batch.
+    Timestamps are kept as datetime objects.
+    """
+
+    def __init__(self, spec: Mapping):
+        model_name, self.model, _, _ = _model(spec)
+        items_path = spec.get("items")
+
+        codegen = _Codegen(COLUMN_CONVERTERS)
+        expressions = _model_expressions(codegen, "item", self.model, spec.get("fields", EMPTY))
+        self.fields: Tuple[str, ...] = tuple(name for name, _ in expressions)
+        self.columns: List[List[Any]] = [[] for _ in self.fields]
+        codegen.namespace["columns"] = self.columns
+
+        # Every value of an item is computed before any is appended, so an item
+        # that fails part-way leaves the columns the same length
+        source = "\n".join([
+            "def extend(records):",
+            *(f"    append{index} = columns[{index}].append" for index in range(len(expressions))),
+            "    count = 0",
+            "    for item in records:",
+            *(f"        {line}" for line in codegen.prelude),
+            *(f"        value{index} = {expression}" for index, (_, expression) in enumerate(expressions)),
+            *(f"        append{index}(value{index})" for index in range(len(expressions))),
+            "        count += 1",
+            "    return count",
+        ])
+        self.extend: Callable[[Iterable[Mapping]], int] = _exec(
+            codegen, source, f"<columns {model_name}>", "extend"
+        )
+
+        if items_path is None:
+            self.items: Callable[[Any], Iterable[Mapping]] = lambda data: (data,)
+        else:
+            items_codegen = _Codegen()
+            self.items = _exec(
+                items_codegen,
+                f"def items(data):\n    return {items_codegen.path('data', items_path)} or EMPTY_LIST",
+                f"<items {model_name}>",
+                "items"
+            )
+
+    def take(self) -> List[List[Any]]:
+        """Return the accumulated columns and start new ones"""
+        taken = list(self.columns)
+        for index in range(len(self.columns)):
+            self.columns[index] = []
+        return taken
+
+
+def compile_transforms(
+    transforms: Mapping,
+    endpoint_names
+) -> Dict[str, Tuple[Callable, Optional[StreamingTransform]]]:
+    """Compile a connector's `transform:` section into (transform, streaming form) per endpoint name"""
+    unknown = set(transforms) - set(endpoint_names)
+    if unknown:
+        raise ValueError(f"transform for unknown endpoints: {', '.join(sorted(unknown))}")
+
+    compiled = {}
+    for endpoint_name, spec in transforms.items():
+        try:
+            compiled[endpoint_name] = _compile(spec)
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"transform.{endpoint_name}: {e}")
+
+    return compiled
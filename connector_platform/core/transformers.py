@@ -1,5 +1,5 @@
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List
+from .timestamps import parse_iso, parse_rfc2822
 from .data_models import (
     CloudStorageFile, CloudStorageFileList,
     EmailMessage, EmailMessageList,
@@ -75,8 +75,8 @@ class CloudStorageTransformer(BaseTransformer):
             path=item.get('parentReference', {}).get('path', '') + '/' + item.get('name', ''),
             type='file' if 'file' in item else 'folder',
             size=item.get('size'),
-            created_at=self._parse_datetime(item.get('createdDateTime')),
-            modified_at=self._parse_datetime(item.get('lastModifiedDateTime')),
+            created_at=parse_iso(item.get('createdDateTime')),
+            modified_at=parse_iso(item.get('lastModifiedDateTime')),
             mime_type=item.get('file', {}).get('mimeType'),
             is_folder='folder' in item,
             parent_id=item.get('parentReference', {}).get('id'),
@@ -99,7 +99,7 @@ class CloudStorageTransformer(BaseTransformer):
             type=tag,
             size=entry.get('size'),
             created_at=None,
-            modified_at=self._parse_datetime(entry.get('client_modified') or entry.get('server_modified')),
+            modified_at=parse_iso(entry.get('client_modified') or entry.get('server_modified')),
             mime_type=None,
             is_folder=tag == 'folder',
             parent_id=entry.get('path_lower', '').rsplit('/', 1)[0] if '/' in entry.get('path_lower', '') else None,
@@ -110,15 +110,6 @@ class CloudStorageTransformer(BaseTransformer):
                 'content_hash': entry.get('content_hash')
             }
         )
-    
-    def _parse_datetime(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse ISO datetime string"""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            return None
 
 
 class EmailTransformer(BaseTransformer):
@@ -185,7 +176,7 @@ class EmailTransformer(BaseTransformer):
             to_addresses=[headers.get('To', '')],
             cc_addresses=cc_addresses,
             snippet=msg.get('snippet'),
-            received_at=self._parse_gmail_date(headers.get('Date')),
+            received_at=parse_rfc2822(headers.get('Date')),
             labels=msg.get('labelIds', []),
             is_read='UNREAD' not in msg.get('labelIds', []),
             is_starred='STARRED' in msg.get('labelIds', []),
@@ -195,16 +186,6 @@ class EmailTransformer(BaseTransformer):
                 'internal_date': msg.get('internalDate')
             }
         )
-    
-    def _parse_gmail_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse Gmail date header"""
-        if not date_str:
-            return None
-        try:
-            from email.utils import parsedate_to_datetime
-            return parsedate_to_datetime(date_str)
-        except (ValueError, TypeError):
-            return None
 
 
 class MarketingTransformer(BaseTransformer):
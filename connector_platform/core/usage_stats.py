@@ -0,0 +1,231 @@
+from typing import Callable, Dict, Iterable, List, Optional
+from datetime import datetime
+import threading
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from connector_platform.database import Connection, ConnectionUsage
+
+logger = logging.getLogger(__name__)
+
+CALLS, ERRORS, BYTES_SENT, BYTES_RECEIVED, LAST_USED = range(5)
+
+COUNTERS = ("call_count", "error_count", "bytes_sent", "bytes_received")
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE, and their two-argument maximum;
+# anything else is merged row by row with SELECT ... FOR UPDATE
+UPSERT_DIALECTS = {
+    "postgresql": (pg_insert, func.greatest),
+    "sqlite": (sqlite_insert, func.max),
+}
+
+
+def usage_upsert_statement(rows: List[Dict], dialect_insert=pg_insert, greatest=func.greatest):
+    """One INSERT ... ON CONFLICT DO UPDATE adding rows' counters to the stored ones"""
+    statement = dialect_insert(ConnectionUsage).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[ConnectionUsage.connection_id],
+        set_={
+            **{
+                name: getattr(ConnectionUsage, name) + getattr(statement.excluded, name)
+                for name in COUNTERS
+            },
+            "last_used_at": greatest(ConnectionUsage.last_used_at, statement.excluded.last_used_at),
+            "updated_at": statement.excluded.updated_at
+        }
+    )
+
+
+class UsageAggregator:
+    """Accumulates per-connection usage counters in memory and flushes them in one batched upsert"""
+
+    def __init__(self, session_factory: Callable, flush_interval_seconds: float = 10.0):
+        """
+        Initialize aggregator
+
+        Args:
+            session_factory: Callable returning a new database session
+            flush_interval_seconds: Seconds between flushes; at most this much data is lost if a worker dies
+        """
+        self.session_factory = session_factory
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._pending: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.flushes = 0
+        self.flush_failures = 0
+        self.rows_flushed = 0
+
+    def record(
+        self,
+        connection_id: str,
+        success: bool,
+        bytes_sent: int = 0,
+        bytes_received: int = 0
+    ):
+        """Count one proxied call; never touches the database"""
+        now = datetime.utcnow()
+
+        with self._lock:
+            entry = self._pending.get(connection_id)
+            if entry is None:
+                entry = [0, 0, 0, 0, now]
+                self._pending[connection_id] = entry
+
+            entry[CALLS] += 1
+            if not success:
+                entry[ERRORS] += 1
+            entry[BYTES_SENT] += bytes_sent
+            entry[BYTES_RECEIVED] += bytes_received
+            entry[LAST_USED] = now
+
+    def pending_for(self, connection_id: str) -> Optional[Dict]:
+        """Counters recorded by this worker that are not flushed yet"""
+        with self._lock:
+            entry = self._pending.get(connection_id)
+            return self._as_dict(entry) if entry else None
+
+    def discard(self, connection_ids: Iterable[str]):
+        """Forget unflushed counters for deleted connections so a flush cannot recreate their rows"""
+        with self._lock:
+            for connection_id in connection_ids:
+                self._pending.pop(connection_id, None)
+
+    def flush(self) -> int:
+        """
+        Write all pending counters with a single INSERT ... ON CONFLICT DO UPDATE,
+        or row by row on databases without it
+
+        Counters for connections that no longer exist (deleted through another
+        worker) are dropped rather than written as orphan rows.
+
+        Returns:
+            Number of connections flushed
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "connection_id": connection_id,
+                "call_count": entry[CALLS],
+                "error_count": entry[ERRORS],
+                "bytes_sent": entry[BYTES_SENT],
+                "bytes_received": entry[BYTES_RECEIVED],
+                "last_used_at": entry[LAST_USED],
+                "updated_at": now
+            }
+            for connection_id, entry in sorted(pending.items())
+        ]
+
+        db = self.session_factory()
+        try:
+            existing = set(db.scalars(
+                select(Connection.id).where(Connection.id.in_([row["connection_id"] for row in rows]))
+            ))
+            rows = [row for row in rows if row["connection_id"] in existing]
+
+            if rows:
+                upsert = UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+                if upsert is not None:
+                    db.execute(usage_upsert_statement(rows, *upsert))
+                else:
+                    self._merge_rows(db, rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self._merge_back(pending)
+            with self._lock:
+                self.flush_failures += 1
+            logger.error(f"Usage statistics flush failed, will retry: {e}")
+            return 0
+        finally:
+            db.close()
+
+        with self._lock:
+            self.flushes += 1
+            self.rows_flushed += len(rows)
+
+        return len(rows)
+
+    @staticmethod
+    def _merge_rows(db, rows: List[Dict]):
+        stored = {
+            usage.connection_id: usage
+            for usage in db.scalars(
+                select(ConnectionUsage).where(
+                    ConnectionUsage.connection_id.in_([row["connection_id"] for row in rows])
+                ).with_for_update()
+            )
+        }
+
+        for row in rows:
+            usage = stored.get(row["connection_id"])
+            if usage is None:
+                db.add(ConnectionUsage(**row))
+                continue
+            for name in COUNTERS:
+                setattr(usage, name, getattr(usage, name) + row[name])
+            if usage.last_used_at is None or row["last_used_at"] > usage.last_used_at:
+                usage.last_used_at = row["last_used_at"]
+            usage.updated_at = row["updated_at"]
+
+    def _merge_back(self, pending: Dict[str, List]):
+        with self._lock:
+            for connection_id, entry in pending.items():
+                current = self._pending.get(connection_id)
+                if current is None:
+                    self._pending[connection_id] = entry
+                    continue
+                for index in (CALLS, ERRORS, BYTES_SENT, BYTES_RECEIVED):
+                    current[index] += entry[index]
+                current[LAST_USED] = max(current[LAST_USED], entry[LAST_USED])
+
+    def start(self):
+        """Start the periodic flush loop"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="usage-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10):
+        """Stop the loop and flush whatever is pending"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval_seconds):
+            self.flush()
+
+    @staticmethod
+    def _as_dict(entry: List) -> Dict:
+        return {
+            "call_count": entry[CALLS],
+            "error_count": entry[ERRORS],
+            "bytes_sent": entry[BYTES_SENT],
+            "bytes_received": entry[BYTES_RECEIVED],
+            "last_used_at": entry[LAST_USED]
+        }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "pending_connections": len(self._pending),
+                "flushes": self.flushes,
+                "flush_failures": self.flush_failures,
+                "rows_flushed": self.rows_flushed
+            }
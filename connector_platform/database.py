@@ -1,18 +1,65 @@
-from sqlalchemy import create_engine, Column, String, Text, DateTime, JSON, Boolean
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, make_url, Column, String, Text, DateTime, JSON, Boolean, BigInteger, Index, text
+from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
+import threading
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def engine_options() -> dict:
+    """Connection pool settings shared by the sync and async engines"""
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+
+def async_database_url(url: str) -> str:
+    """Rewrite a postgresql:// URL to use the asyncpg driver"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            url = "postgresql+asyncpg://" + url[len(prefix):]
+            break
+    return url.replace("sslmode=", "ssl=")
+
+
+def async_database_enabled() -> bool:
+    """The async engine needs asyncpg, so it is only used when the database is PostgreSQL"""
+    url = os.getenv("ASYNC_DATABASE_URL", DATABASE_URL)
+    return bool(url) and make_url(async_database_url(url)).get_backend_name() == "postgresql"
+
+
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+
 Base = declarative_base()
 
+# Engines are created on first use so importing the app does not load the
+# DBAPI driver or build connection pools before they are needed
+_engine_lock = threading.Lock()
+_engine = None
+_SessionLocal = None
+_read_engine = None
+_ReadSessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+
 
 class Connection(Base):
     __tablename__ = "connections"
+    __table_args__ = (
+        Index("ix_connections_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index(
+            "ix_connections_user_id_connector_type_created_at_id",
+            "user_id",
+            "connector_type",
+            "created_at",
+            "id"
+        ),
+    )
     
     id = Column(String, primary_key=True)
     connector_type = Column(String, nullable=False)
@@ -20,12 +67,21 @@ class Connection(Base):
     user_id = Column(String, nullable=False)
     status = Column(String, default="active")
     config = Column(JSON, default={})
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Part of the (created_at, id) pagination key; a NULL would drop the row from every page
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class OAuthToken(Base):
     __tablename__ = "oauth_tokens"
+    __table_args__ = (
+        Index("ux_oauth_tokens_connection_id", "connection_id", unique=True),
+        Index(
+            "ix_oauth_tokens_expires_at_refreshable",
+            "expires_at",
+            postgresql_where=text("refresh_token IS NOT NULL")
+        ),
+    )
     
     id = Column(String, primary_key=True)
     connection_id = Column(String, nullable=False)
@@ -38,8 +94,23 @@ class OAuthToken(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class ConnectionUsage(Base):
+    __tablename__ = "connection_usage"
+    
+    connection_id = Column(String, primary_key=True)
+    last_used_at = Column(DateTime)
+    call_count = Column(BigInteger, nullable=False, default=0)
+    error_count = Column(BigInteger, nullable=False, default=0)
+    bytes_sent = Column(BigInteger, nullable=False, default=0)
+    bytes_received = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class ConnectorMetadata(Base):
     __tablename__ = "connector_metadata"
+    __table_args__ = (
+        Index("ix_connector_metadata_revision", "revision"),
+    )
     
     id = Column(String, primary_key=True)
     name = Column(String, nullable=False, unique=True)
@@ -49,12 +120,59 @@ class ConnectorMetadata(Base):
     auth_type = Column(String, nullable=False)
     config_schema = Column(JSON, nullable=False)
     enabled = Column(Boolean, default=True)
+    content_hash = Column(String)
+    revision = Column(BigInteger, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+def get_engine():
+    """Create the primary engine on first use"""
+    global _engine, _SessionLocal
+    
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(DATABASE_URL, **engine_options())
+                _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    
+    return _engine
+
+
+def SessionLocal():
+    get_engine()
+    return _SessionLocal()
+
+
+def get_read_engine():
+    """Create the replica engine on first use; None when no replica is configured"""
+    global _read_engine, _ReadSessionLocal
+    
+    if _read_engine is None and DATABASE_READ_URL:
+        with _engine_lock:
+            if _read_engine is None:
+                engine = create_engine(DATABASE_READ_URL, **engine_options())
+                _ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _read_engine = engine
+    
+    return _read_engine
+
+
+def _read_session():
+    get_read_engine()
+    return _ReadSessionLocal()
+
+
+ReadSessionLocal = _read_session if DATABASE_READ_URL else None
+
+
 def init_db():
+    from connector_platform.migrations import run_migrations
+    
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
 
 
 def get_db():
@@ -63,3 +181,52 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_async_engine():
+    """Create the asyncpg-backed engine on first use"""
+    global _async_engine, _AsyncSessionLocal
+    
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        
+        connect_args = {}
+        if os.getenv("DB_PGBOUNCER", "false").lower() == "true":
+            connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        
+        _async_engine = create_async_engine(
+            async_database_url(os.getenv("ASYNC_DATABASE_URL", DATABASE_URL)),
+            connect_args=connect_args,
+            **engine_options()
+        )
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    get_async_engine()
+    return _AsyncSessionLocal()
+
+
+async def get_async_db():
+    """Yields None when the database is not PostgreSQL; callers then use the sync session"""
+    if not async_database_enabled():
+        yield None
+        return
+    
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
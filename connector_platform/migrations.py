@@ -0,0 +1,217 @@
+"""
+Versioned schema migrations
+
+`init_db` creates missing tables with `create_all`, which never alters tables
+that already exist. Changes to existing tables (indexes, constraints, new
+columns) are listed here in order and applied once per database, tracked in
+the `schema_migrations` table.
+"""
+from typing import List, NamedTuple, Optional
+import logging
+import re
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_ID = 7203311
+
+CONCURRENT_INDEX = re.compile(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)", re.IGNORECASE)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    statements: List[str]
+    transactional: bool = True
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="Keep only the newest token per connection",
+        statements=[
+            """
+            DELETE FROM oauth_tokens a
+            USING oauth_tokens b
+            WHERE a.connection_id = b.connection_id
+              AND (COALESCE(a.updated_at, a.created_at), a.id)
+                < (COALESCE(b.updated_at, b.created_at), b.id)
+            """
+        ]
+    ),
+    Migration(
+        version=2,
+        description="Unique index on oauth_tokens.connection_id",
+        statements=[
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_oauth_tokens_connection_id "
+            "ON oauth_tokens (connection_id)"
+        ],
+        transactional=False
+    ),
+    Migration(
+        version=3,
+        description="Index connections by user and connector type (superseded by 5)",
+        statements=[],
+        transactional=False
+    ),
+    Migration(
+        version=4,
+        description="Partial index on refreshable token expiry",
+        statements=[
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_oauth_tokens_expires_at_refreshable "
+            "ON oauth_tokens (expires_at) WHERE refresh_token IS NOT NULL"
+        ],
+        transactional=False
+    ),
+    Migration(
+        version=5,
+        description="Keyset pagination indexes for connection listing",
+        statements=[
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_connections_user_id_created_at_id "
+            "ON connections (user_id, created_at, id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_connections_user_id_connector_type_created_at_id "
+            "ON connections (user_id, connector_type, created_at, id)",
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_connections_user_id_connector_type"
+        ],
+        transactional=False
+    ),
+    Migration(
+        version=6,
+        description="Daily-partitioned proxy audit log",
+        statements=[
+            """
+            CREATE TABLE IF NOT EXISTS proxy_audit_log (
+                occurred_at TIMESTAMP NOT NULL,
+                connection_id VARCHAR NOT NULL,
+                connector_name VARCHAR,
+                endpoint_name VARCHAR,
+                method VARCHAR(10),
+                path TEXT,
+                status_code INTEGER,
+                success BOOLEAN NOT NULL,
+                latency_ms INTEGER,
+                bytes_sent BIGINT NOT NULL DEFAULT 0,
+                bytes_received BIGINT NOT NULL DEFAULT 0
+            ) PARTITION BY RANGE (occurred_at)
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_proxy_audit_log_connection_id_occurred_at "
+            "ON proxy_audit_log (connection_id, occurred_at)"
+        ]
+    ),
+    Migration(
+        version=7,
+        description="Revision counter for published connector configs",
+        statements=[
+            "ALTER TABLE connector_metadata ADD COLUMN IF NOT EXISTS content_hash VARCHAR",
+            "ALTER TABLE connector_metadata ADD COLUMN IF NOT EXISTS revision BIGINT NOT NULL DEFAULT 0",
+            "CREATE SEQUENCE IF NOT EXISTS connector_metadata_revision_seq",
+            "CREATE INDEX IF NOT EXISTS ix_connector_metadata_revision ON connector_metadata (revision)"
+        ]
+    ),
+    Migration(
+        version=8,
+        description="Backfill connections.created_at and make it NOT NULL for keyset pagination",
+        statements=[
+            "UPDATE connections SET created_at = COALESCE(updated_at, now() AT TIME ZONE 'utc') "
+            "WHERE created_at IS NULL",
+            "ALTER TABLE connections ALTER COLUMN created_at SET NOT NULL"
+        ]
+    ),
+]
+
+
+def current_version(connection) -> int:
+    return connection.execute(
+        text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    ).scalar()
+
+
+def run_migrations(engine, migrations: List[Migration] = MIGRATIONS) -> int:
+    """
+    Apply pending migrations in version order
+
+    Workers starting at the same time serialize on a Postgres advisory lock,
+    taken before anything else, so each migration runs exactly once. An index
+    left INVALID by an interrupted CREATE INDEX CONCURRENTLY is dropped and
+    rebuilt rather than kept by IF NOT EXISTS.
+
+    Returns:
+        Number of migrations applied
+    """
+    if engine.dialect.name != "postgresql":
+        logger.info("Skipping migrations: only PostgreSQL is supported")
+        return 0
+
+    applied = 0
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+        try:
+            connection.execute(text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version INTEGER PRIMARY KEY, "
+                "description TEXT NOT NULL, "
+                "applied_at TIMESTAMP NOT NULL DEFAULT now())"
+            ))
+            version = current_version(connection)
+
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version <= version:
+                    continue
+
+                logger.info(f"Applying migration {migration.version}: {migration.description}")
+
+                if migration.transactional:
+                    connection.execute(text("BEGIN"))
+                    try:
+                        for statement in migration.statements:
+                            connection.execute(text(statement))
+                        _record(connection, migration)
+                        connection.execute(text("COMMIT"))
+                    except Exception:
+                        connection.execute(text("ROLLBACK"))
+                        raise
+                else:
+                    for statement in migration.statements:
+                        _drop_invalid_index(connection, statement)
+                        connection.execute(text(statement))
+                    _record(connection, migration)
+
+                applied += 1
+
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+    return applied
+
+
+def index_is_valid(connection, name: str) -> Optional[bool]:
+    """pg_index.indisvalid for an index, or None if it does not exist"""
+    return connection.execute(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": name}
+    ).scalar()
+
+
+def _drop_invalid_index(connection, statement: str):
+    match = CONCURRENT_INDEX.search(statement)
+    if not match:
+        return
+
+    name = match.group(1)
+    if index_is_valid(connection, name) is False:
+        logger.warning(f"Rebuilding index {name} left invalid by an interrupted build")
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
+def _record(connection, migration: Migration):
+    connection.execute(
+        text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+        {"version": migration.version, "description": migration.description}
+    )
@@ -76,10 +76,18 @@ export const connectorsApi = {
 
 export const connectionsApi = {
   async listConnections(userId: string): Promise<Connection[]> {
-    const response = await apiClient.get('/connections', {
-      params: { user_id: userId },
-    });
-    return response.data;
+    const connections: Connection[] = [];
+    let cursor: string | undefined;
+
+    do {
+      const response = await apiClient.get('/connections', {
+        params: { user_id: userId, limit: 1000, cursor },
+      });
+      connections.push(...response.data);
+      cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+
+    return connections;
   },
 
   async getConnection(id: string): Promise<Connection> {
@@ -48,15 +48,25 @@ class ConnectorPlatformClient:
     def list_connections(
         self,
         user_id: str,
-        connector_type: Optional[str] = None
+        connector_type: Optional[str] = None,
+        page_size: int = 1000
     ) -> List[Dict]:
-        """List connections for a user."""
+        """List all connections for a user, following the X-Next-Cursor header across pages."""
         url = f"{self.base_url}/connections"
-        params = {"user_id": user_id}
+        params = {"user_id": user_id, "limit": page_size}
         if connector_type:
             params["connector_type"] = connector_type
-        response = requests.get(url, params=params)
-        return response.json()
+        
+        connections = []
+        while True:
+            response = requests.get(url, params=params)
+            response.raise_for_status()
+            connections.extend(response.json())
+            
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                return connections
+            params["cursor"] = cursor
     
     def delete_connection(self, connection_id: str) -> Dict:
         """Delete a connection."""
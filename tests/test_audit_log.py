@@ -0,0 +1,174 @@
+"""
+Unit tests for audit log batching, daily partitions and retention
+
+Run with: python tests/test_audit_log.py
+"""
+import sys
+from contextlib import contextmanager
+from datetime import date, datetime
+from types import SimpleNamespace
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+
+from connector_platform.core.audit_log import AuditLogSink, AuditRecord, expired_partitions, partition_name
+
+
+class _FakeEngine:
+    """Records executed SQL; reports the given partition names to the retention query"""
+
+    def __init__(self, partitions=()):
+        self.dialect = SimpleNamespace(name="postgresql")
+        self.partitions = list(partitions)
+        self.statements = []
+
+    @contextmanager
+    def begin(self):
+        yield self
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.partitions)))
+
+
+class _CapturingSink(AuditLogSink):
+    """COPYs into a list instead of Postgres; fails while `failing` is set"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.copied = []
+        self.failing = False
+
+    def _copy(self, batch):
+        if self.failing:
+            raise ConnectionError("database unavailable")
+        self.copied.append(batch)
+
+
+def _record(occurred_at, connection_id="connection-1"):
+    return AuditRecord(occurred_at, connection_id, "gmail", "list_messages", "GET", "/messages", 200, True, 12, 0, 512)
+
+
+def test_batches_into_daily_partitions():
+    """Test that records are flushed in one batch and each day's partition is created once"""
+    print("Testing audit log batching...")
+
+    engine = _FakeEngine()
+    sink = _CapturingSink(engine, batch_size=3)
+
+    sink.record(_record(datetime(2025, 1, 14, 23, 59)))
+    sink.record(_record(datetime(2025, 1, 15, 0, 1)))
+    assert not sink._wake.is_set(), "below batch_size the flusher should not be woken"
+    sink.record(_record(datetime(2025, 1, 15, 9, 0)))
+    assert sink._wake.is_set(), "reaching batch_size should wake the flusher"
+
+    assert sink.flush() == 3
+    assert len(sink.copied) == 1 and len(sink.copied[0]) == 3
+
+    created = sorted(statement for statement in engine.statements if "CREATE TABLE" in statement)
+    assert len(created) == 2
+    assert "proxy_audit_log_p20250114 PARTITION OF proxy_audit_log" in created[0]
+    assert "FROM ('2025-01-14') TO ('2025-01-15')" in created[0]
+    assert partition_name(date(2025, 1, 15)) == "proxy_audit_log_p20250115"
+
+    sink.record(_record(datetime(2025, 1, 15, 10, 0)))
+    sink.flush()
+    assert len([s for s in engine.statements if "CREATE TABLE" in s]) == 2, "known partitions are not re-created"
+    assert sink.stats()["written"] == 4
+
+    print("✓ Batching correct")
+
+
+def test_failed_flush_keeps_records():
+    """Test that a failed flush puts the batch back in order, within max_buffered"""
+    print("\nTesting failed audit flush...")
+
+    sink = _CapturingSink(_FakeEngine(), max_buffered=4)
+    records = [_record(datetime(2025, 1, 15, 9, minute)) for minute in range(3)]
+    for record in records:
+        sink.record(record)
+
+    sink.failing = True
+    assert sink.flush() == 0
+    sink.record(_record(datetime(2025, 1, 15, 9, 30)))
+    sink.record(_record(datetime(2025, 1, 15, 9, 31)))
+
+    stats = sink.stats()
+    assert stats["flush_failures"] == 1
+    assert stats["buffered"] == 4
+    assert stats["dropped"] == 1
+
+    sink.failing = False
+    assert sink.flush() == 4
+    assert [r.occurred_at.minute for r in sink.copied[0]] == [1, 2, 30, 31]
+
+    print("✓ Failed flush retried")
+
+
+def test_retention_cutoff():
+    """Test that only partitions entirely before the retention window are dropped"""
+    print("\nTesting audit retention...")
+
+    names = [
+        "proxy_audit_log_p20250101",
+        "proxy_audit_log_p20250114",
+        "proxy_audit_log_p20250115",
+        "proxy_audit_log_default",
+        "other_table_p20240101",
+    ]
+    # 31 days before 2025-02-15 is 2025-01-15; that day is still inside the window
+    assert expired_partitions(names, date(2025, 2, 15), 31) == ["proxy_audit_log_p20250101", "proxy_audit_log_p20250114"]
+
+    engine = _FakeEngine(names)
+    sink = AuditLogSink(engine, retention_days=31, clock=lambda: datetime(2025, 2, 15, 12, 0))
+    assert sink.drop_expired_partitions() == ["proxy_audit_log_p20250101", "proxy_audit_log_p20250114"]
+    assert [s for s in engine.statements if s.startswith("DROP")] == [
+        "DROP TABLE IF EXISTS proxy_audit_log_p20250101",
+        "DROP TABLE IF EXISTS proxy_audit_log_p20250114",
+    ]
+
+    print("✓ Retention cutoff correct")
+
+
+def test_disabled_without_postgres():
+    """Test that start() on a non-Postgres database disables the sink instead of failing every flush"""
+    print("\nTesting audit log on SQLite...")
+
+    sink = AuditLogSink()
+    sink.start(create_engine("sqlite://"))
+    sink.record(_record(datetime(2025, 1, 15)))
+
+    stats = sink.stats()
+    assert stats["enabled"] is False
+    assert stats["buffered"] == 0
+    assert sink._thread is None
+    assert sink.flush() == 0
+
+    print("✓ Disabled on SQLite")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Audit Log Tests")
+    print("="*60)
+
+    try:
+        test_batches_into_daily_partitions()
+        test_failed_flush_keeps_records()
+        test_retention_cutoff()
+        test_disabled_without_postgres()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,202 @@
+"""
+Unit tests for bulk connection create, delete and status updates against SQLite
+
+Run with: python tests/test_bulk_connections.py
+"""
+import sys
+import os
+import tempfile
+sys.path.insert(0, '.')
+
+os.environ.setdefault("CONNECTOR_CONFIG_CACHE_ENABLED", "false")
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection, ConnectionUsage, OAuthToken
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.connection_manager import CachedToken, ConnectionInfo, ConnectionManager
+from connector_platform.core.invalidation import InvalidationBus
+from connector_platform.api import main
+
+
+def _database():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Connection.__table__, OAuthToken.__table__, ConnectionUsage.__table__])
+    return engine, sessionmaker(bind=engine), path
+
+
+def _manager(db):
+    bus = InvalidationBus()
+    published = []
+    for kind in ("connection", "token", "user"):
+        bus.watch(kind, lambda key, kind=kind: published.append((kind, key)))
+    manager = ConnectionManager(db, token_cache=TTLCache(), connection_cache=TTLCache(), bus=bus)
+    return manager, published
+
+
+def _items(count):
+    return [
+        {"connector_type": "gmail", "name": f"Inbox {index}", "user_id": f"user-{index % 2}"}
+        for index in range(count)
+    ]
+
+
+def test_bulk_create_in_batches():
+    """Test that bulk create splits rows across INSERTs and returns them in input order"""
+    print("Testing bulk create...")
+
+    engine, Session, path = _database()
+    inserts = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO connections"):
+            inserts.append(statement)
+
+    try:
+        with Session() as db:
+            manager, published = _manager(db)
+            created = manager.bulk_create_connections(_items(5), batch_size=2)
+
+            assert [row["name"] for row in created] == [f"Inbox {index}" for index in range(5)]
+            assert {row["status"] for row in created} == {"pending"}
+            assert len({row["id"] for row in created}) == 5
+            assert len(inserts) == 3, "5 rows at batch_size=2 take three INSERTs"
+            assert sorted(published) == [("user", "user-0"), ("user", "user-1")]
+
+        with Session() as db:
+            assert db.query(Connection).count() == 5
+
+        print("✓ Bulk create correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_bulk_delete_and_status_invalidate_caches():
+    """Test that bulk delete and status updates skip missing ids and invalidate caches"""
+    print("\nTesting bulk delete and status...")
+
+    engine, Session, path = _database()
+    try:
+        with Session() as db:
+            manager, published = _manager(db)
+            ids = [row["id"] for row in manager.bulk_create_connections(_items(4))]
+            manager.store_oauth_token(ids[0], {"access_token": "access"})
+
+            for connection_id in ids:
+                manager.connection_cache.set(connection_id, ConnectionInfo(connection_id, "gmail", "Inbox", "user-0", "pending"))
+            assert isinstance(manager.token_cache.get(ids[0]), CachedToken)
+            published.clear()
+
+            assert manager.bulk_update_status([ids[0], ids[1], "missing"], "active") == [ids[0], ids[1]]
+            assert manager.connection_cache.get(ids[0]) is None
+            assert manager.connection_cache.get(ids[2]) is not None
+            assert ("connection", ids[0]) in published and ("connection", "missing") not in published
+
+            try:
+                manager.bulk_update_status([ids[2]], "bogus")
+                assert False, "expected an invalid status to be rejected"
+            except ValueError:
+                pass
+
+            published.clear()
+            assert sorted(manager.bulk_delete_connections([ids[0], ids[2], "missing"])) == sorted([ids[0], ids[2]])
+            assert manager.token_cache.get(ids[0]) is None
+            assert manager.connection_cache.get(ids[2]) is None
+            assert manager.connection_cache.get(ids[3]) is not None
+            assert sorted(key for kind, key in published if kind == "token") == sorted([ids[0], ids[2]])
+            assert manager.bulk_delete_connections([]) == []
+
+        with Session() as db:
+            statuses = {row.id: row.status for row in db.query(Connection).all()}
+            assert statuses == {ids[1]: "active", ids[3]: "pending"}
+            assert db.query(OAuthToken).count() == 0
+
+        print("✓ Bulk delete and status correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_bulk_endpoints_report_item_errors():
+    """Test that the bulk endpoints report per-item errors and reject unknown statuses"""
+    print("\nTesting bulk endpoint errors...")
+
+    main.registry.load_connector_configs()
+    engine, Session, path = _database()
+    try:
+        with Session() as db:
+            result = main.bulk_create_connections(main.BulkCreateConnectionsRequest(connections=[
+                {"connector_type": "gmail", "name": "Inbox", "user_id": "user-1"},
+                {"connector_type": "no-such-connector", "name": "Broken", "user_id": "user-1"},
+                {"connector_type": "dropbox", "name": "Files", "user_id": "user-1"},
+            ]), db=db)
+
+            assert [item["index"] for item in result["created"]] == [0, 2]
+            assert result["errors"] == [{"index": 1, "error": "Connector not found"}]
+            ids = [item["id"] for item in result["created"]]
+
+            try:
+                main.bulk_update_connection_status(
+                    main.BulkUpdateStatusRequest(connection_ids=ids, status="bogus"), db=db
+                )
+                assert False, "expected HTTP 400"
+            except HTTPException as e:
+                assert e.status_code == 400
+
+            result = main.bulk_update_connection_status(
+                main.BulkUpdateStatusRequest(connection_ids=[ids[0], "missing", ids[0]], status="disabled"), db=db
+            )
+            assert result == {"updated": [ids[0]], "errors": [{"id": "missing", "error": "Connection not found"}]}
+
+            result = main.bulk_delete_connections(
+                main.BulkDeleteConnectionsRequest(connection_ids=["missing", ids[1]]), db=db
+            )
+            assert result == {"deleted": [ids[1]], "errors": [{"id": "missing", "error": "Connection not found"}]}
+
+            try:
+                main.bulk_delete_connections(
+                    main.BulkDeleteConnectionsRequest(connection_ids=["x"] * (main.BULK_MAX_ITEMS + 1)), db=db
+                )
+                assert False, "expected HTTP 400"
+            except HTTPException as e:
+                assert e.status_code == 400
+
+        with Session() as db:
+            assert {row.id: row.status for row in db.query(Connection).all()} == {ids[0]: "disabled"}
+
+        print("✓ Bulk endpoint errors correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Bulk Connection Tests")
+    print("="*60)
+
+    try:
+        test_bulk_create_in_batches()
+        test_bulk_delete_and_status_invalidate_caches()
+        test_bulk_endpoints_report_item_errors()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,96 @@
+"""
+Unit tests for the in-process TTL/LRU cache
+
+Run with: python tests/test_cache.py
+"""
+import sys
+sys.path.insert(0, '.')
+
+from connector_platform.core.cache import TTLCache
+from datetime import datetime, timedelta
+
+
+def test_hit_and_miss_counters():
+    """Test hit ratio bookkeeping"""
+    print("Testing TTLCache hit/miss counters...")
+
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    assert cache.get("conn-1") is None
+
+    cache.set("conn-1", "token")
+    assert cache.get("conn-1") == "token"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+    print("✓ Hit/miss counters correct")
+
+
+def test_lru_eviction():
+    """Test that least recently used entries are evicted first"""
+    print("\nTesting TTLCache LRU eviction...")
+
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+    print("✓ LRU eviction correct")
+
+
+def test_expiry_aware_set():
+    """Test that entries never outlive the value's own expires_at"""
+    print("\nTesting TTLCache expires_at handling...")
+
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+
+    expired = datetime.utcnow() - timedelta(seconds=1)
+    assert cache.set("expired", "old-token", expires_at=expired) is False
+    assert cache.get("expired") is None
+
+    cache.set("short", "token", ttl_seconds=0.0)
+    assert cache.get("short") is None
+
+    valid = datetime.utcnow() + timedelta(hours=1)
+    assert cache.set("valid", "token", expires_at=valid) is True
+    assert cache.get("valid") == "token"
+
+    cache.invalidate("valid")
+    assert cache.get("valid") is None
+
+    print("✓ expires_at handling correct")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Cache Tests")
+    print("="*60)
+
+    try:
+        test_hit_and_miss_counters()
+        test_lru_eviction()
+        test_expiry_aware_set()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
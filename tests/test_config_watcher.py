@@ -0,0 +1,118 @@
+"""
+Unit tests for the connector config watcher
+
+Run with: python tests/test_config_watcher.py
+"""
+import sys
+import os
+import tempfile
+import threading
+sys.path.insert(0, '.')
+
+from connector_platform.core.config_watcher import ConfigWatcher, Inotify
+
+
+class _Registry:
+    """Counts reloads; stops the watcher after the expected number"""
+
+    def __init__(self, watcher_ref, stop_after):
+        self.watcher_ref = watcher_ref
+        self.stop_after = stop_after
+        self.reloads = 0
+
+    def reload(self):
+        self.reloads += 1
+        if self.reloads >= self.stop_after:
+            self.watcher_ref[0]._stop.set()
+        return False
+
+
+class _SilentInotify:
+    """Never reports an event, like a change inotify missed"""
+
+    def __init__(self):
+        self.waits = 0
+
+    def wait(self, timeout):
+        self.waits += 1
+        return False
+
+
+def test_inotify_reports_configmap_and_yaml_changes():
+    """Test that .yaml writes and a ConfigMap-style ..data symlink swap are reported"""
+    print("Testing inotify events...")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        try:
+            inotify = Inotify(config_dir)
+        except OSError as e:
+            print(f"✓ Skipped: inotify unavailable ({e})")
+            return
+
+        try:
+            with open(os.path.join(config_dir, "notes.txt"), "w") as f:
+                f.write("ignored")
+            assert not inotify.wait(0.2)
+
+            with open(os.path.join(config_dir, "gmail.yaml"), "w") as f:
+                f.write("name: gmail\n")
+            assert inotify.wait(0.2)
+            while inotify.wait(0.1):
+                pass
+
+            os.mkdir(os.path.join(config_dir, "..2026_10_19"))
+            os.symlink("..2026_10_19", os.path.join(config_dir, "..data_tmp"))
+            while inotify.wait(0.1):
+                pass
+            os.rename(os.path.join(config_dir, "..data_tmp"), os.path.join(config_dir, "..data"))
+            assert inotify.wait(0.2), "a ConfigMap update swaps the ..data symlink"
+        finally:
+            inotify.close()
+
+    print("✓ inotify events reported")
+
+
+def test_inotify_mode_rescans_without_events():
+    """Test that inotify mode still reloads periodically when no event arrives"""
+    print("\nTesting rescan alongside inotify...")
+
+    watcher_ref = []
+    registry = _Registry(watcher_ref, stop_after=2)
+    watcher = ConfigWatcher(registry, rescan_interval_seconds=0)
+    watcher_ref.append(watcher)
+
+    inotify = _SilentInotify()
+    thread = threading.Thread(target=watcher._watch_inotify, args=(inotify,), daemon=True)
+    thread.start()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert registry.reloads == 2
+    assert inotify.waits == 2
+
+    print("✓ Rescanned without events")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Config Watcher Tests")
+    print("="*60)
+
+    try:
+        test_inotify_reports_configmap_and_yaml_changes()
+        test_inotify_mode_rescans_without_events()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
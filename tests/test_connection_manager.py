@@ -0,0 +1,136 @@
+"""
+Unit tests for ConnectionManager token storage against a SQLite database
+
+Run with: python tests/test_connection_manager.py
+"""
+import sys
+import os
+import tempfile
+from unittest import mock
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection, ConnectionUsage, OAuthToken
+from connector_platform.core import connection_manager
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.connection_manager import CachedToken, ConnectionManager
+from connector_platform.core.invalidation import InvalidationBus
+
+
+def _database():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Connection.__table__, OAuthToken.__table__, ConnectionUsage.__table__])
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        for index in (1, 2, 3):
+            db.add(Connection(id=f"connection-{index}", connector_type="gmail", name="Inbox", user_id="user-1"))
+        db.commit()
+
+    return engine, Session, path
+
+
+def _check_store_oauth_token(Session):
+    token_cache = TTLCache()
+
+    with Session() as db:
+        manager = ConnectionManager(db, token_cache=token_cache, connection_cache=TTLCache(), bus=InvalidationBus())
+
+        first = manager.store_oauth_token("connection-1", {
+            "access_token": "access-1", "refresh_token": "refresh-1", "expires_in": 3600
+        })
+        assert isinstance(first, CachedToken)
+        assert (first.access_token, first.refresh_token, first.token_type) == ("access-1", "refresh-1", "Bearer")
+        assert first.expires_at is not None
+        assert token_cache.get("connection-1") == first
+
+        # Providers often omit the refresh token on refresh; the stored one is kept
+        second = manager.store_oauth_token("connection-1", {"access_token": "access-2", "scope": "read"})
+        assert (second.access_token, second.refresh_token, second.scope) == ("access-2", "refresh-1", "read")
+        assert second.expires_at is None
+
+    with Session() as db:
+        rows = db.query(OAuthToken).all()
+        assert len(rows) == 1, "the token should be updated in place"
+        assert rows[0].access_token == "access-2"
+
+
+def test_store_oauth_token_upsert():
+    """Test that storing a token upserts one row and returns a detached CachedToken"""
+    print("Testing store_oauth_token with ON CONFLICT upsert...")
+
+    engine, Session, path = _database()
+    try:
+        _check_store_oauth_token(Session)
+        print("✓ Upsert correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_store_oauth_token_generic_fallback():
+    """Test the SELECT-then-UPDATE path used on dialects without ON CONFLICT ... RETURNING"""
+    print("\nTesting store_oauth_token fallback...")
+
+    engine, Session, path = _database()
+    try:
+        with mock.patch.dict(connection_manager.UPSERT_INSERTS, clear=True):
+            _check_store_oauth_token(Session)
+        print("✓ Fallback correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_delete_removes_usage():
+    """Test that single and bulk deletes remove usage counters in the same transaction"""
+    print("\nTesting usage cleanup on delete...")
+
+    engine, Session, path = _database()
+    try:
+        with Session() as db:
+            for index in (1, 2, 3):
+                db.add(ConnectionUsage(connection_id=f"connection-{index}", call_count=1))
+            db.commit()
+
+            manager = ConnectionManager(db, token_cache=TTLCache(), connection_cache=TTLCache(), bus=InvalidationBus())
+            assert manager.delete_connection("connection-1")
+            assert manager.bulk_delete_connections(["connection-2", "missing"]) == ["connection-2"]
+
+        with Session() as db:
+            assert [row.connection_id for row in db.query(ConnectionUsage).all()] == ["connection-3"]
+
+        print("✓ Usage rows deleted with their connections")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Connection Manager Tests")
+    print("="*60)
+
+    try:
+        test_store_oauth_token_upsert()
+        test_store_oauth_token_generic_fallback()
+        test_delete_removes_usage()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
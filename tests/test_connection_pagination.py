@@ -0,0 +1,184 @@
+"""
+Unit tests for keyset pagination of connection listings
+
+Run with: python tests/test_connection_pagination.py
+"""
+import sys
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection
+from connector_platform.core.connection_manager import ConnectionManager
+from connector_platform.migrations import MIGRATIONS
+from sdk.python.client import ConnectorPlatformClient
+
+
+def _database(count):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Connection.__table__])
+    Session = sessionmaker(bind=engine)
+
+    # Pairs of rows share a created_at, so pages must break ties on id
+    start = datetime(2025, 1, 1)
+    with Session() as db:
+        db.add_all([
+            Connection(
+                id=f"connection-{index:03d}",
+                connector_type="gmail",
+                name=f"c{index}",
+                user_id="user-1",
+                created_at=start + timedelta(seconds=index // 2)
+            )
+            for index in range(count)
+        ])
+        db.commit()
+
+    return engine, Session, path
+
+
+def test_cursor_round_trip():
+    """Test that following cursors returns every connection exactly once, in order"""
+    print("Testing connection cursor round trip...")
+
+    engine, Session, path = _database(25)
+    try:
+        seen, cursor, pages = [], None, 0
+        with Session() as db:
+            manager = ConnectionManager(db)
+            while True:
+                rows, cursor = manager.list_connections_page("user-1", limit=10, cursor=cursor)
+                seen.extend(row.id for row in rows)
+                pages += 1
+                if not cursor:
+                    break
+
+            assert pages == 3
+            assert seen == [f"connection-{index:03d}" for index in range(25)]
+
+            try:
+                manager.list_connections_page("user-1", cursor="not-a-cursor")
+                assert False, "Malformed cursor should raise"
+            except ValueError:
+                pass
+
+        print("✓ Cursor round trip correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_created_at_not_null():
+    """Test that created_at, part of the pagination key, can never be NULL"""
+    print("\nTesting NULL created_at...")
+
+    engine, Session, path = _database(0)
+    try:
+        with Session() as db:
+            db.add(Connection(id="defaulted", connector_type="gmail", name="c", user_id="user-1"))
+            db.commit()
+            rows, cursor = ConnectionManager(db).list_connections_page("user-1", limit=10)
+            assert [row.id for row in rows] == ["defaulted"] and rows[0].created_at is not None
+
+            try:
+                db.execute(insert(Connection).values(
+                    id="null", connector_type="gmail", name="c", user_id="user-1", created_at=None
+                ))
+                assert False, "a NULL created_at should be rejected"
+            except IntegrityError:
+                db.rollback()
+
+        migration = next(m for m in MIGRATIONS if "created_at SET NOT NULL" in " ".join(m.statements))
+        backfill, constraint = migration.statements
+        assert backfill.startswith("UPDATE connections SET created_at") and "WHERE created_at IS NULL" in backfill
+        assert migration.transactional, "backfill and constraint must commit together"
+
+        print("✓ NULL created_at rejected")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_sdk_follows_cursor():
+    """Test that the Python SDK pages through X-Next-Cursor instead of stopping at one page"""
+    print("\nTesting SDK list_connections paging...")
+
+    engine, Session, path = _database(25)
+
+    class Handler(BaseHTTPRequestHandler):
+        requests_seen = 0
+
+        def do_GET(self):
+            query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+            with Session() as db:
+                rows, cursor = ConnectionManager(db).list_connections_page(
+                    query["user_id"], limit=int(query["limit"]), cursor=query.get("cursor")
+                )
+            body = json.dumps([{"id": row.id, "name": row.name} for row in rows]).encode("utf-8")
+            Handler.requests_seen += 1
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if cursor:
+                self.send_header("X-Next-Cursor", cursor)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ConnectorPlatformClient(f"http://127.0.0.1:{server.server_port}")
+        connections = client.list_connections("user-1", page_size=7)
+
+        assert [connection["id"] for connection in connections] == [
+            f"connection-{index:03d}" for index in range(25)
+        ]
+        assert Handler.requests_seen == 4
+
+        print("✓ SDK returns every page")
+    finally:
+        server.shutdown()
+        server.server_close()
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Connection Pagination Tests")
+    print("="*60)
+
+    try:
+        test_cursor_round_trip()
+        test_created_at_not_null()
+        test_sdk_follows_cursor()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,240 @@
+"""
+Unit tests for connector registry loading and hot reload
+
+Run with: python tests/test_connector_registry.py
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+sys.path.insert(0, '.')
+
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.config_cache import ConfigSnapshotCache
+
+SOURCE_DIR = Path("connector_platform/config/connectors")
+
+
+def _copy_configs() -> Path:
+    config_dir = Path(tempfile.mkdtemp())
+    for config_file in SOURCE_DIR.glob("*.yaml"):
+        shutil.copy(config_file, config_dir / config_file.name)
+    return config_dir
+
+
+def _touch(path: Path, content: str):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_swaps_changed_connector():
+    """Test that a changed YAML is picked up in a new snapshot"""
+    print("Testing registry reload...")
+
+    config_dir = _copy_configs()
+    try:
+        registry = ConnectorRegistry(config_dir)
+        registry.load_connector_configs()
+        old_snapshot = registry.snapshot
+
+        assert registry.get_connector("gmail") is not None
+        assert registry.reload() is False
+
+        gmail = config_dir / "gmail.yaml"
+        _touch(gmail, gmail.read_text().replace("display_name: Gmail", "display_name: Google Mail", 1))
+
+        assert registry.reload() is True
+        assert registry.get_connector("gmail")["display_name"] == "Google Mail"
+        assert old_snapshot.connectors["gmail"]["display_name"] == "Gmail"
+        assert registry.snapshot.connectors["dropbox"] is old_snapshot.connectors["dropbox"]
+
+        (config_dir / "dropbox.yaml").unlink()
+        assert registry.reload() is True
+        assert registry.get_connector("dropbox") is None
+
+        print("✓ Reload correct")
+    finally:
+        shutil.rmtree(config_dir)
+
+
+def test_invalid_config_keeps_snapshot():
+    """Test that a config failing validation leaves the current snapshot in place"""
+    print("\nTesting rejected reload...")
+
+    config_dir = _copy_configs()
+    try:
+        registry = ConnectorRegistry(config_dir)
+        registry.load_connector_configs()
+        snapshot = registry.snapshot
+
+        onedrive = config_dir / "onedrive.yaml"
+        original = onedrive.read_text()
+        _touch(onedrive, "name: onedrive\ndisplay_name: OneDrive\n")
+
+        assert registry.reload() is False
+        assert registry.snapshot is snapshot
+        assert registry.get_connector("onedrive")["base_url"]
+        assert registry.stats()["rejected_reloads"] == 1
+
+        # The rejected file is not re-parsed (or logged) on every poll
+        parsed = []
+        parse = registry._parse
+        registry._parse = lambda config_file, stat: parsed.append(config_file) or parse(config_file, stat)
+        assert registry.reload() is False
+        assert registry.reload() is False
+        assert parsed == []
+        assert registry.stats()["rejected_reloads"] == 1
+
+        # Fixing it triggers a retry that succeeds
+        _touch(onedrive, original.replace("display_name: OneDrive", "display_name: OneDrive for Business", 1))
+        assert registry.reload() is True
+        assert parsed == [onedrive]
+        assert registry.get_connector("onedrive")["display_name"] == "OneDrive for Business"
+
+        print("✓ Invalid config rejected")
+    finally:
+        shutil.rmtree(config_dir)
+
+
+def test_compiled_indexes():
+    """Test endpoint, type and summary indexes built at load time"""
+    print("\nTesting compiled registry indexes...")
+
+    registry = ConnectorRegistry(SOURCE_DIR)
+    registry.load_connector_configs()
+
+    endpoint = registry.get_endpoint_spec("gmail", "list_messages")
+    assert endpoint.method == "GET"
+    assert registry.get_endpoint("gmail", "list_messages") is endpoint.config
+    assert registry.get_endpoint("gmail", "missing") is None
+
+    gmail = registry.get_connector_spec("gmail")
+    assert gmail in registry.list_connectors_by_type(gmail.type)
+
+    summaries = json.loads(registry.list_connectors_json())
+    assert [summary["name"] for summary in summaries] == ["dropbox", "gmail", "onedrive"]
+    assert summaries == [dict(summary) for summary in registry.list_connectors()]
+
+    try:
+        gmail.config["name"] = "changed"
+        assert False, "compiled config should be read-only"
+    except TypeError:
+        pass
+
+    print("✓ Indexes correct")
+
+
+def test_config_snapshot_cache():
+    """Test that a second start is served from the snapshot cache"""
+    print("\nTesting config snapshot cache...")
+
+    config_dir = _copy_configs()
+    try:
+        cache_path = config_dir / "configs.cache"
+
+        cold = ConfigSnapshotCache(cache_path)
+        ConnectorRegistry(config_dir, config_cache=cold).load_connector_configs()
+        assert cold.stats()["misses"] == 3
+        assert cache_path.exists()
+
+        gmail = config_dir / "gmail.yaml"
+        _touch(gmail, gmail.read_text())
+
+        warm = ConfigSnapshotCache(cache_path)
+        registry = ConnectorRegistry(config_dir, config_cache=warm)
+        registry.load_connector_configs()
+
+        stats = warm.stats()
+        assert stats["hits"] == 2
+        assert stats["hash_hits"] == 1
+        assert stats["misses"] == 0
+        assert registry.get_connector("gmail")["display_name"] == "Gmail"
+
+        print("✓ Snapshot cache correct")
+    finally:
+        shutil.rmtree(config_dir)
+
+
+def test_config_cache_rejects_untrusted_file():
+    """Test that a tampered or group/other-writable cache file is not loaded"""
+    print("\nTesting untrusted config cache files...")
+
+    config_dir = _copy_configs()
+    try:
+        cache_path = config_dir / "configs.cache"
+        ConnectorRegistry(config_dir, config_cache=ConfigSnapshotCache(cache_path)).load_connector_configs()
+
+        data = bytearray(cache_path.read_bytes())
+        data[-1] ^= 0xFF
+        cache_path.write_bytes(bytes(data))
+        tampered = ConfigSnapshotCache(cache_path)
+        ConnectorRegistry(config_dir, config_cache=tampered).load_connector_configs()
+        assert tampered.stats()["hits"] == 0, "checksum mismatch should be ignored"
+
+        os.chmod(cache_path, 0o666)
+        writable = ConfigSnapshotCache(cache_path)
+        ConnectorRegistry(config_dir, config_cache=writable).load_connector_configs()
+        assert writable.stats()["hits"] == 0, "world-writable cache should be ignored"
+
+        print("✓ Untrusted cache files ignored")
+    finally:
+        shutil.rmtree(config_dir)
+
+
+def test_config_cache_failed_save_leaves_no_temp_file():
+    """Test that a failed cache write removes its temp file and keeps the previous cache"""
+    print("\nTesting failed config cache writes...")
+
+    config_dir = _copy_configs()
+    try:
+        cache_path = config_dir / "configs.cache"
+        ConnectorRegistry(config_dir, config_cache=ConfigSnapshotCache(cache_path)).load_connector_configs()
+        previous = cache_path.read_bytes()
+
+        gmail = config_dir / "gmail.yaml"
+        _touch(gmail, gmail.read_text() + "\n")
+        cache = ConfigSnapshotCache(cache_path)
+        with mock.patch("connector_platform.core.config_cache.os.replace", side_effect=OSError("disk full")):
+            ConnectorRegistry(config_dir, config_cache=cache).load_connector_configs()
+
+        assert cache.stats()["misses"] == 1
+        assert cache_path.read_bytes() == previous
+        leftovers = [path.name for path in config_dir.iterdir() if path.name.startswith(cache_path.name)]
+        assert leftovers == [cache_path.name], leftovers
+
+        print("✓ Temp file removed")
+    finally:
+        shutil.rmtree(config_dir)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Connector Registry Tests")
+    print("="*60)
+
+    try:
+        test_reload_swaps_changed_connector()
+        test_invalid_config_keeps_snapshot()
+        test_compiled_indexes()
+        test_config_snapshot_cache()
+        test_config_cache_rejects_untrusted_file()
+        test_config_cache_failed_save_leaves_no_temp_file()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
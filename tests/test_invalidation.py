@@ -0,0 +1,169 @@
+"""
+Unit tests for cross-worker cache invalidation payloads and listener resets
+
+Run with: python tests/test_invalidation.py
+"""
+import sys
+import json
+from types import SimpleNamespace
+sys.path.insert(0, '.')
+
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.invalidation import InvalidationBus
+
+NOTIFY_LIMIT = 8000
+
+
+class _PostgresSession:
+    """Captures pg_notify payloads as a Postgres session would send them"""
+
+    def __init__(self):
+        self.payloads = []
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def execute(self, statement, params):
+        self.payloads.append(params["payload"])
+
+
+def _recording_bus():
+    bus = InvalidationBus()
+    evicted = []
+    bus.subscribe("token", lambda key: evicted.append(("token", key)))
+    bus.subscribe("connection", lambda key: evicted.append(("connection", key)))
+    return bus, evicted
+
+
+def test_handle_payload():
+    """Test dispatch of single-key and multi-key payloads, skipping this worker's own"""
+    print("Testing invalidation payload handling...")
+
+    bus, evicted = _recording_bus()
+    other = InvalidationBus()
+
+    bus._handle_payload(json.dumps({"kind": "token", "key": "connection-1", "origin": other.origin}))
+    bus._handle_payload(json.dumps({"kind": "connection", "keys": ["a", "b", "c"], "origin": other.origin}))
+    assert evicted == [("token", "connection-1"), ("connection", "a"), ("connection", "b"), ("connection", "c")]
+
+    evicted.clear()
+    bus._handle_payload(json.dumps({"kind": "token", "key": "connection-1", "origin": bus.origin}))
+    assert evicted == [], "a worker must not evict for its own writes twice"
+
+    assert bus.stats()["received"] == 4
+
+    print("✓ Payload handling correct")
+
+
+def test_malformed_payloads_ignored():
+    """Test that malformed payloads are logged and dropped without raising"""
+    print("\nTesting malformed invalidation payloads...")
+
+    bus, evicted = _recording_bus()
+    for payload in [
+        "not json",
+        "[]",
+        "42",
+        json.dumps({"kind": "token"}),
+        json.dumps({"kind": "token", "keys": "connection-1"}),
+        json.dumps({"kind": "token", "keys": ["ok", 7]}),
+        json.dumps({"kind": ["token"], "key": "connection-1"}),
+    ]:
+        bus._handle_payload(payload)
+
+    assert evicted == []
+    assert bus.stats()["received"] == 0
+
+    print("✓ Malformed payloads ignored")
+
+
+def test_batches_stay_under_notify_limit():
+    """Test that publish_many splits keys so every encoded payload is under 8000 bytes"""
+    print("\nTesting invalidation batching...")
+
+    keys = [f"connection-{index:06d}" for index in range(2000)]
+    keys += ["ключ-" + "я" * 300 + f"-{index}" for index in range(20)]
+    keys += ["x" * 6000]
+
+    bus = InvalidationBus()
+    session = _PostgresSession()
+    bus.publish_many(session, "connection", keys)
+
+    assert len(session.payloads) > 1
+    sent = []
+    for payload in session.payloads:
+        assert len(payload.encode("utf-8")) < NOTIFY_LIMIT, len(payload.encode("utf-8"))
+        message = json.loads(payload)
+        assert message["kind"] == "connection" and message["origin"] == bus.origin
+        sent.extend(message["keys"])
+
+    assert sent == keys
+    assert bus.stats()["published"] == len(keys)
+
+    print(f"✓ {len(keys)} keys in {len(session.payloads)} notifications")
+
+
+def test_reconnect_resets_caches():
+    """Test that caches are cleared when the listener reconnects, but not on the first connect"""
+    print("\nTesting listener reconnect...")
+
+    bus = InvalidationBus(reconnect_delay=0)
+    cache = TTLCache()
+    bus.subscribe("token", cache.invalidate, on_reset=cache.clear)
+
+    class _Connection:
+        def __init__(self):
+            self.dbapi_connection = SimpleNamespace(
+                autocommit=False,
+                cursor=lambda: SimpleNamespace(execute=lambda sql: None)
+            )
+
+        def invalidate(self):
+            pass
+
+    engine = SimpleNamespace(raw_connection=_Connection)
+    polls = []
+
+    def poll(dbapi_connection):
+        polls.append(dbapi_connection)
+        if len(polls) == 1:
+            cache.set("connection-1", "token-written-while-connected")
+            raise ConnectionError("server closed the connection")
+        assert cache.get("connection-1") is None, "missed notifications must clear the cache"
+        bus._stop.set()
+
+    bus._poll = poll
+    cache.set("connection-1", "token-before-first-connect")
+    bus._listen_forever(engine)
+
+    assert len(polls) == 2
+    assert polls[0].autocommit is True
+
+    print("✓ Cache cleared on reconnect")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Invalidation Bus Tests")
+    print("="*60)
+
+    try:
+        test_handle_payload()
+        test_malformed_payloads_ignored()
+        test_batches_stay_under_notify_limit()
+        test_reconnect_resets_caches()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
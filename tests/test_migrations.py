@@ -0,0 +1,192 @@
+"""
+Unit tests for the versioned schema migration runner
+
+Run with: python tests/test_migrations.py
+"""
+import sys
+from types import SimpleNamespace
+sys.path.insert(0, '.')
+
+from connector_platform.migrations import MIGRATIONS, Migration, run_migrations
+
+
+class _FakeConnection:
+    """Records SQL and answers the runner's version and pg_index queries"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def execution_options(self, **options):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        params = params or {}
+        self.engine.executed.append(sql)
+
+        if sql in self.engine.fail_on:
+            raise RuntimeError(f"failed: {sql}")
+
+        value = None
+        if sql.startswith("SELECT COALESCE(MAX(version), 0)"):
+            value = max(self.engine.recorded, default=0)
+        elif sql.startswith("SELECT i.indisvalid"):
+            value = self.engine.index_validity.get(params["name"])
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            self.engine.recorded.append(params["version"])
+
+        return SimpleNamespace(scalar=lambda: value)
+
+
+class _FakeEngine:
+    def __init__(self, recorded=(), index_validity=None, fail_on=()):
+        self.dialect = SimpleNamespace(name="postgresql")
+        self.recorded = list(recorded)
+        self.index_validity = index_validity or {}
+        self.fail_on = set(fail_on)
+        self.executed = []
+
+    def connect(self):
+        return _FakeConnection(self)
+
+
+def _statements(engine):
+    """Executed SQL without the runner's bookkeeping"""
+    bookkeeping = ("SELECT pg_advisory", "CREATE TABLE IF NOT EXISTS schema_migrations", "SELECT COALESCE",
+                   "SELECT i.indisvalid", "INSERT INTO schema_migrations", "BEGIN", "COMMIT", "ROLLBACK")
+    return [sql for sql in engine.executed if not sql.startswith(bookkeeping)]
+
+
+def test_applies_pending_in_order():
+    """Test that pending migrations run in version order and each one is recorded"""
+    print("Testing migration order...")
+
+    migrations = [
+        Migration(3, "third", ["SELECT 3"], transactional=False),
+        Migration(1, "first", ["SELECT 1"]),
+        Migration(2, "second", ["SELECT 2a", "SELECT 2b"]),
+    ]
+
+    engine = _FakeEngine()
+    assert run_migrations(engine, migrations) == 3
+    assert _statements(engine) == ["SELECT 1", "SELECT 2a", "SELECT 2b", "SELECT 3"]
+    assert engine.recorded == [1, 2, 3]
+
+    # The lock is taken before the bookkeeping table is touched, and released last
+    assert engine.executed[0] == "SELECT pg_advisory_lock(:id)"
+    assert engine.executed[1].startswith("CREATE TABLE IF NOT EXISTS schema_migrations")
+    assert engine.executed[-1] == "SELECT pg_advisory_unlock(:id)"
+
+    engine.executed.clear()
+    assert run_migrations(engine, migrations) == 0
+    assert _statements(engine) == []
+
+    print("✓ Migrations applied in order")
+
+
+def test_skips_applied_and_stops_on_failure():
+    """Test that recorded versions are skipped and a failed migration is not recorded"""
+    print("\nTesting applied versions...")
+
+    migrations = [
+        Migration(1, "first", ["SELECT 1"]),
+        Migration(2, "second", ["SELECT 2"]),
+        Migration(3, "third", ["SELECT 3"]),
+    ]
+
+    engine = _FakeEngine(recorded=[1], fail_on={"SELECT 3"})
+    try:
+        run_migrations(engine, migrations)
+        assert False, "expected the failing migration to raise"
+    except RuntimeError:
+        pass
+
+    assert engine.recorded == [1, 2]
+    assert "ROLLBACK" in engine.executed
+    assert engine.executed[-1] == "SELECT pg_advisory_unlock(:id)", "the lock is released on failure"
+
+    print("✓ Applied versions skipped")
+
+
+def test_rebuilds_invalid_concurrent_index():
+    """Test that an INVALID index from an interrupted concurrent build is dropped and rebuilt"""
+    print("\nTesting invalid index rebuild...")
+
+    create = "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_example ON example (key)"
+    migrations = [Migration(1, "index", [create], transactional=False)]
+
+    engine = _FakeEngine(index_validity={"ux_example": False})
+    run_migrations(engine, migrations)
+    assert _statements(engine) == ["DROP INDEX CONCURRENTLY IF EXISTS ux_example", create]
+
+    engine = _FakeEngine(index_validity={"ux_example": True})
+    run_migrations(engine, migrations)
+    assert _statements(engine) == [create], "a valid index is left alone"
+
+    print("✓ Invalid index rebuilt")
+
+
+def test_migration_list_consistent():
+    """Test that versions are unique and increasing and no migration builds an index a later one drops"""
+    print("\nTesting migration list...")
+
+    versions = [migration.version for migration in MIGRATIONS]
+    assert versions == sorted(set(versions))
+
+    created = {}
+    for migration in MIGRATIONS:
+        for statement in migration.statements:
+            words = " ".join(statement.split()).split(" ")
+            if statement.lstrip().startswith("CREATE") and "INDEX" in words:
+                created[words[words.index("ON") - 1]] = migration.version
+            if statement.lstrip().startswith("DROP INDEX"):
+                name = words[-1]
+                assert name not in created, f"index {name} is created by {created[name]} and dropped by {migration.version}"
+
+    print("✓ Migration list consistent")
+
+
+def test_skipped_without_postgres():
+    """Test that the runner does nothing on other databases"""
+    print("\nTesting non-Postgres engines...")
+
+    engine = _FakeEngine()
+    engine.dialect.name = "sqlite"
+    assert run_migrations(engine, MIGRATIONS) == 0
+    assert engine.executed == []
+
+    print("✓ Skipped on SQLite")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Migration Tests")
+    print("="*60)
+
+    try:
+        test_applies_pending_in_order()
+        test_skips_applied_and_stops_on_failure()
+        test_rebuilds_invalid_concurrent_index()
+        test_migration_list_consistent()
+        test_skipped_without_postgres()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,129 @@
+"""
+Unit tests for compiled request parameter validators
+
+Run with: python tests/test_param_validation.py
+"""
+import sys
+import json
+sys.path.insert(0, '.')
+
+from connector_platform.core.compiled_registry import compile_connector
+from connector_platform.core.param_validation import ParameterValidator, ParameterError
+
+PARAMETERS = [
+    {"name": "folderId", "type": "str", "required": True, "location": "path"},
+    {"name": "limit", "type": "int", "required": False, "location": "query", "default": 100},
+    {"name": "recursive", "type": "bool", "required": False, "location": "query"},
+    {"name": "tags", "type": "list", "required": False, "location": "body"},
+    {"name": "X-Trace", "type": "str", "required": True, "location": "header"},
+]
+
+
+def test_coerces_and_fills_defaults():
+    """Test that values are coerced and YAML defaults filled in"""
+    print("Testing parameter coercion...")
+
+    validator = ParameterValidator(PARAMETERS)
+    params, path_params, body = validator.validate(
+        {"recursive": "true", "extra": "kept"},
+        {"folderId": 42},
+        None
+    )
+
+    assert params == {"limit": 100, "recursive": True, "extra": "kept"}
+    assert path_params == {"folderId": "42"}
+    assert body is None
+
+    params, _, _ = validator.validate({"limit": "25"}, {"folderId": "root"})
+    assert params["limit"] == 25
+
+    print("✓ Coercion correct")
+
+
+def test_rejects_invalid_calls():
+    """Test that every missing or mistyped parameter is reported"""
+    print("\nTesting parameter rejection...")
+
+    validator = ParameterValidator(PARAMETERS)
+
+    try:
+        validator.validate({"limit": "many", "recursive": "maybe"}, {}, {"tags": "a,b"})
+        assert False, "expected ParameterError"
+    except ParameterError as e:
+        failed = {(error["location"], error["name"]) for error in e.errors}
+        assert failed == {
+            ("query", "limit"),
+            ("query", "recursive"),
+            ("path", "folderId"),
+            ("body", "tags"),
+        }
+
+    print("✓ Invalid calls rejected")
+
+
+def test_frozen_container_defaults():
+    """Test that object and list defaults from a compiled (frozen) config validate and serialize"""
+    print("\nTesting frozen container defaults...")
+
+    spec = compile_connector({
+        "name": "search",
+        "display_name": "Search",
+        "base_url": "https://api.example.com",
+        "auth": {
+            "type": "oauth2",
+            "auth_url": "https://auth.example.com/authorize",
+            "token_url": "https://auth.example.com/token"
+        },
+        "endpoints": [{
+            "name": "search",
+            "display_name": "Search",
+            "method": "POST",
+            "path": "/search",
+            "parameters": [
+                {"name": "options", "type": "dict", "location": "body",
+                 "default": {"max_results": 100, "filters": {"kinds": ["file"]}}},
+                {"name": "fields", "type": "list", "location": "body", "default": ["id", {"name": "path"}]},
+            ]
+        }]
+    })
+    validator = spec.endpoints["search"].validator
+
+    _, _, body = validator.validate(None, None, {})
+    assert body == {
+        "options": {"max_results": 100, "filters": {"kinds": ["file"]}},
+        "fields": ["id", {"name": "path"}]
+    }
+    assert type(body["options"]) is dict and type(body["options"]["filters"]["kinds"]) is list
+    json.dumps(body)
+
+    body["options"]["filters"]["kinds"].append("folder")
+    _, _, again = validator.validate(None, None, {})
+    assert again["options"]["filters"]["kinds"] == ["file"], "defaults must not be shared between calls"
+
+    print("✓ Container defaults thawed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Parameter Validation Tests")
+    print("="*60)
+
+    try:
+        test_coerces_and_fills_defaults()
+        test_rejects_invalid_calls()
+        test_frozen_container_defaults()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
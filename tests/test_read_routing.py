@@ -0,0 +1,120 @@
+"""
+Unit tests for read-replica session routing
+
+Run with: python tests/test_read_routing.py
+"""
+import sys
+import os
+import tempfile
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection, ConnectionUsage, OAuthToken
+from connector_platform.core.cache import TTLCache
+from connector_platform.core.connection_manager import ConnectionManager
+from connector_platform.core.invalidation import InvalidationBus
+from connector_platform.core.read_routing import ReadRouter
+
+
+def test_routes_to_replica_unless_recently_written():
+    """Test that recently written keys stay on the primary"""
+    print("Testing ReadRouter routing...")
+
+    router = ReadRouter(lambda: "primary", lambda: "replica", read_your_writes_seconds=60)
+
+    assert router.session_for("connection:1") == "replica"
+
+    router.mark_written("connection:1")
+    assert router.session_for("connection:1") == "primary"
+    assert router.session_for("connection:2") == "replica"
+
+    stats = router.stats()
+    assert stats["replica"] == 2
+    assert stats["primary_recent_write"] == 1
+
+    print("✓ Routing correct")
+
+
+def test_without_replica():
+    """Test that everything goes to the primary when no replica is configured"""
+    print("\nTesting ReadRouter without replica...")
+
+    router = ReadRouter(lambda: "primary")
+    assert router.session_for("user:1") == "primary"
+    assert router.stats()["replica_configured"] is False
+
+    print("✓ Primary-only routing correct")
+
+
+def test_user_listing_pinned_after_delete_and_status_change():
+    """Test that deletes and status changes pin the owner's connection list to the primary"""
+    print("\nTesting read-your-writes after delete and status change...")
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine, tables=[Connection.__table__, OAuthToken.__table__, ConnectionUsage.__table__])
+        Session = sessionmaker(bind=engine)
+
+        bus = InvalidationBus()
+        router = ReadRouter(lambda: "primary", lambda: "replica", read_your_writes_seconds=60)
+        bus.watch("user", lambda key: router.mark_written(f"user:{key}"))
+
+        def manager(db):
+            return ConnectionManager(db, token_cache=TTLCache(), connection_cache=TTLCache(), bus=bus)
+
+        ids = [f"connection-{index}" for index in range(4)]
+        with Session() as db:
+            db.add_all([
+                Connection(id=ids[index], connector_type="gmail", name="c", user_id=f"user-{index}")
+                for index in range(4)
+            ])
+            db.commit()
+
+        with Session() as db:
+            assert manager(db).delete_connection(ids[0])
+            assert manager(db).bulk_delete_connections([ids[1]]) == [ids[1]]
+            assert manager(db).bulk_update_status([ids[2]], "disabled") == [ids[2]]
+            assert manager(db).update_connection(ids[3], status="error").status == "error"
+
+        for index in range(4):
+            assert router.session_for(f"user:user-{index}") == "primary", f"user-{index} read from replica"
+        assert router.session_for("user:other") == "replica"
+
+        with Session() as db:
+            assert manager(db).list_connections("user-0") == []
+            assert manager(db).list_connections("user-2")[0].status == "disabled"
+
+        print("✓ Owner listings stay on the primary")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Read Routing Tests")
+    print("="*60)
+
+    try:
+        test_routes_to_replica_unless_recently_written()
+        test_without_replica()
+        test_user_listing_pinned_after_delete_and_status_change()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,243 @@
+"""
+Unit tests for syncing the connector registry from connector_metadata
+
+Run with: python tests/test_registry_store.py
+"""
+import sys
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, ConnectorMetadata
+from connector_platform.core import registry_store
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.invalidation import InvalidationBus
+from connector_platform.core.registry_store import ConnectorMetadataSync, publish_connectors
+
+
+def _published_row(spec, revision, enabled=True):
+    return ConnectorMetadata(
+        id=spec.name,
+        name=spec.name,
+        display_name=spec.display_name,
+        auth_type=spec.auth_type,
+        config_schema=json.loads(spec.config_json),
+        enabled=enabled,
+        revision=revision
+    )
+
+
+def _database():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[ConnectorMetadata.__table__])
+    return engine, sessionmaker(bind=engine), path
+
+
+def _published(Session):
+    with Session() as db:
+        return {row.name: (row.enabled, row.revision) for row in db.query(ConnectorMetadata).all()}
+
+
+def test_sync_applies_only_new_revisions():
+    """Test that workers load published connectors and then only newer revisions"""
+    print("Testing connector metadata sync...")
+
+    source = ConnectorRegistry()
+    source.load_connector_configs()
+    gmail = source.get_connector_spec("gmail")
+    dropbox = source.get_connector_spec("dropbox")
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine, tables=[ConnectorMetadata.__table__])
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            db.add_all([_published_row(gmail, 1), _published_row(dropbox, 2)])
+            db.commit()
+
+        registry = ConnectorRegistry()
+        sync = ConnectorMetadataSync(registry, Session)
+
+        assert sync.sync() == 2
+        assert sync.revision == 2
+        assert registry.get_endpoint_spec("gmail", "list_messages") is not None
+        assert sync.sync() == 0
+
+        unchanged = registry.get_connector_spec("gmail")
+
+        with Session() as db:
+            row = db.get(ConnectorMetadata, "dropbox")
+            row.enabled = False
+            row.revision = 3
+            db.commit()
+
+        assert sync.sync() == 1
+        assert registry.get_connector("dropbox") is None
+        assert registry.get_connector_spec("gmail") is unchanged
+
+        print("✓ Sync correct")
+    finally:
+        engine.dispose()
+        os.unlink(path)
+
+
+def test_publish_bumps_changed_rows_only():
+    """Test publishing on SQLite: unchanged configs keep their revision, removed ones are disabled"""
+    print("\nTesting connector publish...")
+
+    source = ConnectorRegistry()
+    source.load_connector_configs()
+    gmail = source.get_connector_spec("gmail")
+    dropbox = source.get_connector_spec("dropbox")
+
+    bus = InvalidationBus()
+    notified = []
+    bus.watch("connector", notified.append)
+
+    engine, Session, path = _database()
+    try:
+        with Session() as db:
+            assert sorted(publish_connectors(db, [gmail, dropbox], bus=bus)) == ["dropbox", "gmail"]
+        first = _published(Session)
+        assert sorted(revision for _, revision in first.values()) == [1, 2]
+        assert sorted(notified) == ["dropbox", "gmail"]
+
+        notified.clear()
+        with Session() as db:
+            assert publish_connectors(db, [gmail, dropbox], bus=bus) == []
+        assert _published(Session) == first
+        assert notified == []
+
+        with Session() as db:
+            assert publish_connectors(db, [gmail], bus=bus) == ["dropbox"]
+        assert _published(Session) == {"gmail": first["gmail"], "dropbox": (False, 3)}
+
+        with Session() as db:
+            assert publish_connectors(db, [gmail, dropbox], bus=bus) == ["dropbox"]
+        assert _published(Session)["dropbox"] == (True, 4)
+
+        registry = ConnectorRegistry()
+        sync = ConnectorMetadataSync(registry, Session)
+        assert sync.sync() == 2
+        assert registry.get_connector_spec("dropbox").config_json == dropbox.config_json
+
+        print("✓ Publish correct")
+    finally:
+        engine.dispose()
+        os.unlink(path)
+
+
+def test_publish_postgres_statements():
+    """Test that Postgres publishes take the advisory lock and upsert with sequence revisions"""
+    print("\nTesting Postgres connector publish...")
+
+    source = ConnectorRegistry()
+    source.load_connector_configs()
+
+    class _PostgresSession:
+        def __init__(self):
+            self.statements = []
+
+        def get_bind(self):
+            return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+        def execute(self, statement, params=None, execution_options=None):
+            self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(scalars=lambda: [])
+
+        def commit(self):
+            pass
+
+    db = _PostgresSession()
+    assert publish_connectors(db, [source.get_connector_spec("gmail")], bus=InvalidationBus()) == []
+
+    lock, upsert, prune = db.statements
+    assert "pg_advisory_xact_lock" in lock
+    assert "ON CONFLICT (name) DO UPDATE" in upsert
+    assert "nextval" in upsert and "nextval" in prune
+
+    print("✓ Postgres statements correct")
+
+
+def test_failed_compile_is_retried():
+    """Test that a row that fails to compile is retried without reapplying the rest"""
+    print("\nTesting failed connector compile...")
+
+    source = ConnectorRegistry()
+    source.load_connector_configs()
+    gmail = source.get_connector_spec("gmail")
+    dropbox = source.get_connector_spec("dropbox")
+
+    engine, Session, path = _database()
+    try:
+        with Session() as db:
+            db.add_all([_published_row(gmail, 1), _published_row(dropbox, 2)])
+            db.commit()
+
+        registry = ConnectorRegistry()
+        sync = ConnectorMetadataSync(registry, Session)
+        compile_connector = registry_store.compile_connector
+
+        def fail_gmail(config):
+            if config["name"] == "gmail":
+                raise ValueError("unsupported transform")
+            return compile_connector(config)
+
+        with mock.patch.object(registry_store, "compile_connector", side_effect=fail_gmail):
+            assert sync.sync() == 1
+            assert sync.sync() == 0
+        assert registry.get_connector("gmail") is None
+        assert sync.stats()["failed_connectors"] == ["gmail"]
+        assert sync.failures == 1, "a retried failure is counted once"
+
+        unchanged = registry.get_connector_spec("dropbox")
+        assert sync.sync() == 1
+        assert registry.get_connector_spec("gmail") is not None
+        assert registry.get_connector_spec("dropbox") is unchanged
+        assert sync.stats()["failed_connectors"] == []
+        assert sync.revision == 2
+        assert sync.sync() == 0
+
+        print("✓ Failed compile retried")
+    finally:
+        engine.dispose()
+        os.unlink(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Registry Store Tests")
+    print("="*60)
+
+    try:
+        test_sync_applies_only_new_revisions()
+        test_publish_bumps_changed_rows_only()
+        test_publish_postgres_statements()
+        test_failed_compile_is_retried()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,243 @@
+"""
+Unit tests for item-at-a-time parsing and streamed proxy responses
+
+Run with: python tests/test_streaming.py
+"""
+import sys
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+sys.path.insert(0, '.')
+
+from connector_platform.core.api_proxy import APIProxy
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.kafka_publisher import MockKafkaPublisher
+from connector_platform.core.streaming import JsonItemStream
+
+
+def onedrive_page(count):
+    return {
+        "@odata.context": "https://graph.microsoft.com/v1.0/$metadata",
+        "value": [
+            {
+                "id": f"item-{index}",
+                "name": f"file-{index}.txt",
+                "size": 10 ** 12 + index,
+                "lastModifiedDateTime": "2025-01-15T10:30:00Z",
+                "file": {"mimeType": "text/plain"},
+                "parentReference": {"id": "root", "path": "/drive/root:/Exports/é"}
+            }
+            for index in range(count)
+        ],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/next"
+    }
+
+
+def test_json_item_stream():
+    """Test that items and the rest of the document survive any chunking"""
+    print("Testing JsonItemStream...")
+
+    page = onedrive_page(50)
+    body = json.dumps(page, ensure_ascii=False, indent=2).encode("utf-8")
+
+    for chunk_size in (1, 7, 4096):
+        stream = JsonItemStream(io.BytesIO(body), ["value"], chunk_size)
+        assert list(stream) == page["value"], f"items differ with chunk size {chunk_size}"
+        assert stream.count == 50
+        assert stream.remainder["@odata.nextLink"] == page["@odata.nextLink"]
+        assert len(stream.remainder["value"]) == 50
+
+    nested = JsonItemStream(io.BytesIO(b'{"result": {"entries": [1, 2]}, "cursor": "c"}'), ["result", "entries"], 3)
+    assert list(nested) == [1, 2]
+    assert nested.remainder["cursor"] == "c"
+
+    try:
+        list(JsonItemStream(io.BytesIO(b'{"value": [1, 2'), ["value"]))
+        assert False, "Truncated body should raise"
+    except ValueError:
+        pass
+
+    print("✓ JsonItemStream correct")
+    return True
+
+
+def test_streaming_transform_matches_transform():
+    """Test that streamed records and summary equal the whole-page transform"""
+    print("\nTesting streaming transform...")
+
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    endpoint = registry.get_endpoint_spec("onedrive", "list_files")
+
+    page = onedrive_page(20)
+    stream = JsonItemStream(io.BytesIO(json.dumps(page).encode("utf-8")), endpoint.stream.items_path)
+    records = list(endpoint.stream.records(stream))
+
+    expected = endpoint.transform(page)
+    assert records == expected["files"]
+    assert {"files": records, **endpoint.stream.summary(stream.remainder, stream.count)} == expected
+
+    assert registry.get_endpoint_spec("onedrive", "get_file").stream is None
+
+    print("✓ Streaming transform matches")
+    return True
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    body = b""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_proxy_stream_request():
+    """Test that the proxy streams records and publishes one message per record"""
+    print("\nTesting APIProxy.stream_request...")
+
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    endpoint = registry.get_endpoint_spec("onedrive", "list_files")
+
+    page = onedrive_page(30)
+    _PageHandler.body = json.dumps(page).encode("utf-8")
+    server = HTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    token = SimpleNamespace(token_type="Bearer", access_token="token", expires_at=None, refresh_token=None)
+    connection_manager = SimpleNamespace(get_oauth_token=lambda connection_id: token)
+    oauth_manager = SimpleNamespace(is_token_expired=lambda expires_at: False)
+    publisher = MockKafkaPublisher()
+
+    try:
+        proxy = APIProxy(None, oauth_manager, connection_manager, kafka_publisher=publisher, token_refresher=object())
+        result = proxy.stream_request(
+            "connection-1",
+            {"name": "onedrive", "type": "cloud_storage", "base_url": f"http://127.0.0.1:{server.server_port}"},
+            dict(endpoint.config),
+            endpoint.stream
+        )
+
+        assert result["success"], result
+        events = list(result["records"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    expected = endpoint.transform(page)
+    assert [value for kind, value in events if kind == "record"] == expected["files"]
+
+    kind, summary = events[-1]
+    assert kind == "summary"
+    assert summary["next_cursor"] == expected["next_cursor"]
+    assert summary["published_to_kafka"] == 30
+    assert publisher.get_messages("connector-platform.cloud_storage") == [], "page topic must not carry records"
+    messages = publisher.get_messages("connector-platform.cloud_storage.records")
+    assert len(messages) == 30
+    assert {message["kind"] for message in messages} == {"record"}
+
+    print("✓ Streamed proxy request correct")
+    return True
+
+
+def test_mock_publisher_is_bounded():
+    """Test that the mock publisher used when Kafka is disabled keeps only recent messages"""
+    print("\nTesting bounded mock publisher...")
+
+    publisher = MockKafkaPublisher(max_messages=10)
+    for index in range(25):
+        publisher.publish_record("cloud_storage", {"id": index}, "connection-1", "onedrive", "list_files")
+
+    messages = publisher.get_messages()
+    assert len(messages) == 10
+    assert [message["data"]["id"] for message in messages] == list(range(15, 25))
+
+    publisher.clear()
+    assert publisher.get_messages() == []
+
+    print("✓ Mock publisher bounded")
+    return True
+
+
+def test_stream_closed_before_iteration():
+    """Test that closing an unread stream releases the upstream response and records the call"""
+    print("\nTesting stream closed before the first record...")
+
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    endpoint = registry.get_endpoint_spec("onedrive", "list_files")
+
+    _PageHandler.body = json.dumps(onedrive_page(5)).encode("utf-8")
+    server = HTTPServer(("127.0.0.1", 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    token = SimpleNamespace(token_type="Bearer", access_token="token", expires_at=None, refresh_token=None)
+    recorded = []
+    usage = SimpleNamespace(record=lambda connection_id, **counts: recorded.append((connection_id, counts)))
+
+    try:
+        proxy = APIProxy(
+            None,
+            SimpleNamespace(is_token_expired=lambda expires_at: False),
+            SimpleNamespace(get_oauth_token=lambda connection_id: token),
+            kafka_publisher=MockKafkaPublisher(),
+            token_refresher=object(),
+            usage_recorder=usage
+        )
+        result = proxy.stream_request(
+            "connection-1",
+            {"name": "onedrive", "type": "cloud_storage", "base_url": f"http://127.0.0.1:{server.server_port}"},
+            dict(endpoint.config),
+            endpoint.stream
+        )
+
+        records = result["records"]
+        records.close()
+        records.close()
+
+        assert records.response.raw.closed, "upstream response should be closed"
+        assert len(recorded) == 1 and recorded[0][1]["success"], recorded
+        assert list(records) == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("✓ Unread stream released")
+    return True
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Streaming Tests")
+    print("="*60)
+
+    try:
+        test_json_item_stream()
+        test_streaming_transform_matches_transform()
+        test_proxy_stream_request()
+        test_stream_closed_before_iteration()
+        test_mock_publisher_is_bounded()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
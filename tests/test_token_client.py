@@ -0,0 +1,192 @@
+"""
+Unit tests for the pooled OAuth token endpoint client
+
+Run with: python tests/test_token_client.py
+"""
+import sys
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote_plus
+sys.path.insert(0, '.')
+
+from connector_platform.core.token_client import TokenClientPool, TokenEndpointClient, TokenEndpointError
+
+RESPONSES = {
+    "/token": (200, {"access_token": "access", "token_type": "Bearer", "expires_in": 3600}),
+    "/other/token": (200, {"access_token": "other"}),
+    "/rejected": (400, {"error": "invalid_grant", "error_description": "Refresh token revoked"}),
+    "/error-200": (200, {"error": "temporarily_unavailable"}),
+    "/no-token": (200, {"token_type": "Bearer"}),
+}
+
+
+class _TokenEndpoint(BaseHTTPRequestHandler):
+    """Keep-alive token endpoint that records what each request carried"""
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("ascii"))
+        _TokenEndpoint.requests.append({
+            "path": self.path,
+            "authorization": self.headers.get("Authorization"),
+            "form": {key: values[0] for key, values in form.items()},
+            "client_port": self.client_address[1]
+        })
+
+        if self.path in RESPONSES:
+            status, payload = RESPONSES[self.path]
+            body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        else:
+            status, body, content_type = 502, b"<html>Bad Gateway</html>", "text/html"
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _server():
+    _TokenEndpoint.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TokenEndpoint)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def _basic_credentials(header):
+    scheme, encoded = header.split(" ", 1)
+    assert scheme == "Basic"
+    client_id, client_secret = base64.b64decode(encoded).decode("ascii").split(":", 1)
+    return client_id, client_secret
+
+
+def test_client_secret_basic_encoding():
+    """Test that credentials are form-urlencoded before Basic encoding (RFC 6749 section 2.3.1)"""
+    print("Testing client_secret_basic encoding...")
+
+    server, base_url = _server()
+    client = TokenEndpointClient(f"{base_url}/token")
+    try:
+        payload = client.request_token(
+            "client id:1", "p@ss:wörd +/%",
+            grant_type="refresh_token", refresh_token="refresh", scope=None
+        )
+        assert payload["access_token"] == "access"
+
+        request = _TokenEndpoint.requests[0]
+        client_id, client_secret = _basic_credentials(request["authorization"])
+        assert ":" not in client_id and " " not in client_secret
+        assert (unquote_plus(client_id), unquote_plus(client_secret)) == ("client id:1", "p@ss:wörd +/%")
+        assert request["form"] == {"grant_type": "refresh_token", "refresh_token": "refresh"}
+
+        client.request_token(None, None, grant_type="client_credentials")
+        assert _basic_credentials(_TokenEndpoint.requests[1]["authorization"]) == ("", "")
+
+        print("✓ Credentials encoded")
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_error_responses_and_stats():
+    """Test error payloads, a missing access_token, non-JSON errors and the counters"""
+    print("\nTesting token endpoint errors...")
+
+    server, base_url = _server()
+    pool = TokenClientPool()
+    try:
+        expected = {
+            "/rejected": ("invalid_grant", "Refresh token revoked", 400),
+            "/error-200": ("temporarily_unavailable", None, 200),
+            "/no-token": ("invalid_response", "Missing access_token", 200),
+            "/bad-gateway": ("http_502", None, 502),
+        }
+        for path, (error, description, status_code) in expected.items():
+            try:
+                pool.get(f"{base_url}{path}").request_token("client", "secret", grant_type="refresh_token")
+                assert False, f"{path} should raise"
+            except TokenEndpointError as e:
+                assert (e.error, e.description, e.status_code) == (error, description, status_code), path
+
+        ok = pool.get(f"{base_url}/token")
+        ok.request_token("client", "secret", grant_type="refresh_token")
+        ok.request_token("client", "secret", grant_type="refresh_token")
+
+        stats = pool.stats()
+        assert stats[f"{base_url}/rejected"]["requests"] == 1
+        assert stats[f"{base_url}/rejected"]["errors"] == 1
+        assert stats[f"{base_url}/token"]["requests"] == 2
+        assert stats[f"{base_url}/token"]["errors"] == 0
+        assert stats[f"{base_url}/token"]["avg_latency_ms"] > 0
+        assert TokenEndpointClient(f"{base_url}/unused").stats()["avg_latency_ms"] == 0.0
+
+        print("✓ Errors and stats correct")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_reuses_session_per_token_url():
+    """Test that one client, and one kept-alive connection, serves every request to a token URL"""
+    print("\nTesting pooled sessions...")
+
+    server, base_url = _server()
+    pool = TokenClientPool()
+    try:
+        token_url, other_url = f"{base_url}/token", f"{base_url}/other/token"
+        client = pool.get(token_url)
+        assert pool.get(token_url) is client
+        assert pool.get(other_url) is not client
+
+        for _ in range(3):
+            pool.get(token_url).request_token("client", "secret", grant_type="refresh_token")
+        pool.get(other_url).request_token("client", "secret", grant_type="refresh_token")
+
+        ports = [request["client_port"] for request in _TokenEndpoint.requests]
+        assert len(set(ports[:3])) == 1, "requests to one token URL should reuse a pooled connection"
+        assert ports[3] != ports[0], "each token URL has its own session"
+
+        pool.close()
+        assert pool.stats() == {}
+        assert pool.get(token_url) is not client
+
+        print("✓ Sessions reused per token URL")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Token Client Tests")
+    print("="*60)
+
+    try:
+        test_client_secret_basic_encoding()
+        test_error_responses_and_stats()
+        test_pool_reuses_session_per_token_url()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,247 @@
+"""
+Unit tests for single-flight token refresh
+
+Run with: python tests/test_token_refresh.py
+"""
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, '.')
+
+from connector_platform.core.connection_manager import CachedToken
+from connector_platform.core.oauth_manager import OAuthManager
+from connector_platform.core.token_refresh import SingleFlight, TokenRefresher
+
+CALLERS = 16
+
+
+def _token(access_token, expires_in=3600):
+    return CachedToken(
+        connection_id="connection-1",
+        access_token=access_token,
+        refresh_token="refresh-1",
+        token_type="Bearer",
+        expires_at=datetime.utcnow() + timedelta(seconds=expires_in),
+        scope=None
+    )
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for concurrent callers")
+        time.sleep(0.001)
+
+
+def _call_concurrently(fn):
+    """Call fn from CALLERS threads at once; returns (results, errors)"""
+    results, errors = [], []
+    barrier = threading.Barrier(CALLERS)
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    return results, errors
+
+
+class _FakeOAuthManager:
+    is_token_expired = OAuthManager.is_token_expired
+
+    def __init__(self, release=None):
+        self.release = release
+        self.refreshes = 0
+
+    def refresh_access_token(self, connector_config, refresh_token):
+        self.refreshes += 1
+        if self.release is not None:
+            self.release.wait(5)
+        return {"access_token": f"access-{self.refreshes + 1}", "expires_in": 3600}
+
+
+class _FakeDB:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class _FakeConnectionManager:
+    """Holds one stored token; lock_connection is a no-op"""
+
+    def __init__(self, token):
+        self.db = _FakeDB()
+        self.token = token
+        self.stored = []
+
+    def lock_connection(self, connection_id):
+        pass
+
+    def get_oauth_token(self, connection_id, use_cache=True):
+        return self.token
+
+    def store_oauth_token(self, connection_id, token_data):
+        self.stored.append(token_data)
+        self.token = CachedToken(
+            connection_id=connection_id,
+            access_token=token_data["access_token"],
+            refresh_token=token_data.get("refresh_token"),
+            token_type="Bearer",
+            expires_at=OAuthManager.calculate_expiry(token_data["expires_in"]),
+            scope=None
+        )
+        return self.token
+
+
+def test_single_flight_collapses_concurrent_calls():
+    """Test that concurrent callers for one key share a single execution and its result"""
+    print("Testing SingleFlight with concurrent callers...")
+
+    flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def slow():
+        executions.append(threading.get_ident())
+        release.wait(5)
+        return object()
+
+    def release_when_all_waiting():
+        _wait_until(lambda: flight.stats()["shared"] == CALLERS - 1)
+        release.set()
+
+    threading.Thread(target=release_when_all_waiting, daemon=True).start()
+    results, errors = _call_concurrently(lambda: flight.do("connection-1", slow))
+
+    assert not errors
+    assert len(executions) == 1
+    assert len(results) == CALLERS
+    assert all(result is results[0] for result in results), "waiters should share the leader's result"
+    assert flight.stats() == {"in_flight": 0, "executions": 1, "shared": CALLERS - 1}
+
+    print("✓ One execution for all callers")
+
+
+def test_single_flight_shares_errors():
+    """Test that waiters see the leader's exception and the next call runs again"""
+    print("\nTesting SingleFlight error propagation...")
+
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("refresh rejected")
+
+    def release_when_all_waiting():
+        _wait_until(lambda: flight.stats()["shared"] == CALLERS - 1)
+        release.set()
+
+    threading.Thread(target=release_when_all_waiting, daemon=True).start()
+    results, errors = _call_concurrently(lambda: flight.do("connection-1", failing))
+
+    assert not results
+    assert len(errors) == CALLERS and all(isinstance(e, ValueError) for e in errors)
+    assert flight.do("connection-1", lambda: "retried") == "retried"
+    assert flight.stats()["executions"] == 2
+
+    print("✓ Errors shared, key released")
+
+
+def test_concurrent_refresh_calls_provider_once():
+    """Test that N threads refreshing one connection make a single token endpoint call"""
+    print("\nTesting concurrent TokenRefresher.refresh...")
+
+    release = threading.Event()
+    oauth_manager = _FakeOAuthManager(release)
+    connection_manager = _FakeConnectionManager(_token("access-1", expires_in=-60))
+    flight = SingleFlight()
+    refresher = TokenRefresher(oauth_manager, connection_manager, single_flight=flight)
+
+    def release_when_all_waiting():
+        _wait_until(lambda: flight.stats()["shared"] == CALLERS - 1)
+        release.set()
+
+    threading.Thread(target=release_when_all_waiting, daemon=True).start()
+    results, errors = _call_concurrently(lambda: refresher.refresh("connection-1", {}))
+
+    assert not errors
+    assert oauth_manager.refreshes == 1
+    assert {token.access_token for token in results} == {"access-2"}
+    assert connection_manager.stored[0]["refresh_token"] == "refresh-1", "the old refresh token is kept"
+
+    print("✓ One provider refresh")
+
+
+def test_stale_token_short_circuit():
+    """Test that a token already refreshed by another worker is reused instead of refreshed again"""
+    print("\nTesting stale-token short-circuit...")
+
+    stale = _token("access-1")
+
+    # Another worker already stored a new, valid token: reuse it
+    oauth_manager = _FakeOAuthManager()
+    connection_manager = _FakeConnectionManager(_token("access-from-other-worker"))
+    refresher = TokenRefresher(oauth_manager, connection_manager, single_flight=SingleFlight())
+    token = refresher.refresh("connection-1", {}, stale_token=stale)
+    assert token.access_token == "access-from-other-worker"
+    assert oauth_manager.refreshes == 0
+    assert connection_manager.db.commits == 1, "the row lock should be released"
+
+    # The stored token is the one the caller found unusable: refresh it
+    connection_manager = _FakeConnectionManager(stale)
+    refresher = TokenRefresher(oauth_manager, connection_manager, single_flight=SingleFlight())
+    assert refresher.refresh("connection-1", {}, stale_token=stale).access_token == "access-2"
+    assert oauth_manager.refreshes == 1
+
+    # Valid, but not for long enough: refresh it
+    oauth_manager = _FakeOAuthManager()
+    connection_manager = _FakeConnectionManager(_token("access-1", expires_in=30))
+    refresher = TokenRefresher(oauth_manager, connection_manager, single_flight=SingleFlight())
+    refresher.refresh("connection-1", {}, min_valid_seconds=300)
+    assert oauth_manager.refreshes == 1
+
+    print("✓ Short-circuit correct")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Token Refresh Tests")
+    print("="*60)
+
+    try:
+        test_single_flight_collapses_concurrent_calls()
+        test_single_flight_shares_errors()
+        test_concurrent_refresh_calls_provider_once()
+        test_stale_token_short_circuit()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,125 @@
+"""
+Unit tests for proactive token refresh selection and back-off
+
+Run with: python tests/test_token_scheduler.py
+"""
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection, OAuthToken
+from connector_platform.core.token_scheduler import ProactiveTokenRefresher
+
+
+class _NoConnectors:
+    def get_connector(self, connector_type):
+        return None
+
+
+def _database(expiries):
+    """Create one gmail connection with a refreshable token per expiry offset (seconds from now)"""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Connection.__table__, OAuthToken.__table__])
+    Session = sessionmaker(bind=engine)
+
+    now = datetime.utcnow()
+    with Session() as db:
+        for name, offset in expiries.items():
+            db.add(Connection(id=name, connector_type="gmail", name=name, user_id="user-1"))
+            db.add(OAuthToken(
+                id=f"token-{name}",
+                connection_id=name,
+                access_token="access",
+                refresh_token="refresh",
+                expires_at=now + timedelta(seconds=offset)
+            ))
+        db.commit()
+
+    return engine, Session, path
+
+
+def _queued(scheduler):
+    return sorted(connection_id for _, connection_id, _ in scheduler._queue)
+
+
+def test_dead_tokens_do_not_starve_live_ones():
+    """Test that tokens expired beyond the grace period are not selected"""
+    print("Testing expiring token selection...")
+
+    expiries = {f"dead-{index}": -2 * 86400 for index in range(5)}
+    expiries.update({"live-1": 60, "live-2": 120, "later": 86400})
+    engine, Session, path = _database(expiries)
+    try:
+        scheduler = ProactiveTokenRefresher(Session, _NoConnectors(), batch_size=2, jitter_seconds=0)
+
+        assert scheduler.run_once() == 2
+        assert _queued(scheduler) == ["live-1", "live-2"]
+
+        print("✓ Live tokens selected ahead of dead ones")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_failed_refresh_backs_off():
+    """Test that a failed refresh is excluded from scans until its back-off ends"""
+    print("\nTesting refresh back-off...")
+
+    engine, Session, path = _database({"a": 30, "b": 60, "c": 90, "d": 120})
+    try:
+        scheduler = ProactiveTokenRefresher(Session, _NoConnectors(), batch_size=3, jitter_seconds=0)
+
+        assert scheduler.run_once() == 3
+        assert _queued(scheduler) == ["a", "b", "c"]
+
+        # The connector is unknown, so the refresh fails and "a" starts backing off
+        scheduler._refresh_one("a", "gmail")
+        stats = scheduler.stats()
+        assert stats["failed"] == 1
+        assert stats["backing_off"] == 1
+
+        # Queued and backing-off tokens are excluded, so the next scan reaches "d"
+        assert scheduler.run_once() == 1
+        assert "d" in _queued(scheduler)
+
+        scheduler._failed_until["a"] = time.monotonic() - 1
+        assert scheduler.run_once() == 1
+        assert scheduler.stats()["backing_off"] == 0
+
+        print("✓ Back-off correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Token Scheduler Tests")
+    print("="*60)
+
+    try:
+        test_dead_tokens_do_not_starve_live_ones()
+        test_failed_refresh_backs_off()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
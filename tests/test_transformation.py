@@ -4,11 +4,18 @@ Unit tests for data transformation and Kafka integration
 Run with: python tests/test_transformation.py
 """
 import sys
+import json
+import os
+import tempfile
 sys.path.insert(0, '.')
 
 from connector_platform.core.data_models import CloudStorageFile, CloudStorageFileList
 from connector_platform.core.transformers import CloudStorageTransformer, EmailTransformer, TransformerFactory
 from connector_platform.core.kafka_publisher import MockKafkaPublisher
+from connector_platform.core.connector_registry import ConnectorRegistry
+from connector_platform.core.transform_compiler import ColumnExtractor, compile_transform
+from connector_platform.core.columnar import ColumnarTransform, write_feather, write_parquet
+from connector_platform.core import timestamps
 from datetime import datetime
 
 def test_cloud_storage_transformer():
@@ -113,6 +120,247 @@ def test_transformer_factory():
     return True
 
 
+def test_data_model_serialization():
+    """Test slotted data models and their serializers"""
+    print("\nTesting data model serialization...")
+    
+    metadata = {"etag": "abc"}
+    file_obj = CloudStorageFile(
+        id="1",
+        name="report.pdf",
+        path="/report.pdf",
+        type="file",
+        created_at=datetime(2025, 1, 1, 12, 0),
+        metadata=metadata
+    )
+    
+    assert not hasattr(file_obj, "__dict__"), "Models should use __slots__"
+    
+    data = CloudStorageFileList(files=[file_obj], total_count=1).to_dict()
+    file_data = data["files"][0]
+    
+    assert file_data["created_at"] == "2025-01-01T12:00:00"
+    assert file_data["modified_at"] is None
+    assert file_data["metadata"] is metadata, "to_dict should not copy nested values"
+    assert list(file_data)[:4] == ["id", "name", "path", "type"]
+    
+    print("✓ Data model serialization correct")
+    return True
+
+
+def test_compiled_transforms():
+    """Test that YAML transform mappings reproduce the hand-written transformers"""
+    print("\nTesting compiled YAML transforms...")
+    
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    
+    onedrive_item = {
+        "id": "file-1",
+        "name": "test.pdf",
+        "size": 1024,
+        "createdDateTime": "2025-01-01T12:00:00Z",
+        "lastModifiedDateTime": "2025-01-15T10:30:00Z",
+        "file": {"mimeType": "application/pdf"},
+        "parentReference": {"id": "parent-id", "path": "/drive/root:/Documents"},
+        "createdBy": {"user": {"displayName": "Ada"}},
+        "@microsoft.graph.downloadUrl": "https://download/..."
+    }
+    dropbox_entry = {
+        ".tag": "folder",
+        "name": "Work",
+        "path_display": "/Work",
+        "path_lower": "/work",
+        "sharing_info": {"read_only": False}
+    }
+    gmail_message = {
+        "id": "msg-1",
+        "threadId": "thread-1",
+        "labelIds": ["INBOX", "UNREAD"],
+        "snippet": "Hello",
+        "payload": {"headers": [
+            {"name": "Subject", "value": "Hi"},
+            {"name": "From", "value": "a@example.com"},
+            {"name": "To", "value": "b@example.com"},
+            {"name": "Date", "value": "Mon, 13 Jan 2025 10:00:00 +0000"}
+        ]}
+    }
+    
+    cases = [
+        ("onedrive", "list_files", {"value": [onedrive_item, {"id": "f", "folder": {}}], "@odata.nextLink": "next"}),
+        ("onedrive", "get_file", onedrive_item),
+        ("dropbox", "list_folder", {"entries": [dropbox_entry], "has_more": True, "cursor": "c"}),
+        ("dropbox", "get_metadata", dropbox_entry),
+        ("gmail", "list_messages", {"messages": [{"id": "msg-1", "threadId": "t"}], "nextPageToken": "p"}),
+        ("gmail", "get_message", gmail_message),
+    ]
+    
+    for connector_name, endpoint_name, data in cases:
+        spec = registry.get_connector_spec(connector_name)
+        compiled = registry.get_endpoint_spec(connector_name, endpoint_name).transform
+        expected = TransformerFactory.get_transformer(spec.type).transform(data, endpoint_name, connector_name)
+        assert compiled(data) == expected, f"{connector_name}.{endpoint_name} differs"
+    
+    assert registry.get_endpoint_spec("gmail", "send_message").transform is None
+    
+    try:
+        compile_transform({"model": "cloud_storage_file", "fields": {"id": "id"}})
+        assert False, "Unmapped required fields should be rejected"
+    except ValueError:
+        pass
+    
+    print("✓ Compiled transforms match hand-written transformers")
+    return True
+
+
+def test_columnar_transform():
+    """Test column extraction and Arrow record batches for large listings"""
+    print("\nTesting columnar transform...")
+    
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    spec = registry.get_connector_spec("dropbox")
+    mapping = spec.config["transform"]["list_folder"]
+    
+    pages = [
+        {"entries": [
+            {".tag": "file", "name": f"f{index}", "path_display": f"/W/f{index}", "path_lower": f"/w/f{index}",
+             "id": f"id:{index}", "size": index, "client_modified": "2025-01-20T13:55:00Z", "rev": "r"}
+            for index in range(start, start + 3)
+        ]}
+        for start in (0, 3)
+    ]
+    
+    extractor = ColumnExtractor(mapping)
+    for page in pages:
+        assert extractor.extend(extractor.items(page)) == 3
+    columns = dict(zip(extractor.fields, extractor.take()))
+    
+    expected = [row for page in pages for row in registry.get_endpoint_spec("dropbox", "list_folder").transform(page)["files"]]
+    assert columns["id"] == [row["id"] for row in expected]
+    assert columns["parent_id"] == ["/w"] * 6
+    assert columns["modified_at"][0].isoformat() == expected[0]["modified_at"]
+    assert extractor.take()[0] == [], "take() should start new columns"
+    
+    # path_lower fails the parent_path conversion after earlier fields were computed
+    malformed = {"name": "broken", "path_lower": 12}
+    try:
+        extractor.extend([pages[0]["entries"][0], malformed])
+        assert False, "a malformed entry should raise"
+    except TypeError:
+        pass
+    assert {len(column) for column in extractor.take()} == {1}, "a failed item must not misalign columns"
+    
+    import pyarrow
+    import pyarrow.parquet
+    import pyarrow.feather
+    
+    transform = ColumnarTransform.for_endpoint(spec, "list_folder", batch_size=4)
+    batches = list(transform.record_batches(pages))
+    assert [batch.num_rows for batch in batches] == [4, 2]
+    
+    table = transform.table(pages)
+    assert table.column("name").to_pylist() == [row["name"] for row in expected]
+    assert str(table.schema.field("modified_at").type) == "timestamp[us, tz=UTC]"
+    assert json.loads(table.column("metadata")[0].as_py()) == expected[0]["metadata"]
+    
+    try:
+        list(transform.record_batches([pages[0], {"entries": [malformed]}]))
+        assert False, "a malformed page should raise"
+    except TypeError:
+        pass
+    assert transform.table(pages).num_rows == 6, "rows from a failed export must not leak into the next"
+    
+    with tempfile.TemporaryDirectory() as directory:
+        parquet_path = os.path.join(directory, "export.parquet")
+        feather_path = os.path.join(directory, "export.feather")
+        
+        assert write_parquet(transform, pages, parquet_path) == 6
+        assert write_feather(transform, pages, feather_path) == 6
+        
+        parquet_file = pyarrow.parquet.ParquetFile(parquet_path)
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read().equals(table)
+        assert pyarrow.feather.read_table(feather_path).equals(table)
+    
+    print("✓ Columnar transform correct")
+    return True
+
+
+def test_timestamp_parsing():
+    """Test the shared timestamp parsers against the standard library"""
+    print("\nTesting timestamp parsing...")
+    
+    from email.utils import parsedate_to_datetime
+    
+    assert timestamps.parse_iso("2025-01-15T10:30:00Z").isoformat() == "2025-01-15T10:30:00+00:00"
+    assert timestamps.iso_timestamp("2025-01-15T10:30:00Z") == "2025-01-15T10:30:00+00:00"
+    assert timestamps.parse_iso("not a date") is None
+    assert timestamps.parse_iso(None) is None
+    
+    for header in [
+        "Mon, 13 Jan 2025 10:00:00 +0000",
+        "Tue, 4 Feb 2025 23:59:59 -0800 (PST)",
+        "13 Jan 2025 10:00:00 +0530",
+        "Mon, 13 Jan 2025 10:00:00 GMT",
+        "Mon, 13 Jan 2025 10:00:00 -0000",
+    ]:
+        expected = parsedate_to_datetime(header)
+        parsed = timestamps.parse_rfc2822(header)
+        assert parsed == expected and parsed.isoformat() == expected.isoformat(), header
+    
+    assert timestamps.parse_rfc2822("garbage") is None
+    
+    for value in (1736762400, 1.5, ["2025-01-15"], {"date": "2025-01-15"}):
+        assert timestamps.parse_iso(value) is None, value
+        assert timestamps.iso_timestamp(value) is None, value
+        assert timestamps.parse_rfc2822(value) is None, value
+        assert timestamps.rfc2822_timestamp(value) is None, value
+    assert timestamps.epoch_ms_timestamp(["1736762400000"]) is None
+    assert timestamps.epoch_ms_timestamp(1736762400000) == "2025-01-13T10:00:00+00:00"
+    
+    registry = ConnectorRegistry()
+    registry.load_connector_configs()
+    page = {"value": [{"id": "1", "name": "a", "lastModifiedDateTime": 1736762400, "createdDateTime": ["x"]}]}
+    listing = registry.get_endpoint_spec("onedrive", "list_files").transform(page)
+    assert listing["files"][0]["modified_at"] is None
+    assert TransformerFactory.get_transformer("cloud_storage").transform(page, "list_files", "onedrive")["files"][0]["modified_at"] is None
+    assert timestamps.epoch_ms_timestamp("1736762400000") == "2025-01-13T10:00:00+00:00"
+    
+    timestamps.clear_caches()
+    timestamps.rfc2822_timestamp("Mon, 13 Jan 2025 10:00:00 +0000")
+    timestamps.rfc2822_timestamp("Mon, 13 Jan 2025 10:00:00 +0000")
+    assert timestamps.stats()["rfc2822_string"]["hits"] == 1
+    
+    raw = compile_transform({
+        "model": "cloud_storage_file",
+        "fields": {
+            "id": "id", "name": "name", "path": "name", "type": {"const": "file"},
+            "modified_at": {"path": "modified", "as": "datetime", "keep_raw": True}
+        }
+    })
+    assert raw({"id": "1", "name": "a", "modified": "2025-01-15T10:30:00Z"})["modified_at"] == "2025-01-15T10:30:00Z"
+
+    # Containers without a literal form (YAML dates, nan) are bound and copied per call
+    import math
+    import yaml
+    constants = yaml.safe_load("tags: [2025-01-15, 2025-01-15 10:30:00, .nan, -.inf]")["tags"]
+    tagged = compile_transform({
+        "model": "cloud_storage_file",
+        "fields": {
+            "id": "id", "name": "name", "path": "name", "type": {"const": "file"},
+            "metadata": {"const": {"tags": constants}}
+        }
+    })
+    first = tagged({"id": "1", "name": "a"})["metadata"]["tags"]
+    assert first[:2] == constants[:2] and math.isnan(first[2]) and first[3] == -math.inf
+    first.append("mutated")
+    assert len(tagged({"id": "2", "name": "b"})["metadata"]["tags"]) == 4, "constants are copied per call"
+    
+    print("✓ Timestamp parsing correct")
+    return True
+
+
 def test_kafka_publisher():
     """Test MockKafkaPublisher"""
     print("\nTesting MockKafkaPublisher...")
@@ -156,6 +404,10 @@ def run_all_tests():
         test_cloud_storage_transformer()
         test_dropbox_transformer()
         test_transformer_factory()
+        test_data_model_serialization()
+        test_compiled_transforms()
+        test_columnar_transform()
+        test_timestamp_parsing()
         test_kafka_publisher()
         
         print("\n" + "="*60)
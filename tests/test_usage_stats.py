@@ -0,0 +1,179 @@
+"""
+Unit tests for in-memory usage aggregation and batched flushes
+
+Run with: python tests/test_usage_stats.py
+"""
+import sys
+import os
+import tempfile
+from unittest import mock
+sys.path.insert(0, '.')
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from connector_platform.database import Base, Connection, ConnectionUsage
+from connector_platform.core import usage_stats
+from connector_platform.core.usage_stats import UsageAggregator, usage_upsert_statement
+
+
+def _database(connection_ids=("connection-1", "connection-2")):
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[Connection.__table__, ConnectionUsage.__table__])
+    Session = sessionmaker(bind=engine)
+
+    with Session() as db:
+        for connection_id in connection_ids:
+            db.add(Connection(id=connection_id, connector_type="gmail", name=connection_id, user_id="user-1"))
+        db.commit()
+
+    return engine, Session, path
+
+
+def _stored(Session):
+    with Session() as db:
+        return {
+            usage.connection_id: (usage.call_count, usage.error_count, usage.bytes_sent, usage.bytes_received)
+            for usage in db.query(ConnectionUsage).all()
+        }
+
+
+def test_record_and_pending_for():
+    """Test that record() accumulates per-connection counters visible through pending_for()"""
+    print("Testing usage record...")
+
+    aggregator = UsageAggregator(lambda: None)
+    aggregator.record("connection-1", True, bytes_sent=10, bytes_received=100)
+    aggregator.record("connection-1", False, bytes_sent=5)
+    aggregator.record("connection-2", True, bytes_received=7)
+
+    pending = aggregator.pending_for("connection-1")
+    assert (pending["call_count"], pending["error_count"]) == (2, 1)
+    assert (pending["bytes_sent"], pending["bytes_received"]) == (15, 100)
+    assert pending["last_used_at"] is not None
+    assert aggregator.pending_for("connection-2")["call_count"] == 1
+    assert aggregator.pending_for("unknown") is None
+    assert aggregator.stats()["pending_connections"] == 2
+
+    aggregator.discard(["connection-1", "unknown"])
+    assert aggregator.pending_for("connection-1") is None
+    assert aggregator.stats()["pending_connections"] == 1
+
+    print("✓ Record correct")
+
+
+def _check_flushes(Session):
+    aggregator = UsageAggregator(Session)
+    assert aggregator.flush() == 0
+
+    aggregator.record("connection-1", True, bytes_sent=10)
+    aggregator.record("connection-2", False)
+    assert aggregator.flush() == 2
+    assert aggregator.pending_for("connection-1") is None
+
+    aggregator.record("connection-1", True, bytes_received=5)
+    assert aggregator.flush() == 1
+    assert _stored(Session) == {"connection-1": (2, 0, 10, 5), "connection-2": (1, 1, 0, 0)}
+
+    # Counters for a connection deleted by another worker are not written back
+    with Session() as db:
+        db.query(Connection).filter(Connection.id == "connection-2").delete()
+        db.query(ConnectionUsage).filter(ConnectionUsage.connection_id == "connection-2").delete()
+        db.commit()
+    aggregator.record("connection-2", True)
+    assert aggregator.flush() == 0
+    assert "connection-2" not in _stored(Session)
+    assert aggregator.stats()["flush_failures"] == 0
+
+
+def test_flush_upserts_counters():
+    """Test that flushes add to the stored counters with ON CONFLICT on SQLite"""
+    print("\nTesting usage flush...")
+
+    engine, Session, path = _database()
+    try:
+        _check_flushes(Session)
+
+        sql = str(usage_upsert_statement([{"connection_id": "c", "call_count": 1}]).compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (connection_id) DO UPDATE" in sql
+        assert "greatest(" in sql
+
+        print("✓ Flush correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_flush_generic_fallback():
+    """Test the row-by-row merge used on dialects without ON CONFLICT"""
+    print("\nTesting usage flush fallback...")
+
+    engine, Session, path = _database()
+    try:
+        with mock.patch.dict(usage_stats.UPSERT_DIALECTS, clear=True):
+            _check_flushes(Session)
+        print("✓ Fallback correct")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def test_failed_flush_merges_back():
+    """Test that counters from a failed flush are merged with calls recorded meanwhile"""
+    print("\nTesting failed usage flush...")
+
+    engine, Session, path = _database()
+    try:
+        aggregator = UsageAggregator(Session)
+        aggregator.record("connection-1", True, bytes_sent=10)
+        aggregator.record("connection-1", False, bytes_sent=10)
+        first_used = aggregator.pending_for("connection-1")["last_used_at"]
+
+        with mock.patch.object(usage_stats, "usage_upsert_statement", side_effect=ConnectionError("lost connection")):
+            assert aggregator.flush() == 0
+
+        aggregator.record("connection-1", True, bytes_received=50)
+        pending = aggregator.pending_for("connection-1")
+        assert (pending["call_count"], pending["error_count"]) == (3, 1)
+        assert (pending["bytes_sent"], pending["bytes_received"]) == (20, 50)
+        assert pending["last_used_at"] >= first_used
+
+        assert aggregator.flush() == 1
+        assert _stored(Session) == {"connection-1": (3, 1, 20, 50)}
+        stats = aggregator.stats()
+        assert (stats["flushes"], stats["flush_failures"], stats["pending_connections"]) == (1, 1, 0)
+
+        print("✓ Failed flush merged back")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("="*60)
+    print("Running Usage Stats Tests")
+    print("="*60)
+
+    try:
+        test_record_and_pending_for()
+        test_flush_upserts_counters()
+        test_flush_generic_fallback()
+        test_failed_flush_merges_back()
+
+        print("\n" + "="*60)
+        print("✅ All tests passed!")
+        print("="*60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)